@@ -0,0 +1,156 @@
+"""
+Reports memory blocks allocated per encoded or decoded object, measured with tracemalloc, and compares them
+with limits recorded in `chili_allocations.json` for the running python version.
+
+    python benchmarks/chili_allocations.py           # report, exit with 1 when any limit is exceeded
+    python benchmarks/chili_allocations.py --update  # record current numbers as limits
+
+`retained` is number of blocks still allocated per object after the results are kept (the decoded or encoded
+data itself), `peak` is the largest memory in use while a single object is processed and its result dropped,
+which catches temporary lists, dicts and copies created on every call.
+"""
+import gc
+import json
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from chili import Decoder, Encoder, decodable, encodable
+
+LIMITS_FILE = Path(__file__).with_suffix(".json")
+TOLERANCE = 0.1
+ITEMS = 2_000
+
+
+@encodable
+@decodable
+@dataclass
+class Author:
+    first_name: str
+    last_name: str
+
+
+@encodable
+@decodable
+@dataclass
+class Tag:
+    name: str
+
+
+@encodable
+@decodable
+@dataclass
+class Book:
+    name: str
+    author: Author
+    tags: List[Tag]
+    ratings: Tuple[int, ...]
+    isbn: Optional[str] = None
+    notes: List[str] = field(default_factory=list)
+
+
+@encodable
+@decodable
+@dataclass
+class Magazine:
+    title: str
+    issue: int
+
+
+@decodable
+@dataclass
+class Shelf:
+    item: Union[Book, Magazine]
+
+
+books = [
+    Book(
+        name=f"Book {index}",
+        author=Author(first_name="J.R.R.", last_name="Tolkien"),
+        tags=[Tag(name="Fantasy"), Tag(name="Adventure")],
+        ratings=(5, 4, 5),
+    )
+    for index in range(ITEMS)
+]
+book_encoder = Encoder[Book]()
+book_decoder = Decoder[Book]()
+raw_books = [book_encoder.encode(book) for book in books]
+raw_shelves = [{"item": {"title": f"Magazine {index}", "issue": index}} for index in range(ITEMS)]
+shelf_decoder = Decoder[Shelf]()
+
+scenarios: Dict[str, Tuple[Callable[[Any], Any], List[Any]]] = {
+    "encode": (book_encoder.encode, books),
+    "decode": (book_decoder.decode, raw_books),
+    "decode_union": (shelf_decoder.decode, raw_shelves),
+}
+
+
+def retained_blocks(process: Callable[[Any], Any], items: List[Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    results = [process(item) for item in items]
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    blocks = sum(stat.count_diff for stat in snapshot_after.compare_to(snapshot_before, "filename"))
+    # exclude list holding the results
+    blocks -= 1 if results else 0
+
+    return blocks / len(items)
+
+
+def peak_bytes(process: Callable[[Any], Any], items: List[Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for item in items:
+        process(item)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak - baseline
+
+
+def measure() -> Dict[str, Dict[str, float]]:
+    result = {}
+    for name, (process, items) in scenarios.items():
+        process(items[0])  # build codecs before measuring
+        result[name] = {
+            "retained": round(retained_blocks(process, items), 2),
+            "peak": peak_bytes(process, items),
+        }
+
+    return result
+
+
+def main(update: bool = False) -> int:
+    version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    limits = json.loads(LIMITS_FILE.read_text()) if LIMITS_FILE.exists() else {}
+    current = measure()
+
+    if update:
+        limits[version] = current
+        LIMITS_FILE.write_text(json.dumps(limits, indent=2, sort_keys=True) + "\n")
+        print(f"limits for python {version} written to {LIMITS_FILE.name}")
+        return 0
+
+    failed = False
+    for name, numbers in current.items():
+        for metric, value in numbers.items():
+            limit = limits.get(version, {}).get(name, {}).get(metric)
+            status = "no limit"
+            if limit is not None:
+                exceeded = value > limit * (1 + TOLERANCE)
+                failed = failed or exceeded
+                status = f"limit {limit}, {'REGRESSION' if exceeded else 'ok'}"
+            unit = "blocks per object" if metric == "retained" else "bytes"
+            print(f"{name:<14} {metric:<9} {value:>10} {unit} ({status})")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(update="--update" in sys.argv[1:]))
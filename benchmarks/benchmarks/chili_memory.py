@@ -0,0 +1,36 @@
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import List, Optional
+
+from chili import Decoder
+
+
+@dataclass
+class Reading:
+    sensor: str
+    value: float
+    unit: str
+    note: Optional[str] = None
+
+
+raw_data = [{"sensor": "s-1", "value": float(index), "unit": "C", "note": None} for index in range(100_000)]
+
+
+def bytes_per_instance(decoder: Decoder) -> float:
+    gc.collect()
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    items: List[Reading] = [decoder.decode(item) for item in raw_data]
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, "filename"))
+    # exclude list holding the results, values are shared with raw data except for floats
+    allocated -= items.__sizeof__()
+
+    return allocated / len(items)
+
+
+print(f"regular: {bytes_per_instance(Decoder[Reading]()):.1f} bytes per instance")
+print(f"compact: {bytes_per_instance(Decoder[Reading](compact=True)):.1f} bytes per instance")
@@ -0,0 +1,173 @@
+"""
+Replays payloads captured in production with `chili.capture.Capture` against the installed chili version.
+
+    python benchmarks/replay.py captures.ndjson --path ./src --output replay.json
+    python -m chili.bench compare base.json replay.json
+
+Records are grouped by type; for every type decoding, JSON decoding and encoding of the captured payloads is timed
+(seconds per payload). The script depends only on `decode`, `encode` and `json_decode`, so the same captures can be
+replayed against older chili releases; results use the `chili.bench` format and can be compared with it.
+"""
+import argparse
+import ast
+import gc
+import importlib
+import inspect
+import json
+import platform
+import sys
+import typing
+from collections import defaultdict
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple
+
+from chili import decode, encode, json_decode
+
+_GENERIC_ALIASES = {
+    "builtins:list": typing.List,
+    "builtins:dict": typing.Dict,
+    "builtins:set": typing.Set,
+    "builtins:frozenset": typing.FrozenSet,
+    "builtins:tuple": typing.Tuple,
+    "builtins:type": typing.Type,
+    "collections:deque": typing.Deque,
+    "collections:OrderedDict": typing.OrderedDict,
+}
+_DECODE_KWARGS = {"force": True} if "force" in inspect.signature(decode).parameters else {}
+_ENCODE_KWARGS = {"force": True} if "force" in inspect.signature(encode).parameters else {}
+
+
+def _split_arguments(arguments: str) -> List[str]:
+    result, depth, start = [], 0, 0
+    for index, char in enumerate(arguments):
+        if char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            result.append(arguments[start:index].strip())
+            start = index + 1
+    result.append(arguments[start:].strip())
+
+    return result
+
+
+def resolve_type(name: str) -> Any:
+    """
+    Resolves type written by `chili.capture.type_name`, e.g. `builtins:list[app.models:Book]`.
+    """
+    if name == "None":
+        return type(None)
+    if "[" in name:
+        origin_name, arguments = name[: name.index("[")], name[name.index("[") + 1 : -1]
+        origin = _GENERIC_ALIASES.get(origin_name) or resolve_type(origin_name)
+        type_args = tuple(resolve_type(argument) for argument in _split_arguments(arguments))
+        return origin[type_args if len(type_args) > 1 else type_args[0]]
+    if ":" not in name:
+        return ast.literal_eval(name)  # arguments of typing.Literal
+
+    module_name, qualname = name.split(":", 1)
+    result: Any = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        result = getattr(result, attribute)
+
+    return result
+
+
+def load_captures(path: str) -> Dict[str, List[Any]]:
+    payloads: Dict[str, List[Any]] = defaultdict(list)
+    with open(path) as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                payloads[record["type"]].append(record["payload"])
+
+    return payloads
+
+
+def _time(func: Callable[[], Any], loops: int) -> float:
+    gc.disable()
+    try:
+        start = perf_counter()
+        for _ in range(loops):
+            func()
+        return perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def measure(func: Callable[[], Any], items: int, repeat: int, min_time: float) -> Tuple[int, List[float]]:
+    loops = 1
+    elapsed = _time(func, loops)
+    while elapsed < min_time:
+        loops = max(loops * 2, int(loops * min_time / elapsed) + 1) if elapsed else loops * 10
+        elapsed = _time(func, loops)
+
+    return loops, [_time(func, loops) / loops / items for _ in range(repeat)]
+
+
+def _chili_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("chili")
+    except Exception:
+        import chili
+
+        return getattr(chili, "__version__", "unknown")
+
+
+def replay(payloads: Dict[str, List[Any]], repeat: int, min_time: float) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for name, items in sorted(payloads.items()):
+        try:
+            a_type = resolve_type(name)
+            objects = [decode(item, a_type, **_DECODE_KWARGS) for item in items]
+        except Exception as error:
+            print(f"skipping {name}: {error!r}", file=sys.stderr)
+            continue
+        documents = [json.dumps(item) for item in items]
+
+        operations = {
+            "decode": lambda: [decode(item, a_type, **_DECODE_KWARGS) for item in items],
+            "json": lambda: [json_decode(document, a_type) for document in documents],
+            "encode": lambda: [encode(obj, a_type, **_ENCODE_KWARGS) for obj in objects],
+        }
+        for operation, func in operations.items():
+            loops, values = measure(func, len(items), repeat, min_time)
+            results[f"replay.{name}.{operation}"] = {"group": operation, "loops": loops, "values": values}
+            print(f"{name} {operation}: {sum(values) / len(values) * 1e6:.2f} us per payload", file=sys.stderr)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("captures", help="NDJSON file written by chili.capture.Capture")
+    parser.add_argument("--path", action="append", default=[], help="directory to import captured types from")
+    parser.add_argument("--output", "-o", help="file to store results in")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    arguments = parser.parse_args()
+
+    sys.path[:0] = arguments.path
+    results = {
+        "metadata": {
+            "chili": _chili_version(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created": datetime.now(timezone.utc).isoformat(),
+            "captures": arguments.captures,
+        },
+        "benchmarks": replay(load_captures(arguments.captures), arguments.repeat, arguments.min_time),
+    }
+
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
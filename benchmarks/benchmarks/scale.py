@@ -0,0 +1,146 @@
+"""
+Scale benchmark: decodes, encodes or JSON round trips growing numbers of synthetic records and reports throughput,
+peak resident memory and garbage collector pauses.
+
+    python benchmarks/scale.py --records 1e3 1e4 1e5 1e6 1e7 --depth 3 --union-fanout 3 --output scale.json
+
+Every (operation, records) pair runs in a fresh interpreter, so peak RSS is not inflated by earlier runs.
+Records are drawn from a pool of distinct payloads (`--pool`) generated before timing starts; `--retain` keeps
+all results alive, which measures memory held by decoded objects.
+"""
+import argparse
+import gc
+import json
+import resource
+import subprocess
+import sys
+from itertools import cycle, islice
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple
+
+from chili import decode, encode, json_decode
+from workload import Workload, WorkloadSpec
+
+OPERATIONS = ("decode", "encode", "json")
+
+
+class GcPauses:
+    def __init__(self) -> None:
+        self.pauses: List[float] = []
+        self._started = 0.0
+
+    def __call__(self, phase: str, info: Dict[str, Any]) -> None:
+        if phase == "start":
+            self._started = perf_counter()
+        else:
+            self.pauses.append(perf_counter() - self._started)
+
+    def __enter__(self) -> "GcPauses":
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        gc.callbacks.remove(self)
+
+
+def _peak_rss() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macos bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _prepare(workload: Workload, operation: str, pool_size: int) -> Tuple[Callable[[Any], Any], List[Any]]:
+    root_type = workload.root_type
+    payloads = list(workload.payloads(pool_size))
+    if operation == "decode":
+        return lambda payload: decode(payload, root_type), payloads
+    if operation == "encode":
+        return lambda obj: encode(obj, root_type), [decode(payload, root_type) for payload in payloads]
+
+    return lambda document: json_decode(document, root_type), [json.dumps(payload) for payload in payloads]
+
+
+def measure(spec: WorkloadSpec, operation: str, records: int, pool_size: int, retain: bool) -> Dict[str, Any]:
+    workload = Workload(spec)
+    process, pool = _prepare(workload, operation, min(pool_size, records))
+    process(pool[0])  # build codecs before measuring
+    results: List[Any] = []
+    keep = results.append if retain else lambda value: None
+
+    gc.collect()
+    with GcPauses() as pauses:
+        start = perf_counter()
+        for item in islice(cycle(pool), records):
+            keep(process(item))
+        elapsed = perf_counter() - start
+
+    return {
+        "operation": operation,
+        "records": records,
+        "seconds": elapsed,
+        "records_per_second": records / elapsed,
+        "peak_rss": _peak_rss(),
+        "gc_collections": len(pauses.pauses),
+        "gc_total_pause": sum(pauses.pauses),
+        "gc_max_pause": max(pauses.pauses, default=0.0),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", nargs="+", type=float, default=[1e3, 1e4, 1e5, 1e6])
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--width", type=int, default=6)
+    parser.add_argument("--union-fanout", type=int, default=0)
+    parser.add_argument("--generic", action="store_true")
+    parser.add_argument("--optional-density", type=float, default=0.2)
+    parser.add_argument("--list-size", type=int, default=3)
+    parser.add_argument("--pool", type=int, default=1_000, help="number of distinct payloads")
+    parser.add_argument("--retain", action="store_true", help="keep all results alive")
+    parser.add_argument("--output", "-o", help="file to store results in")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    spec = WorkloadSpec(
+        seed=arguments.seed,
+        depth=arguments.depth,
+        width=arguments.width,
+        union_fanout=arguments.union_fanout,
+        generic=arguments.generic,
+        optional_density=arguments.optional_density,
+        list_size=arguments.list_size,
+    )
+
+    if arguments.worker:
+        operation, records = arguments.operations[0], int(arguments.records[0])
+        print(json.dumps(measure(spec, operation, records, arguments.pool, arguments.retain)))
+        return
+
+    results = []
+    for operation in arguments.operations:
+        for records in arguments.records:
+            command = [sys.executable, __file__, "--worker", "--operations", operation, "--records", str(records)]
+            command += ["--pool", str(arguments.pool)] + (["--retain"] if arguments.retain else [])
+            for name in ("seed", "depth", "width", "union_fanout", "optional_density", "list_size"):
+                command += [f"--{name.replace('_', '-')}", str(getattr(spec, name))]
+            command += ["--generic"] if spec.generic else []
+            output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+            result = json.loads(output)
+            results.append(result)
+            print(
+                f"{operation:<7} {int(records):>10} records  {result['records_per_second']:>12,.0f} records/s  "
+                f"peak rss {result['peak_rss'] / 2**20:>8.1f} MiB  "
+                f"gc {result['gc_collections']:>6} pauses, total {result['gc_total_pause'] * 1e3:>8.1f} ms, "
+                f"max {result['gc_max_pause'] * 1e3:>6.2f} ms"
+            )
+
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            spec_data = {**vars(spec), "scalar_mix": [[a_type.__name__, weight] for a_type, weight in spec.scalar_mix]}
+            json.dump({"spec": spec_data, "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
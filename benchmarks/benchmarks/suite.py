@@ -0,0 +1,189 @@
+"""
+In-process microbenchmarks of chili, timed with `chili.bench`.
+
+    python -m chili.bench run benchmarks/suite.py --output head.json [--filter decode] [--repeat 20]
+    python -m chili.bench compare base.json head.json --threshold 0.1
+
+Cases are named `<category>.<operation>`, where operation is `encode`, `decode` or `json` (json round trip).
+`scripts.<name>` cases load the comparison scripts (chili, pydantic, attrs and marshmallow) once and time only
+their decode or encode call, scripts which dependencies are not installed are skipped.
+"""
+import io
+import runpy
+import sys
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Callable, Generic, List, Optional, Tuple, Type, TypeVar, Union
+
+from chili import Decoder, Encoder, Mapper, decode, encode, json_decode, json_encode
+from chili.bench import benchmark, main
+
+T = TypeVar("T")
+
+
+@dataclass
+class Primitives:
+    id: int
+    name: str
+    price: float
+    active: bool
+
+
+@dataclass
+class Author:
+    first_name: str
+    last_name: str
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+@dataclass
+class Book:
+    name: str
+    author: Author
+    tags: List[Tag]
+    isbn: Optional[str] = None
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+    total: int
+
+
+@dataclass
+class Magazine:
+    title: str
+    issue: int
+
+
+@dataclass
+class Shelf:
+    items: List[Union[Book, Magazine]]
+
+
+@dataclass
+class Event:
+    name: str
+    starts_at: datetime
+    day: date
+    opens: time
+    duration: timedelta
+
+
+@dataclass
+class Profile:
+    user_name: str
+    email_address: str
+    created_on: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+
+
+author = Author("J.R.R.", "Tolkien")
+tags = [Tag("Fantasy"), Tag("Adventure")]
+event = Event(
+    "Release", datetime(2024, 1, 2, 10, 30, tzinfo=timezone.utc), date(2024, 1, 2), time(9, 0), timedelta(hours=2)
+)
+
+
+def _tags(count: int) -> List[Tag]:
+    return [Tag(f"tag-{index}") for index in range(count)]
+
+
+# category, type, value factory and number of samples (large lists are sampled fewer times)
+samples: List[Tuple[str, Any, Callable[[], Any], Optional[int]]] = [
+    ("primitives", Primitives, lambda: Primitives(1, "Widget", 9.99, True), None),
+    ("nested", Book, lambda: Book("The Hobbit", author, tags), None),
+    ("generics", Page[Book], lambda: Page([Book("The Hobbit", author, tags)] * 10, 10), None),
+    ("unions", Shelf, lambda: Shelf([Book("The Hobbit", author, tags), Magazine("Wired", 7)] * 5), None),
+    ("datetimes", Event, lambda: event, None),
+    ("list[1]", List[Tag], lambda: _tags(1), None),
+    ("list[1000]", List[Tag], lambda: _tags(1_000), None),
+    ("list[1000000]", List[Tag], lambda: _tags(1_000_000), 5),
+]
+
+
+def _register(category: str, a_type: Type, make_value: Callable[[], Any], repeat: Optional[int]) -> None:
+    @benchmark(f"{category}.encode", "encode", repeat)
+    def _encode() -> Callable[[], Any]:
+        value = make_value()
+        return lambda: encode(value, a_type)
+
+    @benchmark(f"{category}.decode", "decode", repeat)
+    def _decode() -> Callable[[], Any]:
+        data = encode(make_value(), a_type)
+        return lambda: decode(data, a_type)
+
+    @benchmark(f"{category}.json", "json", repeat)
+    def _json() -> Callable[[], Any]:
+        value = make_value()
+        return lambda: json_decode(json_encode(value, a_type), a_type)
+
+
+for sample in samples:
+    _register(*sample)
+
+
+profile_data = {"userName": "bob", "emailAddress": "bob@example.com", "createdOn": "2024-01-02", "tags": ["a", "b"]}
+
+
+@benchmark("mappers.decode", "decode")
+def _mapper_decode() -> Callable[[], Any]:
+    mapper = Mapper({"user_name": "userName", "email_address": "emailAddress", "created_on": "createdOn", "tags": True})
+    decoder = Decoder[Profile](mapper=mapper)
+    return lambda: decoder.decode(profile_data)
+
+
+@benchmark("mappers.encode", "encode")
+def _mapper_encode() -> Callable[[], Any]:
+    mapper = Mapper({"userName": "user_name", "emailAddress": "email_address", "createdOn": "created_on", "tags": True})
+    encoder = Encoder[Profile](mapper=mapper)
+    profile = Profile("bob", "bob@example.com", "2024-01-02", ["a", "b"])
+    return lambda: encoder.encode(profile)
+
+
+scripts = {
+    "chili": "chili",
+    "pydantic": "pydantic",
+    "attrs": "cattr",
+    "marshmallow": "marshmallow",
+}
+
+# Calls timed for each comparison script, given the namespace of the executed script.
+script_calls = {
+    "chili_decode": lambda ns: lambda: ns["decode"](ns["raw_data"], List[ns["Book"]]),
+    "chili_encode": lambda ns: lambda: ns["encode"](ns["books"], List[ns["Book"]]),
+    "pydantic_decode": lambda ns: lambda: [ns["Book"](**book) for book in ns["raw_data"]],
+    "pydantic_encode": lambda ns: lambda: [book.model_dump() for book in ns["books"]],
+    "attrs_decode": lambda ns: lambda: ns["structure"](ns["raw_data"], List[ns["Book"]]),
+    "attrs_encode": lambda ns: lambda: ns["unstructure"](ns["books"]),
+    "marshmallow_decode": lambda ns: lambda: ns["book_schema"].load(ns["raw_data"]),
+    "marshmallow_encode": lambda ns: lambda: ns["book_schema"].dump(ns["books"]),
+}
+
+
+def _register_script(path: Path) -> None:
+    @benchmark(f"scripts.{path.stem}", "scripts")
+    def _script() -> Callable[[], Any]:
+        # the script is executed once, so classes and codecs are created outside of the measurement
+        with redirect_stdout(io.StringIO()):
+            namespace = runpy.run_path(str(path))
+
+        return script_calls[path.stem](namespace)
+
+
+for library, module in scripts.items():
+    if find_spec(module) is None:
+        continue
+    for operation in ("decode", "encode"):
+        _register_script(Path(__file__).parent / f"{library}_{operation}.py")
+
+
+if __name__ == "__main__":
+    sys.exit(main(["run", __file__, *sys.argv[1:]]))
@@ -0,0 +1,149 @@
+"""
+Seeded generator of synthetic model hierarchies and matching payloads.
+
+    workload = Workload(WorkloadSpec(seed=1, depth=3, width=8, union_fanout=3, generic=True))
+    for payload in workload.payloads(1_000):
+        decode(payload, workload.root_type)
+
+Models are dataclasses created at runtime. Every model above the last level holds a nested model, a list of nested
+models and scalar fields; `union_fanout` adds a field accepting one of several leaf models, `generic` wraps the root
+model in `Envelope[T]`. The same spec and seed always produce the same models and payloads.
+"""
+import random
+import string
+from dataclasses import dataclass, field, make_dataclass
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+from uuid import UUID
+
+T = TypeVar("T")
+
+DEFAULT_SCALAR_MIX: Tuple[Tuple[Type, float], ...] = (
+    (str, 4.0),
+    (int, 3.0),
+    (float, 2.0),
+    (bool, 1.0),
+    (datetime, 1.0),
+    (date, 0.5),
+    (UUID, 0.5),
+    (Decimal, 0.5),
+)
+
+_EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class WorkloadSpec:
+    seed: int = 0
+    depth: int = 2  # levels of nested models below the root
+    width: int = 6  # number of fields of every model
+    union_fanout: int = 0  # number of leaf models accepted by the root's union field, 0 disables unions
+    generic: bool = False
+    optional_density: float = 0.2  # fraction of optional scalar fields
+    none_ratio: float = 0.5  # probability of an optional field being null in a payload
+    list_size: int = 3
+    string_length: int = 12
+    scalar_mix: Tuple[Tuple[Type, float], ...] = DEFAULT_SCALAR_MIX
+
+
+@dataclass
+class Envelope(Generic[T]):
+    id: UUID
+    created_at: datetime
+    body: T
+    history: List[T] = field(default_factory=list)
+
+
+class Workload:
+    def __init__(self, spec: WorkloadSpec = WorkloadSpec()):
+        self.spec = spec
+        self.models: List[Type] = []
+        self._rng = random.Random(spec.seed)
+        self._scalar_types = [a_type for a_type, _ in spec.scalar_mix]
+        self._scalar_weights = [weight for _, weight in spec.scalar_mix]
+        self._generators: Dict[Type, Callable[[random.Random], Any]] = {
+            str: self._string,
+            int: lambda rng: rng.randint(-1_000_000, 1_000_000),
+            float: lambda rng: round(rng.uniform(-1_000.0, 1_000.0), 6),
+            bool: lambda rng: rng.random() < 0.5,
+            datetime: lambda rng: (_EPOCH + timedelta(seconds=rng.randint(0, 10**8))).isoformat(),
+            date: lambda rng: (_EPOCH.date() + timedelta(days=rng.randint(0, 10_000))).isoformat(),
+            UUID: lambda rng: str(UUID(int=rng.getrandbits(128), version=4)),
+            Decimal: lambda rng: str(Decimal(rng.randint(0, 10**8)).scaleb(-2)),
+        }
+
+        extra_fields: List[Tuple[str, Any]] = []
+        if spec.union_fanout:
+            members = [self._build_leaf(f"Variant{index}", f"variant{index}") for index in range(spec.union_fanout)]
+            extra_fields.append(("choice", Union[tuple(members)]))  # type: ignore
+        model = self._build_model(0, "Root", extra_fields)
+        self.model_type = model
+        self.root_type: Any = Envelope[model] if spec.generic else model  # type: ignore
+
+    def payload(self, rng: random.Random) -> Dict[str, Any]:
+        """
+        Returns payload of the root type in its encoded form.
+        """
+        return self._value(self.root_type, rng)
+
+    def payloads(self, count: int, seed: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yields `count` payloads, generated from `seed` (spec's seed by default).
+        """
+        rng = random.Random(self.spec.seed if seed is None else seed)
+        for _ in range(count):
+            yield self.payload(rng)
+
+    def _create(self, name: str, fields: List[Tuple[str, Any]]) -> Type:
+        model = make_dataclass(name, fields)
+        model.__module__ = __name__
+        self.models.append(model)
+
+        return model
+
+    def _scalar_field(self, name: str) -> Tuple[str, Any]:
+        a_type = self._rng.choices(self._scalar_types, self._scalar_weights)[0]
+        if self._rng.random() < self.spec.optional_density:
+            return name, Optional[a_type]
+
+        return name, a_type
+
+    def _build_leaf(self, name: str, prefix: str) -> Type:
+        return self._create(name, [self._scalar_field(f"{prefix}_{index}") for index in range(self.spec.width)])
+
+    def _build_model(self, level: int, name: str, extra_fields: List[Tuple[str, Any]] = None) -> Type:
+        fields: List[Tuple[str, Any]] = list(extra_fields or [])
+        if level >= self.spec.depth:
+            fields += [self._scalar_field(f"field{level}_{index}") for index in range(self.spec.width)]
+            return self._create(name, fields)
+
+        child = self._build_model(level + 1, f"Level{level + 1}")
+        fields += [("child", child), ("children", List[child])]  # type: ignore
+        fields += [self._scalar_field(f"field{level}_{index}") for index in range(max(0, self.spec.width - 2))]
+
+        return self._create(name, fields)
+
+    def _string(self, rng: random.Random) -> str:
+        return "".join(rng.choices(string.ascii_letters, k=self.spec.string_length))
+
+    def _value(self, a_type: Any, rng: random.Random, parameters: Dict[Any, Any] = None) -> Any:
+        if parameters and a_type in parameters:
+            a_type = parameters[a_type]
+        origin = getattr(a_type, "__origin__", None)
+        args = getattr(a_type, "__args__", ())
+
+        if origin is Union and args[-1] is type(None):
+            return None if rng.random() < self.spec.none_ratio else self._value(args[0], rng, parameters)
+        if origin is Union:
+            return self._value(rng.choice(args), rng, parameters)
+        if origin is list:
+            return [self._value(args[0], rng, parameters) for _ in range(self.spec.list_size)]
+        if a_type in self._generators:
+            return self._generators[a_type](rng)
+
+        model_fields = getattr(origin or a_type, "__dataclass_fields__")
+        if origin is not None:
+            parameters = dict(zip(origin.__parameters__, args))
+
+        return {name: self._value(model_field.type, rng, parameters) for name, model_field in model_fields.items()}
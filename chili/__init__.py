@@ -1,8 +1,11 @@
+from .compact import compact
 from .decoder import Decoder, TypeDecoder, decodable, decode
 from .encoder import Encoder, TypeEncoder, encodable, encode
 from .json_support import JsonDecoder, JsonEncoder, JsonSerializer, json_decode, json_encode
 from .mapper import KeyScheme, Mapper
+from .record_file import RecordFile
 from .serializer import Serializer, serializable
+from .view import view
 
 __all__ = [
     "Encoder",
@@ -22,4 +25,7 @@ __all__ = [
     "Mapper",
     "KeyScheme",
     "encode",
+    "compact",
+    "RecordFile",
+    "view",
 ]
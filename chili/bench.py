@@ -0,0 +1,416 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import importlib.util
+import json
+import math
+import os
+import platform
+import re
+import statistics
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+__all__ = [
+    "Case",
+    "Comparison",
+    "Summary",
+    "benchmark",
+    "compare",
+    "get_cases",
+    "load_suite",
+    "measure",
+    "run",
+    "load_results",
+    "save_results",
+    "summarize",
+    "welch_test",
+    "main",
+]
+
+Setup = Callable[[], Callable[[], Any]]
+
+DEFAULT_REPEAT = 20
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_ALPHA = 0.05
+# suite locations tried when none is passed, relative to repository root or `benchmarks` directory
+DEFAULT_SUITES = (os.path.join("benchmarks", "benchmarks", "suite.py"), os.path.join("benchmarks", "suite.py"))
+
+
+class Case(NamedTuple):
+    name: str
+    group: str
+    setup: Setup
+    repeat: Optional[int] = None
+
+
+_cases: Dict[str, Case] = {}
+
+
+def benchmark(name: str, group: str = "", repeat: Optional[int] = None) -> Callable[[Setup], Setup]:
+    """
+    Registers benchmark case. Decorated function prepares data outside of the measurement and returns
+    a callable without arguments, which is timed. `repeat` overrides number of samples for slow cases.
+    """
+
+    def _register(setup: Setup) -> Setup:
+        _cases[name] = Case(name, group, setup, repeat)
+        return setup
+
+    return _register
+
+
+def get_cases(pattern: Optional[str] = None) -> List[Case]:
+    """
+    Returns registered cases, optionally only those which name matches the regular expression.
+    """
+    if pattern is None:
+        return list(_cases.values())
+
+    expression = re.compile(pattern)
+
+    return [case for case in _cases.values() if expression.search(case.name)]
+
+
+def _time(func: Callable[[], Any], loops: int) -> float:
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = perf_counter()
+        for _ in range(loops):
+            func()
+        return perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def measure(
+    func: Callable[[], Any], repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME, warmup: int = 1
+) -> Tuple[int, List[float]]:
+    """
+    Times the callable in-process. Number of loops per sample is calibrated, so a sample takes at least
+    `min_time` seconds; garbage collector is disabled while sampling. Returns the loops and seconds per call
+    for every sample.
+    """
+    loops = 1
+    elapsed = _time(func, loops)
+    while elapsed < min_time:
+        loops = max(loops * 2, int(loops * min_time / elapsed) + 1) if elapsed else loops * 10
+        elapsed = _time(func, loops)
+
+    for _ in range(warmup):
+        _time(func, loops)
+
+    return loops, [_time(func, loops) / loops for _ in range(repeat)]
+
+
+def _chili_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("chili")
+    except Exception:
+        from .__version__ import __version__
+
+        return __version__
+
+
+def _metadata() -> Dict[str, Any]:
+    return {
+        "chili": _chili_version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "created": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def run(
+    cases: Optional[Iterable[Case]] = None,
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = DEFAULT_MIN_TIME,
+    progress: Optional[Callable[[str, List[float]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Measures cases (all registered cases by default) and returns results document:
+    `{"metadata": {...}, "benchmarks": {name: {"group": ..., "loops": ..., "values": [...]}}}`.
+    """
+    results: Dict[str, Any] = {}
+    for case in get_cases() if cases is None else cases:
+        loops, values = measure(case.setup(), case.repeat or repeat, min_time)
+        results[case.name] = {"group": case.group, "loops": loops, "values": values}
+        if progress is not None:
+            progress(case.name, values)
+
+    return {"metadata": _metadata(), "benchmarks": results}
+
+
+def save_results(results: Dict[str, Any], path: Union[str, os.PathLike]) -> None:
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+def load_results(path: Union[str, os.PathLike]) -> Dict[str, Any]:
+    with open(path) as file:
+        return json.load(file)
+
+
+def load_suite(path: Union[str, os.PathLike]) -> None:
+    """
+    Imports python file registering benchmark cases.
+    """
+    path = Path(path)
+    name = f"chili_bench_{path.stem}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot load benchmark suite {path}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+
+
+class Summary(NamedTuple):
+    samples: int
+    mean: float
+    stdev: float
+    p50: float
+    p99: float
+
+
+def _percentile(ordered: Sequence[float], percent: float) -> float:
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(percent / 100 * len(ordered)) - 1))]
+
+
+def summarize(values: Sequence[float]) -> Summary:
+    ordered = sorted(values)
+
+    return Summary(
+        len(ordered),
+        statistics.mean(ordered),
+        statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        statistics.median(ordered),
+        _percentile(ordered, 99),
+    )
+
+
+def _continued_fraction(a: float, b: float, x: float) -> float:
+    tiny = 1e-300
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    result = d
+    for m in range(1, 300):
+        for numerator in (
+            m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1)),
+        ):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            result *= c * d
+        if abs(c * d - 1.0) < 1e-12:
+            break
+
+    return result
+
+
+def _incomplete_beta(a: float, b: float, x: float) -> float:
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log(1.0 - x))
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _continued_fraction(a, b, x) / a
+
+    return 1.0 - front * _continued_fraction(b, a, 1.0 - x) / b
+
+
+def welch_test(base: Sequence[float], head: Sequence[float]) -> float:
+    """
+    Returns two-sided p-value of Welch's t-test telling whether means of the samples differ.
+    """
+    if len(base) < 2 or len(head) < 2:
+        return 1.0
+
+    base_error = statistics.variance(base) / len(base)
+    head_error = statistics.variance(head) / len(head)
+    difference = statistics.mean(head) - statistics.mean(base)
+    if base_error + head_error == 0:
+        return 1.0 if difference == 0 else 0.0
+
+    t = difference / math.sqrt(base_error + head_error)
+    freedom = (base_error + head_error) ** 2 / (base_error**2 / (len(base) - 1) + head_error**2 / (len(head) - 1))
+
+    return _incomplete_beta(freedom / 2, 0.5, freedom / (freedom + t * t))
+
+
+class Comparison(NamedTuple):
+    name: str
+    base: Summary
+    head: Summary
+    ratio: float
+    p_value: float
+    significant: bool
+    regression: bool
+
+    @property
+    def verdict(self) -> str:
+        if not self.significant:
+            return "not significant"
+
+        return f"{1 / self.ratio:.2f}x faster" if self.ratio < 1 else f"{self.ratio:.2f}x slower"
+
+
+def compare(
+    base: Dict[str, Any], head: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD, alpha: float = DEFAULT_ALPHA
+) -> List[Comparison]:
+    """
+    Compares benchmarks present in both results documents. Slowdown is a regression when it is statistically
+    significant (p-value below `alpha`) and head's mean exceeds base's mean by more than `threshold`.
+    """
+    result = []
+    for name, base_case in base["benchmarks"].items():
+        head_case = head["benchmarks"].get(name)
+        if head_case is None:
+            continue
+        base_summary = summarize(base_case["values"])
+        head_summary = summarize(head_case["values"])
+        ratio = head_summary.mean / base_summary.mean if base_summary.mean else 1.0
+        p_value = welch_test(base_case["values"], head_case["values"])
+        significant = p_value < alpha
+        result.append(
+            Comparison(
+                name,
+                base_summary,
+                head_summary,
+                ratio,
+                p_value,
+                significant,
+                significant and ratio > 1 + threshold,
+            )
+        )
+
+    return result
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+
+    return f"{seconds / 1e-9:.2f} ns"
+
+
+def _format_table(header: Sequence[str], rows: Iterable[Sequence[str]]) -> str:
+    rows = [list(header)] + [list(row) for row in rows]
+    widths = [max(len(row[index]) for row in rows) for index in range(len(header))]
+    lines = [
+        "  ".join([row[0].ljust(widths[0])] + [cell.rjust(width) for cell, width in zip(row[1:], widths[1:])])
+        for row in rows
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+
+    return "\n".join(lines)
+
+
+def _run_command(arguments: argparse.Namespace) -> int:
+    suites = arguments.suite or [next((path for path in DEFAULT_SUITES if os.path.exists(path)), DEFAULT_SUITES[0])]
+    for suite in suites:
+        if not os.path.exists(suite):
+            print(f"benchmark suite {suite} does not exist", file=sys.stderr)
+            return 2
+        load_suite(suite)
+
+    def _progress(name: str, values: List[float]) -> None:
+        summary = summarize(values)
+        print(f"{name}: {_format_time(summary.mean)} +- {_format_time(summary.stdev)}", file=sys.stderr)
+
+    results = run(get_cases(arguments.filter), arguments.repeat, arguments.min_time, _progress)
+    if arguments.output:
+        save_results(results, arguments.output)
+
+    rows = []
+    for name, case in results["benchmarks"].items():
+        summary = summarize(case["values"])
+        rows.append([name] + [_format_time(value) for value in (summary.mean, summary.stdev, summary.p50, summary.p99)])
+    print(_format_table(["benchmark", "mean", "stdev", "p50", "p99"], rows))
+
+    return 0
+
+
+def _compare_command(arguments: argparse.Namespace) -> int:
+    base = load_results(arguments.base)
+    head = load_results(arguments.head)
+    comparisons = compare(base, head, arguments.threshold, arguments.alpha)
+
+    rows = [
+        [
+            item.name,
+            f"{_format_time(item.base.mean)} +- {_format_time(item.base.stdev)}",
+            f"{_format_time(item.head.mean)} +- {_format_time(item.head.stdev)}",
+            _format_time(item.head.p50),
+            _format_time(item.head.p99),
+            f"{item.p_value:.3f}",
+            item.verdict + (" (regression)" if item.regression else ""),
+        ]
+        for item in comparisons
+    ]
+    print(_format_table(["benchmark", "base", "head", "head p50", "head p99", "p-value", "change"], rows))
+
+    missing = sorted(set(base["benchmarks"]) ^ set(head["benchmarks"]))
+    if missing:
+        print(f"\nbenchmarks present in one of the files only: {', '.join(missing)}")
+
+    regressions = [item.name for item in comparisons if item.regression]
+    if regressions:
+        print(f"\nslower by more than {arguments.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chili.bench", description="Runs and compares chili benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmark suites and store results")
+    run_parser.add_argument(
+        "suite", nargs="*", help=f"python files registering benchmarks (default: {DEFAULT_SUITES[0]})"
+    )
+    run_parser.add_argument("--output", "-o", help="file to store results in")
+    run_parser.add_argument("--filter", "-k", help="regular expression selecting benchmarks by name")
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="number of samples per benchmark")
+    run_parser.add_argument(
+        "--min-time", type=float, default=DEFAULT_MIN_TIME, help="minimal duration of a sample in seconds"
+    )
+    run_parser.set_defaults(handler=_run_command)
+
+    compare_parser = commands.add_parser("compare", help="compare two results files")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("head")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown, e.g. 0.1 for 10%%"
+    )
+    compare_parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="significance level")
+    compare_parser.set_defaults(handler=_compare_command)
+
+    arguments = parser.parse_args(argv)
+
+    return arguments.handler(arguments)
+
+
+if __name__ == "__main__":
+    # suites register cases in the imported `chili.bench` module, not in `__main__`
+    from chili.bench import main as _main
+
+    sys.exit(_main())
@@ -0,0 +1,447 @@
+from __future__ import annotations
+
+import collections.abc
+import datetime
+import struct
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from json import dumps as json_dumps, loads as json_loads
+from typing import Any, Callable, List, Optional, Tuple, Type, TypeVar, Union
+
+from .decoder import _setattr_to_state, build_type_decoder
+from .encoder import build_type_encoder
+from .error import DecoderError, EncoderError
+from .positional import schema_fingerprint
+from .typing import (
+    _is_class_with_schema,
+    create_schema,
+    get_origin_type,
+    get_type_args,
+    is_newtype,
+    is_optional,
+    unpack_optional,
+)
+
+__all__ = [
+    "dumps",
+    "loads",
+    "pack_into",
+    "unpack_from",
+    "get_fingerprint",
+]
+
+T = TypeVar("T")
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+_FINGERPRINT_SIZE = 4
+_NAIVE_OFFSET = -32768
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_NAIVE_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(view: memoryview, offset: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = view[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+
+class _Codec(ABC):
+    @abstractmethod
+    def write(self, out: bytearray, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    def read(self, view: memoryview, offset: int) -> Tuple[Any, int]:
+        ...
+
+
+class _FixedCodec(_Codec):
+    """
+    Fixed-width value packed with struct, `to_wire` converts value into a tuple of primitives matching the format.
+    """
+
+    def __init__(
+        self,
+        fmt: str,
+        to_wire: Optional[Callable[[Any], Tuple]] = None,
+        from_wire: Optional[Callable[..., Any]] = None,
+    ):
+        self.fmt = fmt
+        self.to_wire = to_wire
+        self.from_wire = from_wire
+        self._struct = struct.Struct(f"<{fmt}")
+
+    def write(self, out: bytearray, value: Any) -> None:
+        out += self._struct.pack(*self.to_wire(value)) if self.to_wire else self._struct.pack(value)
+
+    def read(self, view: memoryview, offset: int) -> Tuple[Any, int]:
+        values = self._struct.unpack_from(view, offset)
+        value = self.from_wire(*values) if self.from_wire else values[0]
+
+        return value, offset + self._struct.size
+
+
+class _StrCodec(_Codec):
+    def write(self, out: bytearray, value: str) -> None:
+        data = value.encode("utf8")
+        _write_varint(out, len(data))
+        out += data
+
+    def read(self, view: memoryview, offset: int) -> Tuple[str, int]:
+        length, offset = _read_varint(view, offset)
+        return str(view[offset : offset + length], "utf8"), offset + length
+
+
+class _BytesCodec(_Codec):
+    def __init__(self, target: Type):
+        self.target = target
+
+    def write(self, out: bytearray, value: Buffer) -> None:
+        _write_varint(out, len(value))
+        out += value
+
+    def read(self, view: memoryview, offset: int) -> Tuple[Any, int]:
+        length, offset = _read_varint(view, offset)
+        return self.target(view[offset : offset + length]), offset + length
+
+
+class _OptionalCodec(_Codec):
+    def __init__(self, codec: _Codec):
+        self.codec = codec
+
+    def write(self, out: bytearray, value: Any) -> None:
+        if value is None:
+            out.append(0)
+            return
+        out.append(1)
+        self.codec.write(out, value)
+
+    def read(self, view: memoryview, offset: int) -> Tuple[Any, int]:
+        if not view[offset]:
+            return None, offset + 1
+        return self.codec.read(view, offset + 1)
+
+
+class _SequenceCodec(_Codec):
+    def __init__(self, item_codec: _Codec, container: Callable[[List[Any]], Any]):
+        self.item_codec = item_codec
+        self.container = container
+
+    def write(self, out: bytearray, value: Any) -> None:
+        _write_varint(out, len(value))
+        write = self.item_codec.write
+        for item in value:
+            write(out, item)
+
+    def read(self, view: memoryview, offset: int) -> Tuple[Any, int]:
+        length, offset = _read_varint(view, offset)
+        read = self.item_codec.read
+        result = []
+        for _ in range(length):
+            item, offset = read(view, offset)
+            result.append(item)
+
+        return (result if self.container is list else self.container(result)), offset
+
+
+class _TupleCodec(_Codec):
+    def __init__(self, item_codecs: List[_Codec]):
+        self.item_codecs = item_codecs
+
+    def write(self, out: bytearray, value: Any) -> None:
+        for codec, item in zip(self.item_codecs, value):
+            codec.write(out, item)
+
+    def read(self, view: memoryview, offset: int) -> Tuple[Any, int]:
+        result = []
+        for codec in self.item_codecs:
+            item, offset = codec.read(view, offset)
+            result.append(item)
+
+        return tuple(result), offset
+
+
+class _DictCodec(_Codec):
+    def __init__(self, key_codec: _Codec, value_codec: _Codec):
+        self.key_codec = key_codec
+        self.value_codec = value_codec
+
+    def write(self, out: bytearray, value: dict) -> None:
+        _write_varint(out, len(value))
+        for key, item in value.items():
+            self.key_codec.write(out, key)
+            self.value_codec.write(out, item)
+
+    def read(self, view: memoryview, offset: int) -> Tuple[dict, int]:
+        length, offset = _read_varint(view, offset)
+        result = {}
+        for _ in range(length):
+            key, offset = self.key_codec.read(view, offset)
+            result[key], offset = self.value_codec.read(view, offset)
+
+        return result, offset
+
+
+class _FallbackCodec(_Codec):
+    """
+    Stores value encoded with regular chili encoder as json string, used for types without binary layout.
+    """
+
+    def __init__(self, a_type: Type):
+        self.encoder = build_type_encoder(a_type, force=True)  # type: ignore
+        self.decoder = build_type_decoder(a_type, force=True)
+        self._str_codec = _StrCodec()
+
+    def write(self, out: bytearray, value: Any) -> None:
+        self._str_codec.write(out, json_dumps(self.encoder.encode(value)))
+
+    def read(self, view: memoryview, offset: int) -> Tuple[Any, int]:
+        value, offset = self._str_codec.read(view, offset)
+        return self.decoder.decode(json_loads(value)), offset
+
+
+class _ClassCodec(_Codec):
+    """
+    Compiles class schema into segments: runs of consecutive fixed-width properties share a single struct,
+    other properties are written one by one.
+    """
+
+    def __init__(self, class_name: Type):
+        self.class_name = class_name
+
+    def write(self, out: bytearray, value: Any) -> None:
+        if not hasattr(self, "_segments"):
+            self._segments = self._build()
+
+        for fields, codec in self._segments:
+            if codec is None:
+                values: List[Any] = []
+                for name, default, field_codec in fields:
+                    item = getattr(value, name, default)
+                    if field_codec.to_wire:
+                        values.extend(field_codec.to_wire(item))
+                    else:
+                        values.append(item)
+                out += fields.struct.pack(*values)  # type: ignore
+                continue
+            name, default, _ = fields[0]
+            codec.write(out, getattr(value, name, default))
+
+    def read(self, view: memoryview, offset: int) -> Tuple[Any, int]:
+        if not hasattr(self, "_segments"):
+            self._segments = self._build()
+
+        instance = self.class_name.__new__(self.class_name)  # type: ignore
+        for fields, codec in self._segments:
+            if codec is None:
+                values = fields.struct.unpack_from(view, offset)  # type: ignore
+                offset += fields.struct.size  # type: ignore
+                index = 0
+                for _, _, field_codec, attribute, setter in fields.plan:  # type: ignore
+                    width = len(field_codec.fmt)
+                    if field_codec.from_wire:
+                        item = field_codec.from_wire(*values[index : index + width])
+                    else:
+                        item = values[index]
+                    index += width
+                    self._assign(instance, attribute, setter, item)
+                continue
+            item, offset = codec.read(view, offset)
+            _, _, _, attribute, setter = fields.plan[0]  # type: ignore
+            self._assign(instance, attribute, setter, item)
+
+        if hasattr(instance, "__post_init__"):
+            instance.__post_init__()
+
+        return instance, offset
+
+    @staticmethod
+    def _assign(instance: Any, attribute: str, setter: Any, value: Any) -> None:
+        if setter is None:
+            setattr(instance, attribute, value)
+        else:
+            setter(instance, value)
+
+    def _build(self) -> List[Tuple[_Segment, Optional[_Codec]]]:
+        segments: List[Tuple[_Segment, Optional[_Codec]]] = []
+        fixed = _Segment()
+        for name, prop in create_schema(self.class_name).items():  # type: ignore
+            codec = _get_codec(prop.type)  # type: ignore
+            default = prop.default_value
+            entry = (name, default, codec)
+            plan_entry = (name, default, codec, *_setattr_to_state(self.class_name, name))
+            if isinstance(codec, _FixedCodec):
+                fixed.append(entry)
+                fixed.plan.append(plan_entry)
+                continue
+            if fixed:
+                segments.append((fixed.compile(), None))
+                fixed = _Segment()
+            variable = _Segment([entry])
+            variable.plan.append(plan_entry)
+            segments.append((variable, codec))
+
+        if fixed:
+            segments.append((fixed.compile(), None))
+
+        return segments
+
+
+class _Segment(list):
+    def __init__(self, *args: Any):
+        super().__init__(*args)
+        self.plan: List[Tuple] = []
+        self.struct: Optional[struct.Struct] = None
+
+    def compile(self) -> _Segment:
+        self.struct = struct.Struct("<" + "".join(codec.fmt for _, _, codec in self))
+        return self
+
+
+def _datetime_to_wire(value: datetime.datetime) -> Tuple[int, int]:
+    if value.tzinfo is None:
+        return (value - _NAIVE_EPOCH) // _MICROSECOND, _NAIVE_OFFSET
+
+    offset = value.utcoffset()
+    return (value - _EPOCH) // _MICROSECOND, offset // datetime.timedelta(minutes=1)  # type: ignore
+
+
+def _datetime_from_wire(microseconds: int, offset: int) -> datetime.datetime:
+    if offset == _NAIVE_OFFSET:
+        return _NAIVE_EPOCH + datetime.timedelta(microseconds=microseconds)
+
+    value = _EPOCH + datetime.timedelta(microseconds=microseconds)
+    if offset:
+        return value.astimezone(datetime.timezone(datetime.timedelta(minutes=offset)))
+
+    return value
+
+
+_FIXED_CODECS = {
+    bool: _FixedCodec("?"),
+    int: _FixedCodec("q"),
+    float: _FixedCodec("d"),
+    datetime.datetime: _FixedCodec("qh", _datetime_to_wire, _datetime_from_wire),
+    datetime.date: _FixedCodec("i", lambda value: (value.toordinal(),), datetime.date.fromordinal),
+    datetime.timedelta: _FixedCodec(
+        "q", lambda value: (value // _MICROSECOND,), lambda value: datetime.timedelta(microseconds=value)
+    ),
+}
+
+_SEQUENCE_CONTAINERS = {
+    list: list,
+    set: set,
+    frozenset: frozenset,
+    tuple: tuple,
+    collections.deque: collections.deque,
+    collections.abc.Sequence: list,
+}
+
+
+@lru_cache(maxsize=None)
+def _get_codec(a_type: Any) -> _Codec:
+    if a_type in _FIXED_CODECS:
+        return _FIXED_CODECS[a_type]
+    if a_type is str:
+        return _StrCodec()
+    if a_type in (bytes, bytearray):
+        return _BytesCodec(a_type)
+    if is_newtype(a_type):
+        return _get_codec(a_type.__supertype__)
+    if is_optional(a_type) and len(get_type_args(a_type)) == 2:
+        return _OptionalCodec(_get_codec(unpack_optional(a_type)))  # type: ignore
+
+    origin_type = get_origin_type(a_type)
+    type_args = get_type_args(a_type)
+    if origin_type in _SEQUENCE_CONTAINERS and type_args:
+        if origin_type is not tuple:
+            return _SequenceCodec(_get_codec(type_args[0]), _SEQUENCE_CONTAINERS[origin_type])  # type: ignore
+        if len(type_args) == 2 and type_args[1] is Ellipsis:
+            return _SequenceCodec(_get_codec(type_args[0]), tuple)  # type: ignore
+        return _TupleCodec([_get_codec(type_arg) for type_arg in type_args])  # type: ignore
+    if origin_type is dict and len(type_args) == 2:
+        return _DictCodec(_get_codec(type_args[0]), _get_codec(type_args[1]))  # type: ignore
+
+    if _is_class_with_schema(a_type):
+        return _ClassCodec(a_type)
+
+    return _FallbackCodec(a_type)
+
+
+def get_fingerprint(a_type: Type) -> bytes:
+    """
+    Returns header written in front of every record, it changes whenever layout of the type changes.
+    """
+    return bytes.fromhex(schema_fingerprint(a_type))  # type: ignore
+
+
+def _encode(obj: Any, a_type: Type) -> bytearray:
+    out = bytearray(get_fingerprint(a_type))
+    try:
+        _get_codec(a_type).write(out, obj)  # type: ignore
+    except (struct.error, AttributeError, TypeError) as error:
+        raise EncoderError.invalid_input(obj) from error
+
+    return out
+
+
+def dumps(obj: Any, a_type: Optional[Type] = None) -> bytes:
+    """
+    Encodes object into compact binary record: fingerprint header followed by struct-packed fixed-width properties
+    and varint-length-prefixed strings, bytes and collections.
+    """
+    return bytes(_encode(obj, a_type or type(obj)))
+
+
+def pack_into(buffer: Union[bytearray, memoryview], offset: int, obj: Any, a_type: Optional[Type] = None) -> int:
+    """
+    Encodes binary record and copies it into the buffer at the given offset, returns number of written bytes.
+    Records have variable length, so the record is encoded into a temporary bytearray first and then copied.
+    """
+    data = _encode(obj, a_type or type(obj))
+    end = offset + len(data)
+    if end > len(buffer):
+        raise EncoderError.invalid_input(f"buffer too small, {end} bytes required")
+    buffer[offset:end] = data
+
+    return len(data)
+
+
+def unpack_from(buffer: Buffer, a_type: Type[T], offset: int = 0) -> Tuple[T, int]:
+    """
+    Reads binary record from the buffer at the given offset, returns decoded value and number of read bytes.
+    """
+    view = memoryview(buffer)
+    fingerprint = get_fingerprint(a_type)
+    if view[offset : offset + _FINGERPRINT_SIZE] != fingerprint:
+        raise DecoderError.invalid_input("schema fingerprint mismatch")
+
+    try:
+        value, end = _get_codec(a_type).read(view, offset + _FINGERPRINT_SIZE)  # type: ignore
+    except (struct.error, IndexError, UnicodeDecodeError) as error:
+        raise DecoderError.invalid_input(buffer) from error
+
+    return value, end - offset
+
+
+def loads(data: Buffer, a_type: Type[T]) -> T:
+    value, size = unpack_from(data, a_type)
+    if size != len(data):
+        raise DecoderError.invalid_input("unexpected data after the record")
+
+    return value
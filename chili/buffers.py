@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from .decoder import ArrayDecoder, MemoryviewDecoder, NdarrayDecoder
+from .encoder import ArrayEncoder, BufferFormat, MemoryviewEncoder, NdarrayEncoder
+from .numpy import get_ndarray_dtype
+
+__all__ = [
+    "BufferFormat",
+    "ArrayEncoder",
+    "ArrayDecoder",
+    "MemoryviewEncoder",
+    "MemoryviewDecoder",
+    "NdarrayEncoder",
+    "NdarrayDecoder",
+    "get_ndarray_dtype",
+]
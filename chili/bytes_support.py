@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import binascii
+from base64 import b64decode, b64encode, b85decode, b85encode, urlsafe_b64decode, urlsafe_b64encode
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, Type, Union
+
+from .decoder import TypeDecoder, TypeDecoders
+from .encoder import TypeEncoder, TypeEncoders
+from .error import DecoderError
+
+__all__ = [
+    "BytesEncoding",
+    "BytesEncoder",
+    "BytesDecoder",
+    "bytes_encoders",
+    "bytes_decoders",
+    "b64encode_chunks",
+    "b64decode_chunks",
+]
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+_DEFAULT_CHUNK_SIZE = 3 * 64 * 1024
+
+
+class BytesEncoding(Enum):
+    RAW = "raw"
+    MEMORYVIEW = "memoryview"
+    BASE64 = "base64"
+    URLSAFE_BASE64 = "urlsafe_base64"
+    BASE85 = "base85"
+    HEX = "hex"
+
+
+_TEXT_ENCODERS: Dict[BytesEncoding, Callable[[BytesLike], bytes]] = {
+    BytesEncoding.BASE64: b64encode,
+    BytesEncoding.URLSAFE_BASE64: urlsafe_b64encode,
+    BytesEncoding.BASE85: b85encode,
+}
+
+_TEXT_DECODERS: Dict[BytesEncoding, Callable[[Any], bytes]] = {
+    BytesEncoding.BASE64: b64decode,
+    BytesEncoding.URLSAFE_BASE64: urlsafe_b64decode,
+    BytesEncoding.BASE85: b85decode,
+    BytesEncoding.HEX: bytes.fromhex,
+}
+
+
+class BytesEncoder(TypeEncoder):
+    """
+    Encodes bytes-like values. `RAW` passes values through untouched and `MEMORYVIEW` wraps them in a memoryview,
+    both are meant for binary-capable targets (msgpack, in-process or shared memory transport). Other encodings
+    produce strings which can be stored in json.
+    """
+
+    def __init__(self, encoding: BytesEncoding = BytesEncoding.BASE64):
+        self.encoding = encoding
+
+    def encode(self, value: BytesLike) -> Union[BytesLike, str]:
+        if self.encoding is BytesEncoding.RAW:
+            return value
+        if self.encoding is BytesEncoding.MEMORYVIEW:
+            return memoryview(value)
+        if self.encoding is BytesEncoding.HEX:
+            return value.hex()
+
+        return _TEXT_ENCODERS[self.encoding](value).decode("ascii")
+
+
+class BytesDecoder(TypeDecoder):
+    """
+    Decodes values produced by `BytesEncoder` into `bytes`, `bytearray` or `memoryview`. In `RAW` and `MEMORYVIEW`
+    encodings values of the target type are returned untouched and memoryviews share memory with passed buffer.
+    """
+
+    def __init__(self, encoding: BytesEncoding = BytesEncoding.BASE64, target: Type = bytes):
+        self.encoding = encoding
+        self.target = target
+
+    def decode(self, value: Any) -> BytesLike:
+        if self.encoding in (BytesEncoding.RAW, BytesEncoding.MEMORYVIEW):
+            if type(value) is self.target:
+                return value
+            return self.target(value)
+
+        try:
+            result = _TEXT_DECODERS[self.encoding](value)
+        except (binascii.Error, TypeError, ValueError) as error:
+            raise DecoderError.invalid_input(value) from error
+
+        if self.target is bytes:
+            return result
+
+        return self.target(result)
+
+
+def bytes_encoders(encoding: BytesEncoding) -> TypeEncoders:
+    """
+    Returns encoders for `bytes`, `bytearray` and `memoryview`, which use given encoding.
+    """
+    encoder = BytesEncoder(encoding)
+
+    return TypeEncoders({bytes: encoder, bytearray: encoder, memoryview: encoder})
+
+
+def bytes_decoders(encoding: BytesEncoding) -> TypeDecoders:
+    """
+    Returns decoders for `bytes`, `bytearray` and `memoryview`, which use given encoding.
+    """
+    return TypeDecoders(
+        {
+            bytes: BytesDecoder(encoding, bytes),
+            bytearray: BytesDecoder(encoding, bytearray),
+            memoryview: BytesDecoder(encoding, memoryview),
+        }
+    )
+
+
+def b64encode_chunks(value: BytesLike, chunk_size: int = _DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Encodes large blob into base64 chunks without building the whole encoded string, chunks joined together
+    form a valid base64 string. Chunk size (in bytes of input) is rounded down to a multiple of 3.
+    """
+    view = memoryview(value).cast("B")
+    step = max(chunk_size - chunk_size % 3, 3)
+    for offset in range(0, len(view), step):
+        yield binascii.b2a_base64(view[offset : offset + step], newline=False).decode("ascii")
+
+
+def b64decode_chunks(chunks: Iterable[Union[str, bytes]]) -> bytearray:
+    """
+    Decodes base64 string passed in chunks of any size (e.g. read from a stream) into a single buffer.
+    """
+    result = bytearray()
+    pending = b""
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("ascii")
+        pending += b"".join(chunk.split())
+        complete = len(pending) - len(pending) % 4
+        if complete:
+            try:
+                result += binascii.a2b_base64(pending[:complete])
+            except binascii.Error as error:
+                raise DecoderError.invalid_input(chunk) from error
+            pending = pending[complete:]
+
+    if pending:
+        raise DecoderError.invalid_input(pending)
+
+    return result
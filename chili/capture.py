@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+import os
+import random
+import re
+import threading
+from hashlib import blake2b
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from . import json_support
+from .decoder import Decoder
+from .error import SerialisationError
+from .hooks import add_hook, remove_hook
+from .typing import (
+    _is_class_with_schema,
+    create_schema,
+    get_origin_type,
+    get_type_args,
+    is_newtype,
+    is_optional,
+    type_name,
+    unpack_optional,
+)
+
+__all__ = [
+    "Capture",
+    "anonymize",
+    "read_captures",
+]
+
+_ASCII_DIGITS = "0123456789"
+_ASCII_LOWERCASE = "abcdefghijklmnopqrstuvwxyz"
+_ASCII_UPPERCASE = _ASCII_LOWERCASE.upper()
+_SEQUENCE_TYPES = {list, set, frozenset, tuple}
+
+# strings of these formats are kept when type of the value is unknown, they are rarely personal data
+# and scrambling them would break decoding of dates, uuids and numbers
+_STRUCTURED_STRING = re.compile(
+    r"^(?:"
+    r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?"  # iso date and datetime
+    r"|\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?"  # iso time
+    r"|-?P(?:\d+[YMWD])*(?:T(?:\d+(?:\.\d+)?[HMS])*)?"  # iso duration
+    r"|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"  # uuid
+    r"|[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"  # number
+    r")$"
+)
+
+
+def _scramble(value: str, salt: bytes) -> str:
+    rng = random.Random(blake2b(value.encode("utf8"), key=salt[:64]).digest())
+    result = []
+    for char in value:
+        if char.isdigit():
+            result.append(rng.choice(_ASCII_DIGITS))
+        elif char.isupper():
+            result.append(rng.choice(_ASCII_UPPERCASE))
+        elif char.isalpha():
+            result.append(rng.choice(_ASCII_LOWERCASE))
+        else:
+            result.append(char)
+
+    return "".join(result)
+
+
+def anonymize(value: Any, a_type: Any = Any, salt: bytes = b"") -> Any:
+    """
+    Replaces characters of string values with random characters of the same class (digit, lower or upper case letter),
+    keeping length, punctuation and structure of the data. Equal strings are replaced with equal strings for the same
+    salt. The type is used to find strings to replace: values of `str` properties (and `Dict[str, ...]` keys) are
+    replaced, values of other known types (dates, enums, uuids) are kept. Strings of unknown type are replaced unless
+    they look like a date, time, duration, uuid or a number.
+    """
+    if isinstance(value, str):
+        if a_type is str:
+            return _scramble(value, salt)
+        if a_type is Any or a_type is object or a_type is None:
+            return value if _STRUCTURED_STRING.match(value) else _scramble(value, salt)
+        return value
+
+    if is_newtype(a_type):
+        return anonymize(value, a_type.__supertype__, salt)
+    if is_optional(a_type) and len(get_type_args(a_type)) == 2:
+        return anonymize(value, unpack_optional(a_type), salt)
+
+    origin_type = get_origin_type(a_type)
+    type_args = get_type_args(a_type)
+    if origin_type is Union:
+        a_type, origin_type, type_args = Any, None, []
+
+    if isinstance(value, list):
+        item_type = type_args[0] if origin_type in _SEQUENCE_TYPES and type_args else Any
+        return [anonymize(item, item_type, salt) for item in value]
+
+    if isinstance(value, dict):
+        if _is_class_with_schema(a_type):
+            schema = create_schema(a_type)
+            return {
+                key: anonymize(item, schema[key].type if key in schema else Any, salt) for key, item in value.items()
+            }
+        key_type, item_type = type_args if origin_type is dict and len(type_args) == 2 else (None, Any)
+        return {
+            (anonymize(key, key_type, salt) if key_type is not None else key): anonymize(item, item_type, salt)
+            for key, item in value.items()
+        }
+
+    return value
+
+
+class Capture:
+    """
+    Samples payloads decoded in production so benchmarks can replay real shapes of data. Inputs of `Decoder.decode`
+    and `json_decode` are picked at the given rate and appended to NDJSON output as `{"type": "module:qualname",
+    "operation": "decode" | "json_decode", "payload": ...}` records, strings anonymized unless `anonymize_strings`
+    is off. Sampling runs between `install` and `uninstall` (or within the context), see `chili.hooks` for how
+    several captures and instrumentations share the patched functions.
+    """
+
+    def __init__(
+        self,
+        output: Union[str, os.PathLike, IO[str]],
+        rate: float = 0.01,
+        anonymize_strings: bool = True,
+        salt: Optional[bytes] = None,
+        seed: Optional[int] = None,
+    ):
+        if not 0.0 <= rate <= 1.0:
+            raise SerialisationError.invalid_input(rate)
+
+        self.rate = rate
+        self.anonymize_strings = anonymize_strings
+        self.salt = os.urandom(16) if salt is None else salt
+        self.captured = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._owns_output = not hasattr(output, "write")
+        self._output: IO[str] = open(output, "a") if self._owns_output else output  # type: ignore
+        self._hooks: List[Tuple[Any, str, Callable]] = []
+
+    def sample(self) -> bool:
+        return self.rate >= 1.0 or self._random.random() < self.rate
+
+    def record(self, a_type: Any, payload: Any, operation: str = "decode") -> None:
+        if self.anonymize_strings:
+            payload = anonymize(payload, a_type, self.salt)
+        line = json.dumps({"type": type_name(a_type), "operation": operation, "payload": payload})
+
+        with self._lock:
+            self._output.write(line + "\n")
+            self.captured += 1
+
+    def _record_safely(self, a_type: Any, payload: Any, operation: str) -> None:
+        try:
+            if operation == "json_decode":
+                payload = json.loads(payload)
+            self.record(a_type, payload, operation)
+        except Exception:  # capturing must never break decoding
+            pass
+
+    def _decode_hook(self, decode: Callable, decoder: Decoder, obj: Any) -> Any:
+        if self.sample():
+            self._record_safely(decoder.__generic__, obj, "decode")
+        return decode(decoder, obj)
+
+    def _json_decode_hook(self, json_decode: Callable, json_str: str, type_hint: Type, *args: Any) -> Any:
+        if self.sample():
+            self._record_safely(type_hint, json_str, "json_decode")
+        return json_decode(json_str, type_hint, *args)
+
+    def install(self) -> Capture:
+        if self._hooks:
+            return self
+
+        self._hooks = [(Decoder, "decode", self._decode_hook), (json_support, "json_decode", self._json_decode_hook)]
+        for owner, name, hook in self._hooks:
+            add_hook(owner, name, hook)
+
+        return self
+
+    def uninstall(self) -> None:
+        for owner, name, hook in self._hooks:
+            remove_hook(owner, name, hook)
+        self._hooks = []
+
+    def close(self) -> None:
+        self.uninstall()
+        with self._lock:
+            if self._owns_output:
+                self._output.close()
+            else:
+                self._output.flush()
+
+    def __enter__(self) -> Capture:
+        return self.install()
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def read_captures(path: Union[str, os.PathLike]) -> Iterator[Dict[str, Any]]:
+    with open(path) as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
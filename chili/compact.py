@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from abc import ABCMeta
+from functools import lru_cache
+from inspect import getattr_static
+from typing import Any, Dict, List, Type, TypeVar
+
+from .typing import create_schema
+
+__all__ = [
+    "compact",
+    "compact_origin",
+    "is_compact",
+]
+
+T = TypeVar("T")
+
+_COMPACT_OF = "__compact_of__"
+_EXCLUDED_ATTRIBUTES = {"__dict__", "__weakref__", "__slots__"}
+
+
+def is_compact(cls: Type) -> bool:
+    return _COMPACT_OF in cls.__dict__
+
+
+def compact_origin(cls: Type) -> Type:
+    """
+    Returns class which passed compact class mirrors, other classes are returned untouched.
+    """
+    return cls.__dict__.get(_COMPACT_OF, cls)
+
+
+def _expand(instance: Any) -> Any:
+    cls = type(instance)
+    if not is_compact(cls):
+        return instance
+
+    origin = cls.__dict__[_COMPACT_OF]
+    expanded = origin.__new__(origin)
+    for name in cls.__slots__:
+        if hasattr(instance, name):
+            object.__setattr__(expanded, name, getattr(instance, name))
+
+    return expanded
+
+
+def _compact_eq(self: Any, other: Any) -> Any:
+    if compact_origin(type(other)) is not compact_origin(type(self)):
+        return NotImplemented
+
+    return _expand(self) == _expand(other)
+
+
+def _storage_names(cls: Type) -> List[str]:
+    names = []
+    for name in create_schema(cls):  # type: ignore
+        attribute = getattr_static(cls, name, None)
+        if isinstance(attribute, property):
+            if attribute.fset is None:
+                names.append(f"_{name}")
+            continue
+        names.append(name)
+
+    return names
+
+
+@lru_cache(maxsize=None)
+def compact(cls: Type[T]) -> Type[T]:
+    """
+    Returns memory-lean mirror of the class: a class with the same attributes, methods and schema, which stores
+    its properties in `__slots__` instead of per-instance `__dict__`. Classes which already have no `__dict__`
+    are returned untouched. The mirror is registered as a virtual subclass of abstract classes, for other classes
+    `isinstance` checks against the original class do not hold. Encoders accept mirrors in place of the original
+    class and instances of both compare equal when their values do.
+    """
+    if not cls.__dictoffset__ or is_compact(cls):
+        return cls
+
+    slots = _storage_names(cls)
+    namespace: Dict[str, Any] = {}
+    for base_class in reversed(cls.__mro__[:-1]):
+        namespace.update(base_class.__dict__)
+
+    for name in _EXCLUDED_ATTRIBUTES | set(slots):
+        namespace.pop(name, None)
+
+    namespace["__slots__"] = tuple(slots)
+    namespace["__qualname__"] = cls.__qualname__
+    namespace["__module__"] = cls.__module__
+    namespace[_COMPACT_OF] = cls
+    if cls.__eq__ is not object.__eq__:
+        namespace["__eq__"] = _compact_eq
+
+    metaclass = type(cls) if issubclass(type(cls), ABCMeta) else type
+    compact_class = metaclass(cls.__name__, (), namespace)
+    if isinstance(cls, ABCMeta):
+        cls.register(compact_class)  # type: ignore
+
+    return compact_class
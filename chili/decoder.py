@@ -1,23 +1,29 @@
 from __future__ import annotations
 
+import binascii
 import collections
 import datetime
 import decimal
 import re
+import struct
 import sys
 import typing
 from abc import abstractmethod
+from array import array
 from base64 import b64decode
 from enum import Enum
 from functools import lru_cache
-from inspect import isclass
+from inspect import getattr_static, isclass
 from ipaddress import IPv4Address, IPv6Address
 from pathlib import Path, PosixPath, PurePath, PurePosixPath, PureWindowsPath, WindowsPath
 from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Pattern,
@@ -38,8 +44,11 @@ from chili.typing import (
     _DECODE_MAPPER,
     _PROPERTIES,
     UNDEFINED,
+    Property,
     TypeSchema,
+    _is_class_with_schema,
     create_schema,
+    get_nested_types,
     get_non_optional_fields,
     get_origin_type,
     get_parameters_map,
@@ -48,6 +57,7 @@ from chili.typing import (
     is_dataclass,
     is_decodable,
     is_enum_type,
+    is_frozen_dataclass,
     is_named_tuple,
     is_newtype,
     is_optional,
@@ -63,9 +73,20 @@ if sys.version_info >= (3, 10):
 else:
     UnionType = None
 
+from .compact import compact as compact_type
 from .error import DecoderError
 from .iso_datetime import parse_iso_date, parse_iso_datetime, parse_iso_duration, parse_iso_time
 from .mapper import Mapper
+from .numpy import from_numpy_column, get_ndarray_dtype, is_ndarray_type, is_temporal_column, require_numpy
+from .projection import (
+    Selection,
+    check_fields,
+    create_selection,
+    restrict_selection,
+    select_fields,
+    select_items,
+    selectable_fields,
+)
 from .state import StateObject
 
 C = TypeVar("C")
@@ -159,11 +180,65 @@ def decodable(_cls=None, mapper: Optional[Mapper] = None) -> Any:
     return _decorate(_cls)
 
 
+PropertySetter = Callable[[Any, Any], None]
+
+
+def _state_setter(name: str) -> PropertySetter:
+    def _set(instance: Any, value: Any) -> None:
+        instance.__dict__[name] = value
+
+    return _set
+
+
+def _setattr_to_state(cls: Type, name: str, _private: bool = True) -> Tuple[str, Optional[PropertySetter]]:
+    """
+    Resolves once per class how the property is assigned, so decoding never has to recover from AttributeError.
+    Returns name of the attribute holding the value and a setter; no setter means plain `setattr` can be used.
+    Read-only properties fall back to their private `_{name}` storage, frozen dataclasses are populated
+    through instance's `__dict__` or slot descriptors.
+    """
+    attribute = getattr_static(cls, name, None)
+
+    if _private and (
+        (isinstance(attribute, property) and attribute.fset is None) or (attribute is None and not cls.__dictoffset__)
+    ):
+        private_name, setter = _setattr_to_state(cls, f"_{name}", False)
+        if attribute is not None or getattr_static(cls, private_name, None) is not None:
+            return private_name, setter
+
+    if not is_frozen_dataclass(cls):
+        return name, None
+
+    if hasattr(type(attribute), "__set__"):
+        return name, attribute.__set__  # type: ignore
+
+    return name, _state_setter(name)
+
+
 class TypeDecoders(Dict[Any, TypeDecoder]):
     def __hash__(self) -> int:  # type: ignore
         return hash(tuple(sorted([str(key) for key in self.keys()])))
 
 
+class ScopedTypeDecoders(TypeDecoders):
+    """
+    Type decoders which keep decoders built with them in their own cache instead of the global cache of decoder
+    builders, so short-lived registries (e.g. created per batch or per decoder instance) are released together
+    with decoders built for them.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._built: Dict[Any, Any] = {}
+
+    def cached(self, key: Any, build: Callable[[], Any]) -> Any:
+        try:
+            return self._built[key]
+        except KeyError:
+            result = self._built[key] = build()
+            return result
+
+
 def ordered_dict(value: List[List[Any]]) -> collections.OrderedDict:
     result = collections.OrderedDict()
     for item in value:
@@ -172,14 +247,137 @@ def ordered_dict(value: List[List[Any]]) -> collections.OrderedDict:
     return result
 
 
+def _unpack_buffer(value: Any, metadata: str, default: Any) -> Tuple[Any, Any]:
+    if isinstance(value, dict):
+        if metadata not in value or "data" not in value:
+            raise DecoderError.invalid_input(value)
+        return value[metadata], value["data"]
+
+    if default is None:
+        raise DecoderError.invalid_input(value)
+
+    return default, value
+
+
+def _flatten(items: List[Any]) -> Iterator[Any]:
+    for item in items:
+        if isinstance(item, list):
+            yield from _flatten(item)
+        else:
+            yield item
+
+
+def _native_struct_code(item_format: str) -> Tuple[str, bool]:
+    """
+    Returns native struct code of the item format and whether raw buffer of the format has to be byte swapped,
+    memoryviews can only hold items of native formats.
+    """
+    order, code = (
+        (item_format[0], item_format[1:]) if item_format[:1] in ("@", "=", "<", ">", "!") else ("@", item_format)
+    )
+    if len(code) != 1 or (order != "@" and struct.calcsize(item_format) != struct.calcsize(code)):
+        raise DecoderError.invalid_input(item_format)
+
+    return code, order in ("<", ">", "!") and (order == "<") != (sys.byteorder == "little")
+
+
+class ArrayDecoder(TypeDecoder):
+    """
+    Decodes value produced by `ArrayEncoder` into `array.array`, raw buffers are copied with a single
+    `array.frombytes` call. Decoder created with a typecode accepts bare list or base64 string as well.
+    """
+
+    def __init__(self, typecode: Optional[str] = None):
+        self.typecode = typecode
+
+    def decode(self, value: Any) -> array:
+        typecode, data = _unpack_buffer(value, "typecode", self.typecode)
+        try:
+            if isinstance(data, (str, bytes)):
+                result = array(typecode)
+                result.frombytes(b64decode(data))
+                return result
+            return array(typecode, data)
+        except (binascii.Error, TypeError, ValueError) as error:
+            raise DecoderError.invalid_input(value) from error
+
+
+class MemoryviewDecoder(TypeDecoder):
+    """
+    Decodes value produced by `MemoryviewEncoder` into `memoryview` of its struct format and shape. Formats with
+    explicit byte order are decoded into views of the matching native format. Decoder created with a format
+    accepts bare list or base64 string as well.
+    """
+
+    def __init__(self, item_format: Optional[str] = None):
+        self.item_format = item_format
+
+    def decode(self, value: Any) -> memoryview:
+        item_format, data = _unpack_buffer(value, "format", self.item_format)
+        shape = value.get("shape") if isinstance(value, dict) else None
+        code, swap = _native_struct_code(item_format)
+        try:
+            if isinstance(data, (str, bytes)):
+                raw = b64decode(data)
+                if swap:
+                    items = array(code, raw)
+                    items.byteswap()
+                    raw = items.tobytes()
+            else:
+                values = list(_flatten(data))
+                raw = struct.pack(f"{len(values)}{code}", *values)
+            view = memoryview(raw)
+            if shape and len(shape) > 1 and all(shape):
+                return view.cast(code, shape)
+            return view.cast(code)
+        except (binascii.Error, struct.error, TypeError, ValueError) as error:
+            raise DecoderError.invalid_input(value) from error
+
+
+class NdarrayDecoder(TypeDecoder):
+    """
+    Decodes value produced by `NdarrayEncoder` into `numpy.ndarray`, dtype passed to the decoder (taken from
+    `numpy.typing.NDArray[scalar]` annotation) takes precedence over stored one. Arrays decoded from raw buffers
+    share memory with decoded bytes and are read-only. Decoder created with dtype accepts bare list or base64
+    string as well, bare lists are decoded with dtype inferred by numpy otherwise.
+    """
+
+    def __init__(self, dtype: Any = None, shape: Optional[Tuple[int, ...]] = None):
+        self.dtype = dtype
+        self.shape = shape
+
+    def decode(self, value: Any) -> Any:
+        numpy = require_numpy()
+        shape = self.shape
+        if isinstance(value, dict):
+            dtype, data = _unpack_buffer(value, "dtype", None)
+            shape = value.get("shape", shape)
+        else:
+            dtype, data = self.dtype, value
+        if dtype is None and isinstance(data, (str, bytes)):
+            raise DecoderError.invalid_input(value)
+        try:
+            if isinstance(data, (str, bytes)):
+                result = numpy.frombuffer(b64decode(data), dtype=dtype)
+            else:
+                result = numpy.array(data, dtype=dtype)
+            if self.dtype is not None:
+                result = result.astype(self.dtype, copy=False)
+            return result if shape is None else result.reshape(shape)
+        except (binascii.Error, TypeError, ValueError) as error:
+            raise DecoderError.invalid_input(value) from error
+
+
 _builtin_type_decoders = TypeDecoders(
     {
         bool: SimpleDecoder[bool](bool),
         int: SimpleDecoder[int](int),
         float: SimpleDecoder[float](float),
         str: SimpleDecoder[str](str),
-        bytes: SimpleDecoder[bytes](lambda value: b64decode(value.encode("utf8"))),
-        bytearray: SimpleDecoder[bytearray](lambda value: bytearray(b64decode(value.encode("utf8")))),
+        bytes: SimpleDecoder[bytes](b64decode),
+        bytearray: SimpleDecoder[bytearray](lambda value: bytearray(b64decode(value))),
+        memoryview: SimpleDecoder[memoryview](lambda value: memoryview(b64decode(value))),
+        array: ArrayDecoder(),
         list: SimpleDecoder[list](list),
         set: SimpleDecoder[set](set),
         frozenset: SimpleDecoder[frozenset](frozenset),
@@ -233,6 +431,7 @@ class TupleDecoder(TypeDecoder):
     def __init__(self, items_decoder: List[Union[TypeDecoder, Any]]):
         self.items_decoder = items_decoder
         self._variadic = items_decoder[-1] is Ellipsis
+        self._variadic_decoders = items_decoder[:-1]
 
     def decode(self, value: Sequence) -> Tuple:
         if self._variadic:
@@ -241,7 +440,7 @@ class TupleDecoder(TypeDecoder):
 
     def _decode_variadic(self, value: Sequence) -> Tuple:
         result = []
-        type_decoders = self.items_decoder[:-1]
+        type_decoders = self._variadic_decoders
         num_decoders = len(type_decoders)
 
         for index, item in enumerate(value):
@@ -277,6 +476,8 @@ class OrderedDictDecoder(TypeDecoder):
 
 
 class UnionDecoder(TypeDecoder):
+    _type_decoders: Dict[Type, Any]  # primitive types are decoded by calling the type itself
+    _class_decoders: List[Tuple[FrozenSet[str], TypeDecoder]]
     _PRIMITIVE_TYPES = {int, float, bool, str}
     _TRANSFORMABLE_TYPES = {
         datetime.time,
@@ -286,20 +487,19 @@ class UnionDecoder(TypeDecoder):
         bytearray,
     }
     _CASTABLES_TYPES = {decimal.Decimal}
+    _CASTED_TYPES = {int, str}
 
     def __init__(self, valid_types: List[Type], extra_decoders: TypeDecoders = None, force: bool = False):
         self.valid_types = valid_types
+        self._extra_decoders = extra_decoders
+        self.force = force
         self._type_decoders = {}
 
         for a_type in valid_types:
             if a_type in self._PRIMITIVE_TYPES:
                 self._type_decoders[a_type] = a_type
                 continue
-            self._type_decoders[a_type] = build_type_decoder(
-                a_type, extra_decoders=extra_decoders, force=force  # type: ignore
-            )
-
-        self.force = force
+            self._type_decoders[a_type] = self._build_type_decoder(a_type)
 
     def decode(self, value: Any) -> Any:
         passed_type = type(value)
@@ -307,7 +507,7 @@ class UnionDecoder(TypeDecoder):
         if passed_type in self._PRIMITIVE_TYPES:
             return self._type_decoders.get(passed_type, str)(value)
 
-        if passed_type in {int, str}:
+        if passed_type in self._CASTED_TYPES:
             for castable, decoder in self._type_decoders.items():
                 try:
                     return castable(value)
@@ -322,28 +522,20 @@ class UnionDecoder(TypeDecoder):
                     continue
 
         if passed_type is dict:
-            provided_fields = set(value.keys())
-            if self.force:
-                decoders = self._type_decoders
-            else:
-                decoders = {
-                    class_name: decoder
-                    for class_name, decoder in self._type_decoders.items()
-                    if is_decodable(class_name) or is_dataclass(class_name)
-                }
+            if not hasattr(self, "_class_decoders"):
+                self._class_decoders = self._build_class_decoders()
+            provided_fields = value.keys()
             # Greedy matching
-            for class_name, decoder in decoders.items():
-                expected_fields = set(get_non_optional_fields(class_name))
-                if not provided_fields.issubset(expected_fields):
+            for expected_fields, decoder in self._class_decoders:
+                if not provided_fields <= expected_fields:
                     continue
                 try:
                     return decoder.decode(value)
                 except Exception:
                     continue
             # Non-greedy matching
-            for class_name, decoder in decoders.items():
-                expected_fields = set(get_non_optional_fields(class_name))
-                if not expected_fields.issubset(provided_fields):
+            for expected_fields, decoder in self._class_decoders:
+                if not provided_fields >= expected_fields:
                     continue
                 try:
                     return decoder.decode(value)
@@ -352,6 +544,43 @@ class UnionDecoder(TypeDecoder):
 
         raise DecoderError.invalid_input(value)
 
+    def _build_type_decoder(self, a_type: Type) -> TypeDecoder:
+        return build_type_decoder(a_type, extra_decoders=self._extra_decoders, force=self.force)  # type: ignore
+
+    def _build_class_decoders(self) -> List[Tuple[FrozenSet[str], TypeDecoder]]:
+        return [
+            (frozenset(get_non_optional_fields(class_name)), decoder)
+            for class_name, decoder in self._type_decoders.items()
+            if is_class(class_name) and (self.force or is_decodable(class_name) or is_dataclass(class_name))
+        ]
+
+
+class ProjectedUnionDecoder(UnionDecoder):
+    """
+    Decodes members of the union with selection restricted to fields declared by each member.
+    """
+
+    def __init__(
+        self,
+        valid_types: List[Type],
+        selection: Optional[Selection],
+        extra_decoders: TypeDecoders = None,
+        force: bool = False,
+    ):
+        self._selection = selection
+        self._member_fields = {a_type: selectable_fields(a_type) for a_type in valid_types}
+        check_fields(selection, {name for names in self._member_fields.values() for name in names or ()})
+        super().__init__(valid_types, extra_decoders, force)
+
+    def _build_type_decoder(self, a_type: Type) -> TypeDecoder:
+        names = self._member_fields.get(a_type)
+        if names is None:
+            return super()._build_type_decoder(a_type)
+
+        return build_projected_type_decoder(
+            a_type, restrict_selection(self._selection, names), self._extra_decoders, None, self.force
+        )
+
 
 class ClassDecoder(TypeDecoder):
     _fields: Dict[str, TypeDecoder]
@@ -367,17 +596,33 @@ class ClassDecoder(TypeDecoder):
         if not isinstance(value, dict):
             raise DecoderError.invalid_input
 
-        if not hasattr(self, "_fields"):
-            self._fields = self._build()
-
         instance = self.class_name.__new__(self.class_name)  # type: ignore
 
-        for key, prop in self._schema.items():
-            prop_value = (
-                self._fields[key].decode(value[key]) if key in value else getattr(prop, "default_value", UNDEFINED)
-            )
-            if prop_value is not UNDEFINED:
-                setattr(instance, key, prop_value)
+        return self._populate(instance, value)
+
+    def decode_into(self, instance: Any, value: StateObject, partial: bool = True) -> Any:
+        if not isinstance(value, dict) or not isinstance(instance, self.class_name):
+            raise DecoderError.invalid_input
+
+        return self._populate(instance, value, partial)
+
+    def _populate(self, instance: Any, value: Dict[str, Any], partial: bool = False) -> Any:
+        if not hasattr(self, "_plan"):
+            self._plan = self._build_plan()
+
+        for key, prop, decoder, attribute, setter in self._plan:
+            if key in value:
+                prop_value = decoder.decode(value[key])
+            elif partial:
+                continue
+            else:
+                prop_value = prop.default_value
+            if prop_value is UNDEFINED:
+                continue
+            if setter is None:
+                setattr(instance, attribute, prop_value)
+            else:
+                setter(instance, prop_value)
 
         if hasattr(instance, "__post_init__"):
             instance.__post_init__()
@@ -387,6 +632,15 @@ class ClassDecoder(TypeDecoder):
     def _build(self) -> Dict[str, TypeDecoder]:
         return {name: self._build_type_decoder(field.type) for name, field in self._schema.items()}
 
+    def _build_plan(self) -> List[Tuple[str, Property, TypeDecoder, str, Optional[PropertySetter]]]:
+        if not hasattr(self, "_fields"):
+            self._fields = self._build()
+
+        return [
+            (key, prop, self._fields[key], *_setattr_to_state(self.class_name, key))  # type: ignore
+            for key, prop in self._schema.items()
+        ]
+
     def _build_type_decoder(self, a_type: Type) -> TypeDecoder:
         return build_type_decoder(a_type, self._extra_decoders, self.class_name.__module__, self.force)  # type: ignore
 
@@ -485,9 +739,20 @@ _supported_generics = {
 }
 
 
-@lru_cache(maxsize=None)
 def build_type_decoder(
     a_type: Type, extra_decoders: TypeDecoders = None, module: Any = None, force: bool = False
+) -> TypeDecoder:
+    if isinstance(extra_decoders, ScopedTypeDecoders):
+        return extra_decoders.cached(
+            (build_type_decoder, a_type, module, force),
+            lambda: _create_type_decoder(a_type, extra_decoders, module, force),
+        )
+
+    return _cached_type_decoder(a_type, extra_decoders, module, force)  # type: ignore
+
+
+def _create_type_decoder(
+    a_type: Type, extra_decoders: TypeDecoders = None, module: Any = None, force: bool = False
 ) -> TypeDecoder:
     if extra_decoders and a_type in extra_decoders:
         return extra_decoders[a_type]
@@ -497,6 +762,9 @@ def build_type_decoder(
 
     origin_type = get_origin_type(a_type)
 
+    if is_ndarray_type(origin_type or a_type):
+        return NdarrayDecoder(get_ndarray_dtype(a_type))
+
     if origin_type is None and is_dataclass(a_type):
         if issubclass(a_type, Generic):  # type: ignore
             raise DecoderError.invalid_type
@@ -571,54 +839,326 @@ def build_type_decoder(
     return _supported_generics[origin_type](type_attributes)  # type: ignore
 
 
+def build_compact_decoders(a_type: Type, extra_decoders: TypeDecoders = None) -> Optional[TypeDecoders]:
+    """
+    Returns decoders which create compact instances of the type and of classes nested in its properties.
+    Decoders passed in `extra_decoders` take precedence.
+    """
+    if isinstance(extra_decoders, ScopedTypeDecoders):
+        return extra_decoders.cached(
+            (build_compact_decoders, a_type), lambda: _create_compact_decoders(a_type, extra_decoders)
+        )
+
+    return _cached_compact_decoders(a_type, extra_decoders)  # type: ignore
+
+
+def _create_compact_decoders(a_type: Type, extra_decoders: TypeDecoders = None) -> Optional[TypeDecoders]:
+    classes = [
+        nested_type
+        for nested_type in get_nested_types(a_type)
+        if _is_class_with_schema(nested_type)
+        and not issubclass(nested_type, Generic)  # type: ignore
+        and not (extra_decoders and nested_type in extra_decoders)
+    ]
+    if not classes:
+        return extra_decoders
+
+    decoders = type(extra_decoders)(extra_decoders) if extra_decoders else TypeDecoders()
+    for class_type in classes:
+        if is_dataclass(class_type):
+            decoders[class_type] = ClassDecoder(compact_type(class_type), decoders, force=True)  # type: ignore
+        else:
+            decoders[class_type] = Decoder[class_type](decoders=decoders, compact=True)  # type: ignore
+
+    return decoders
+
+
+_cached_type_decoder = lru_cache(maxsize=None)(_create_type_decoder)
+_cached_compact_decoders = lru_cache(maxsize=None)(_create_compact_decoders)
+
+
+@lru_cache(maxsize=None)
+def row_type(a_type: Type, names: Optional[Tuple[str, ...]] = None) -> Any:
+    """
+    Returns named tuple type with fields of passed type's schema, used for rows produced by `Decoder.decode_rows`.
+    When `names` are passed, the named tuple holds only these fields.
+    """
+    if names is None:
+        names = tuple(create_schema(a_type).keys())  # type: ignore
+
+    if is_named_tuple(a_type) and a_type._fields == names:
+        return a_type
+
+    return collections.namedtuple(f"{a_type.__name__}Row", names, rename=True)
+
+
+class ProjectedClassDecoder(ClassDecoder):
+    def __init__(
+        self,
+        class_name: Type,
+        selection: Optional[Selection],
+        extra_decoders: TypeDecoders = None,
+        force: bool = False,
+    ):
+        # parametrized generic classes are decoded as their origin class with type variables of fields mapped
+        self._generic_parameters = get_parameters_map(class_name) if get_origin_type(class_name) else {}
+        super().__init__(get_origin_type(class_name) or class_name, extra_decoders, force)
+        self._selection = dict(select_fields(selection, self._schema.keys()))
+        self._schema = TypeSchema({name: prop for name, prop in self._schema.items() if name in self._selection})
+
+    def _build(self) -> Dict[str, TypeDecoder]:
+        return {
+            name: build_projected_type_decoder(
+                map_generic_type(field.type, self._generic_parameters),
+                self._selection[name],
+                self._extra_decoders,
+                self.class_name.__module__,
+                self.force,
+            )
+            for name, field in self._schema.items()
+        }
+
+
+def build_projected_type_decoder(
+    a_type: Type,
+    selection: Optional[Selection],
+    extra_decoders: TypeDecoders = None,
+    module: Any = None,
+    force: bool = False,
+) -> TypeDecoder:
+    """
+    Builds decoder which decodes only selected properties of classes reachable from the type,
+    unselected subtrees are never visited and unselected properties are not assigned.
+    """
+    if isinstance(extra_decoders, ScopedTypeDecoders):
+        return extra_decoders.cached(
+            (build_projected_type_decoder, a_type, selection, module, force),
+            lambda: _create_projected_type_decoder(a_type, selection, extra_decoders, module, force),
+        )
+
+    return _cached_projected_type_decoder(a_type, selection, extra_decoders, module, force)  # type: ignore
+
+
+def _create_projected_type_decoder(
+    a_type: Type,
+    selection: Optional[Selection],
+    extra_decoders: TypeDecoders = None,
+    module: Any = None,
+    force: bool = False,
+) -> TypeDecoder:
+    if selection is None or (extra_decoders and a_type in extra_decoders):
+        return build_type_decoder(a_type, extra_decoders, module, force)
+
+    if is_newtype(a_type):
+        return build_projected_type_decoder(a_type.__supertype__, selection, extra_decoders, module, force)
+
+    origin_type = get_origin_type(a_type)
+    type_args = get_type_args(a_type)
+
+    if is_optional(a_type) and len(type_args) == 2:
+        return OptionalTypeDecoder(
+            build_projected_type_decoder(unpack_optional(a_type), selection, extra_decoders, module, force)
+        )
+
+    if origin_type is None and is_class(a_type):
+        if is_dataclass(a_type) and not issubclass(a_type, Generic):  # type: ignore
+            return ProjectedClassDecoder(a_type, selection, extra_decoders, force)
+        if hasattr(a_type, _PROPERTIES):
+            decoder = Decoder[a_type](decoders=extra_decoders)  # type: ignore[valid-type]
+            decoder.selection = selection
+            return decoder
+
+    if origin_type is not None and is_dataclass(origin_type) and issubclass(origin_type, Generic):  # type: ignore
+        return ProjectedClassDecoder(a_type, selection, extra_decoders, force)
+
+    if origin_type is Union or (UnionType and isinstance(origin_type, UnionType)):
+        return ProjectedUnionDecoder(type_args, selection, extra_decoders, force)
+
+    if origin_type in _supported_generics and type_args:
+        item_selection = select_items(selection)
+        type_attributes: List[Any] = [
+            ...
+            if subtype is ...
+            else build_type_decoder(subtype, extra_decoders, module, force)
+            if index == 0 and origin_type in (dict, collections.OrderedDict)
+            else build_projected_type_decoder(subtype, item_selection, extra_decoders, module, force)
+            for index, subtype in enumerate(type_args)
+        ]
+        if len(type_attributes) == 1:
+            return _supported_generics[origin_type](type_attributes[0])  # type: ignore
+        return _supported_generics[origin_type](type_attributes)  # type: ignore
+
+    raise DecoderError.invalid_input(f"cannot select fields of {a_type}")
+
+
+_cached_projected_type_decoder = lru_cache(maxsize=None)(_create_projected_type_decoder)
+
+
 class Decoder(Generic[T]):
     __generic__: Type[T]
     _decoders: Dict[str, TypeDecoder]
 
-    def __init__(self, decoders: Union[TypeDecoders, Dict[Any, TypeDecoder]] = None, mapper: Optional[Mapper] = None):
+    def __init__(
+        self,
+        decoders: Union[TypeDecoders, Dict[Any, TypeDecoder]] = None,
+        mapper: Optional[Mapper] = None,
+        compact: bool = False,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ):
         if decoders and not isinstance(decoders, TypeDecoders):
             decoders = TypeDecoders(decoders)
         self.decode_mapper = mapper
         self.type_decoders = decoders
+        self.compact = compact
+        self.selection = create_selection(only, exclude)
 
     @property
     def schema(self) -> TypeSchema:
         return getattr(self.__generic__, _PROPERTIES)
 
+    @property
+    def instance_type(self) -> Type[T]:
+        if self.compact:
+            return compact_type(self.__generic__)  # type: ignore
+        return self.__generic__
+
     def decode(self, obj: Dict[str, StateObject]) -> T:
-        if not hasattr(self, "_decoders"):
-            self._decoders = self._build_decoders()
+        if not hasattr(self, "_decode_plan"):
+            self._decode_plan = self._build_plan()
+
+        instance = self._instance_type.__new__(self._instance_type)
+
+        return self._populate(instance, obj)
+
+    def decode_into(self, instance: T, obj: Dict[str, StateObject], partial: bool = True) -> T:
+        """
+        Decodes passed dictionary into an existing instance. When `partial` is set only properties present
+        in the dictionary are assigned, otherwise missing properties are handled in the same way as in `decode`.
+        """
+        if not hasattr(self, "_decode_plan"):
+            self._decode_plan = self._build_plan()
+
+        if not isinstance(instance, self._instance_type):
+            raise DecoderError.invalid_input(instance)
+
+        return self._populate(instance, obj, partial)
+
+    def decode_rows(self, rows: Iterable[Dict[str, StateObject]], named: bool = False) -> List[tuple]:
+        """
+        Decodes passed dictionaries into tuples holding decoded values in schema order, without creating instances.
+        When `named` is set, rows are instances of named tuple generated for the decoded type.
+        """
+        if not hasattr(self, "_decode_plan"):
+            self._decode_plan = self._build_plan()
+
+        decode_row = self._decode_row
+        if named:
+            names = tuple(name for name, *_ in self._decode_plan)
+            make_row = row_type(self.__generic__, names)._make  # type: ignore
+            return [make_row(decode_row(row)) for row in rows]
+
+        return [tuple(decode_row(row)) for row in rows]
+
+    def decode_columns(self, columns: Dict[str, Sequence[StateObject]]) -> List[T]:
+        """
+        Decodes columns, a dictionary holding list of values for every property, into list of instances.
+        Columns may be numpy arrays. Mappers are not applied.
+        """
+        if not hasattr(self, "_decode_plan"):
+            self._decode_plan = self._build_plan()
+
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise DecoderError.invalid_input(columns)
+        length = lengths.pop() if lengths else 0
+
+        instance_type = self._instance_type
+        instances = [instance_type.__new__(instance_type) for _ in range(length)]
+
+        for key, prop, decoder, attribute, setter in self._decode_plan:
+            if key not in columns:
+                values = [self._default_value(key, prop) for _ in range(length)]
+            elif is_temporal_column(columns[key]):
+                values = from_numpy_column(columns[key])
+            else:
+                values = [decoder.decode(value) for value in from_numpy_column(columns[key])]
+
+            if setter is None:
+                for instance, value in zip(instances, values):
+                    setattr(instance, attribute, value)
+            else:
+                for instance, value in zip(instances, values):
+                    setter(instance, value)
+
+        return instances
+
+    def _decode_row(self, obj: Dict[str, StateObject]) -> List[Any]:
+        obj = self._map(obj)
+
+        return [
+            decoder.decode(obj[key]) if key in obj else self._default_value(key, prop)
+            for key, prop, decoder, _, _ in self._decode_plan
+        ]
+
+    @staticmethod
+    def _default_value(key: str, prop: Property) -> Any:
+        if is_optional(prop.type):
+            return prop.default_value
 
-        instance = self.__generic__.__new__(self.__generic__)
+        raise DecoderError.missing_property(key=key)
 
-        if hasattr(self.__generic__, _DECODE_MAPPER):
-            mapper = getattr(self.__generic__, _DECODE_MAPPER)
-            obj = mapper.map(obj)
-        elif self.decode_mapper:
-            obj = self.decode_mapper.map(obj)
+    def _map(self, obj: Dict[str, StateObject], partial: bool = False) -> Dict[str, StateObject]:
+        mapper = getattr(self.__generic__, _DECODE_MAPPER, None)
+        if mapper is not None:
+            return mapper.map(obj, skip_keys=partial)
+        if self.decode_mapper:
+            return self.decode_mapper.map(obj, skip_keys=partial)
 
-        for key, prop in self.schema.items():
-            if key not in obj:
-                if is_optional(prop.type):
-                    value = prop.default_value
-                else:
-                    raise DecoderError.missing_property(key=key)
+        return obj
+
+    def _populate(self, instance: T, obj: Dict[str, StateObject], partial: bool = False) -> T:
+        if not hasattr(self, "_decode_plan"):
+            self._decode_plan = self._build_plan()
+
+        obj = self._map(obj, partial)
+
+        for key, prop, decoder, attribute, setter in self._decode_plan:
+            if key in obj:
+                value = decoder.decode(obj[key])
+            elif partial:
+                continue
             else:
-                value = self._decoders[prop.name].decode(obj[key])
+                value = self._default_value(key, prop)
 
-            try:
-                setattr(instance, prop.name, value)
-            except AttributeError:
-                setattr(instance, f"_{prop.name}", value)
+            if setter is None:
+                setattr(instance, attribute, value)
+            else:
+                setter(instance, value)
 
         return instance
 
+    def _build_plan(self) -> List[Tuple[str, Property, TypeDecoder, str, Optional[PropertySetter]]]:
+        if not hasattr(self, "_decoders"):
+            self._decoders = self._build_decoders()
+        self._instance_type = self.instance_type
+
+        return [
+            (name, self.schema[name], decoder, *_setattr_to_state(self._instance_type, name))  # type: ignore
+            for name, decoder in self._decoders.items()
+        ]
+
     def _build_decoders(self) -> Dict[str, TypeDecoder]:
         schema: TypeSchema = getattr(self.__generic__, _PROPERTIES)
+        extra_decoders = self.type_decoders
+        if self.compact:
+            extra_decoders = build_compact_decoders(self.__generic__, self.type_decoders)  # type: ignore
 
         return {
-            prop.name: build_type_decoder(prop.type, extra_decoders=self.type_decoders, force=True)  # type: ignore
-            for prop in schema.values()
+            name: build_projected_type_decoder(
+                schema[name].type, selection, extra_decoders=extra_decoders, force=True  # type: ignore
+            )
+            for name, selection in select_fields(self.selection, schema.keys())
         }
 
     @classmethod
@@ -642,12 +1182,19 @@ class Decoder(Generic[T]):
 
 
 def decode(
-    obj: StateObject, a_type: Type[T], decoders: Union[TypeDecoders, Dict[Any, TypeDecoder]] = None, force: bool = False
+    obj: StateObject,
+    a_type: Type[T],
+    decoders: Union[TypeDecoders, Dict[Any, TypeDecoder]] = None,
+    force: bool = False,
+    only: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
 ) -> T:
     if decoders and not isinstance(decoders, TypeDecoders):
         decoders = TypeDecoders(decoders)
 
-    decoder = build_type_decoder(a_type, extra_decoders=decoders, force=force)  # type: ignore
+    decoder = build_projected_type_decoder(
+        a_type, create_selection(only, exclude), extra_decoders=decoders, force=force  # type: ignore
+    )
     if decoder is None:
         raise DecoderError.invalid_type
 
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import re
+from contextlib import contextmanager
+from enum import Enum
+from ipaddress import IPv4Address, IPv6Address
+from pathlib import PurePath
+from typing import Any, Dict, Hashable, Iterator, Optional, Pattern, Set, Type, Union
+from uuid import UUID
+
+from .decoder import ScopedTypeDecoders, TypeDecoder, TypeDecoders, build_type_decoder
+from .typing import (
+    create_schema,
+    get_nested_types,
+    get_origin_type,
+    get_type_args,
+    is_class,
+    is_frozen_dataclass,
+    is_named_tuple,
+    is_newtype,
+)
+
+__all__ = [
+    "CanonicalDecoder",
+    "DeduplicatingDecoder",
+    "is_immutable_type",
+]
+
+_IMMUTABLE_TYPES = {
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    decimal.Decimal,
+    datetime.date,
+    datetime.datetime,
+    datetime.time,
+    datetime.timedelta,
+    UUID,
+    IPv4Address,
+    IPv6Address,
+    Pattern,
+    re.Pattern,
+}
+_IMMUTABLE_CONTAINERS = {tuple, frozenset, Union}
+
+
+def is_immutable_type(a_type: Type, _visiting: Optional[Set[Any]] = None) -> bool:
+    """
+    Tells whether instances of the type are deeply immutable, so equal instances can be safely shared.
+    Frozen dataclasses and named tuples qualify only when all their properties are immutable as well.
+    """
+    if a_type in _IMMUTABLE_TYPES:
+        return True
+
+    if is_newtype(a_type):
+        return is_immutable_type(a_type.__supertype__, _visiting)
+
+    origin_type = get_origin_type(a_type)
+    if origin_type is not None:
+        return origin_type in _IMMUTABLE_CONTAINERS and all(
+            type_arg is Ellipsis or is_immutable_type(type_arg, _visiting) for type_arg in get_type_args(a_type)
+        )
+
+    if not is_class(a_type):
+        return False
+
+    if issubclass(a_type, (Enum, PurePath)):
+        return True
+
+    if not (is_frozen_dataclass(a_type) or is_named_tuple(a_type)):
+        return False
+
+    _visiting = _visiting if _visiting is not None else set()
+    if a_type in _visiting:
+        return True
+    _visiting.add(a_type)
+
+    return all(is_immutable_type(prop.type, _visiting) for prop in create_schema(a_type).values())  # type: ignore
+
+
+def _content_key(value: Any) -> Hashable:
+    value_type = type(value)
+    if value_type is dict:
+        return dict, tuple((key, _content_key(item)) for key, item in value.items())
+    if value_type is list or value_type is tuple:
+        return list, tuple(_content_key(item) for item in value)
+    if value_type is float or value_type is bool:
+        return value_type, value
+
+    return value
+
+
+class CanonicalDecoder(TypeDecoder):
+    """
+    Decodes immutable type through a content-keyed cache, so equal input values are decoded into the same instance.
+    """
+
+    def __init__(self, a_type: Type, decoders: TypeDecoders, cache: Dict[Hashable, Any]):
+        self.a_type = a_type
+        self._decoders = decoders
+        self._cache = cache
+        self._decoder: Optional[TypeDecoder] = None
+
+    def decode(self, value: Any) -> Any:
+        if self._decoder is None:
+            self._decoder = build_type_decoder(
+                self.a_type,
+                ScopedTypeDecoders({key: decoder for key, decoder in self._decoders.items() if key is not self.a_type}),
+            )
+        try:
+            key = (self.a_type, _content_key(value))
+            return self._cache[key]
+        except KeyError:
+            result = self._cache[key] = self._decoder.decode(value)
+            return result
+        except TypeError:
+            return self._decoder.decode(value)
+
+
+class DeduplicatingDecoder(TypeDecoder):
+    """
+    Decodes passed type, canonicalising equal sub-structures of immutable types (frozen dataclasses, named tuples
+    and tuples) into shared instances. Instances are shared within a single `decode` call, or across all calls
+    made inside the `batch()` context.
+    """
+
+    def __init__(self, a_type: Type, decoders: Union[TypeDecoders, Dict[Any, TypeDecoder]] = None, force: bool = False):
+        self.a_type = a_type
+        self._cache: Dict[Hashable, Any] = {}
+        self._batch_depth = 0
+
+        # decoders built for this instance are cached in the registry, so they are released together with it
+        registry = ScopedTypeDecoders(decoders or {})
+        for nested_type in get_nested_types(a_type):
+            if nested_type not in registry and is_immutable_type(nested_type) and _is_structured(nested_type):
+                registry[nested_type] = CanonicalDecoder(nested_type, registry, self._cache)
+
+        self.type_decoders = registry
+        self._decoder = build_type_decoder(a_type, registry, force=force)  # type: ignore
+
+    def decode(self, value: Any) -> Any:
+        try:
+            return self._decoder.decode(value)
+        finally:
+            if not self._batch_depth:
+                self._cache.clear()
+
+    @contextmanager
+    def batch(self) -> Iterator[DeduplicatingDecoder]:
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._cache.clear()
+
+
+def _is_structured(a_type: Type) -> bool:
+    # scalars are cheap to decode and are better handled by interning
+    origin_type = get_origin_type(a_type)
+    if origin_type is not None:
+        return origin_type in (tuple, frozenset)
+
+    return is_class(a_type) and (is_frozen_dataclass(a_type) or is_named_tuple(a_type))
@@ -7,21 +7,40 @@ import re
 import sys
 import typing
 from abc import abstractmethod
+from array import array
 from base64 import b64encode
 from enum import Enum
 from functools import lru_cache
 from inspect import isclass
 from ipaddress import IPv4Address, IPv6Address
 from pathlib import Path, PosixPath, PurePath, PurePosixPath, PureWindowsPath, WindowsPath
-from typing import Any, Callable, Dict, Generic, List, Pattern, Protocol, Tuple, Type, TypeVar, Union, final
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Pattern,
+    Protocol,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    final,
+)
 from uuid import UUID
 
 from chili.typing import (
     _ENCODABLE,
     _ENCODE_MAPPER,
     _PROPERTIES,
+    _VIEW_DATA,
+    _VIEW_OF,
     UNDEFINED,
     Optional,
+    Property,
     TypeSchema,
     create_schema,
     get_origin_type,
@@ -45,9 +64,23 @@ if sys.version_info >= (3, 10):
 else:
     UnionType = None
 
+from .compact import compact_origin
 from .error import EncoderError
 from .iso_datetime import timedelta_to_iso_duration
 from .mapper import Mapper
+from .numpy import get_numpy_dtype, is_ndarray_type, require_numpy, to_numpy_column
+from .projection import (
+    OmitOptions,
+    Selection,
+    check_fields,
+    compile_omit_check,
+    create_omit_options,
+    create_selection,
+    restrict_selection,
+    select_fields,
+    select_items,
+    selectable_fields,
+)
 from .state import StateObject
 
 C = TypeVar("C")
@@ -139,6 +172,71 @@ def ordered_dict(value: collections.OrderedDict) -> List[List[Any]]:
     return result
 
 
+class BufferFormat(Enum):
+    LIST = "list"
+    BASE64 = "base64"
+
+
+def _encode_buffer_data(value: Any, buffer_format: BufferFormat) -> Union[List[Any], str]:
+    if buffer_format is BufferFormat.BASE64:
+        return b64encode(value).decode("ascii")
+
+    return value.tolist()
+
+
+class ArrayEncoder(TypeEncoder):
+    """
+    Encodes `array.array` into `{"typecode": ..., "data": ...}`, data is either a list of numbers or base64 string
+    holding raw (machine-native) buffer.
+    """
+
+    def __init__(self, buffer_format: BufferFormat = BufferFormat.LIST):
+        self.buffer_format = buffer_format
+
+    def encode(self, value: array) -> Dict[str, Any]:
+        return {"typecode": value.typecode, "data": _encode_buffer_data(value, self.buffer_format)}
+
+
+class MemoryviewEncoder(TypeEncoder):
+    """
+    Encodes typed `memoryview` into `{"format": ..., "shape": [...], "data": ...}`, data is either a (nested for
+    multidimensional views) list of items or base64 string holding raw buffer. Memoryviews are encoded as bytes
+    by default, the encoder has to be registered for fields holding typed views.
+    """
+
+    def __init__(self, buffer_format: BufferFormat = BufferFormat.LIST):
+        self.buffer_format = buffer_format
+
+    def encode(self, value: memoryview) -> Dict[str, Any]:
+        data = value if self.buffer_format is BufferFormat.LIST or value.c_contiguous else value.tobytes()
+
+        return {
+            "format": value.format,
+            "shape": list(value.shape or ()),
+            "data": _encode_buffer_data(data, self.buffer_format),
+        }
+
+
+class NdarrayEncoder(TypeEncoder):
+    """
+    Encodes `numpy.ndarray` into `{"dtype": ..., "shape": [...], "data": ...}`, data is either a (nested for
+    multidimensional arrays) list of items or base64 string holding raw buffer in C order.
+    """
+
+    def __init__(self, buffer_format: BufferFormat = BufferFormat.LIST):
+        self.buffer_format = buffer_format
+
+    def encode(self, value: Any) -> Dict[str, Any]:
+        if self.buffer_format is BufferFormat.BASE64:
+            value = require_numpy().ascontiguousarray(value)
+
+        return {
+            "dtype": value.dtype.str,
+            "shape": list(value.shape),
+            "data": _encode_buffer_data(value, self.buffer_format),
+        }
+
+
 _builtin_type_encoders = TypeEncoders(
     {
         bool: SimpleEncoder[bool](bool),
@@ -147,6 +245,8 @@ _builtin_type_encoders = TypeEncoders(
         str: SimpleEncoder[str](str),
         bytes: SimpleEncoder[str](lambda value: b64encode(value).decode("utf8")),
         bytearray: SimpleEncoder[str](lambda value: b64encode(value).decode("utf8")),
+        memoryview: SimpleEncoder[str](lambda value: b64encode(value).decode("utf8")),
+        array: ArrayEncoder(),
         list: SimpleEncoder[list](list),
         set: SimpleEncoder[list](list),
         frozenset: SimpleEncoder[list](list),
@@ -195,6 +295,7 @@ class TupleEncoder(TypeEncoder):
     def __init__(self, items_encoder: List[Union[TypeEncoder, Any]]):
         self.items_encoder = items_encoder
         self._variadic = items_encoder[-1] is Ellipsis
+        self._variadic_encoders = items_encoder[:-1]
 
     def encode(self, value: Tuple) -> List:
         if self._variadic:
@@ -203,7 +304,7 @@ class TupleEncoder(TypeEncoder):
 
     def _encode_variadic(self, value: Tuple) -> List:
         result = []
-        type_encoders = self.items_encoder[:-1]
+        type_encoders = self._variadic_encoders
         num_encoders = len(type_encoders)
 
         for index, item in enumerate(value):
@@ -246,7 +347,7 @@ class ClassEncoder(TypeEncoder):
         self.force = force
 
     def encode(self, value: Any) -> StateObject:
-        if not isinstance(value, self.class_name):
+        if not isinstance(value, self.class_name) and not issubclass(compact_origin(type(value)), self.class_name):
             raise EncoderError.invalid_input
 
         if not hasattr(self, "_fields"):
@@ -254,7 +355,10 @@ class ClassEncoder(TypeEncoder):
 
         result = {}
         for name, field in self._schema.items():
-            prop_value = self._fields[name].encode(getattr(value, name, field.default_value))
+            prop_value = getattr(value, name, UNDEFINED)
+            if prop_value is UNDEFINED:
+                prop_value = field.default_value
+            prop_value = self._fields[name].encode(prop_value)
             if prop_value is not UNDEFINED:
                 result[name] = prop_value
 
@@ -352,14 +456,52 @@ class UnionEncoder(TypeEncoder):
     def __init__(self, supported_types: List[Type], extra_encoders: TypeEncoders = None, force: bool = False):
         self.supported_types = supported_types
         self._extra_encoders = extra_encoders
+        self._type_encoders: Dict[Type, TypeEncoder] = {}
         self.force = force
 
     def encode(self, value: Any) -> Any:
         value_type = type(value)
-        if value_type not in self.supported_types:
-            raise EncoderError.invalid_input
+        encoder = self._type_encoders.get(value_type)
+        if encoder is None:
+            if value_type not in self.supported_types:
+                raise EncoderError.invalid_input
+            encoder = self._type_encoders[value_type] = self._build_type_encoder(value_type)
 
-        return build_type_encoder(value_type, self._extra_encoders, force=self.force).encode(value)  # type: ignore
+        return encoder.encode(value)
+
+    def _build_type_encoder(self, a_type: Type) -> TypeEncoder:
+        return build_type_encoder(a_type, self._extra_encoders, force=self.force)  # type: ignore
+
+
+class ProjectedUnionEncoder(UnionEncoder):
+    """
+    Encodes members of the union with selection restricted to fields declared by each member.
+    """
+
+    def __init__(
+        self,
+        supported_types: List[Type],
+        selection: Optional[Selection],
+        extra_encoders: TypeEncoders = None,
+        force: bool = False,
+        omit: Optional[OmitOptions] = None,
+    ):
+        super().__init__(supported_types, extra_encoders, force)
+        self._member_fields = {a_type: selectable_fields(a_type) for a_type in supported_types}
+        check_fields(selection, {name for names in self._member_fields.values() for name in names or ()})
+        self._selection = selection
+        self._omit = omit
+
+    def _build_type_encoder(self, a_type: Type) -> TypeEncoder:
+        names = self._member_fields.get(a_type)
+        if names is None:
+            return super()._build_type_encoder(a_type)
+
+        selection = restrict_selection(self._selection, names)
+
+        return build_projected_type_encoder(
+            a_type, selection, self._extra_encoders, None, self.force, self._omit  # type: ignore
+        )
 
 
 _supported_generics = {
@@ -385,6 +527,12 @@ def build_type_encoder(
 
     origin_type = get_origin_type(a_type)
 
+    if is_ndarray_type(origin_type or a_type):
+        return NdarrayEncoder()
+
+    if origin_type is None and is_class(a_type) and _VIEW_OF in a_type.__dict__:
+        return ViewEncoder(a_type)
+
     if origin_type is None and is_dataclass(a_type):
         if issubclass(a_type, Generic):  # type: ignore
             raise EncoderError.invalid_type
@@ -455,35 +603,225 @@ def build_type_encoder(
     return _supported_generics[origin_type](type_attributes)  # type: ignore
 
 
+class ViewEncoder(TypeEncoder):
+    """
+    Encodes view returned by `chili.view` into a dict of schema properties taken from the dict behind the view. Values
+    are not converted, nested dicts and lists are shared with the viewed dict.
+    """
+
+    def __init__(self, class_name: Type):
+        self.class_name = class_name
+        view_of = class_name.__dict__[_VIEW_OF]
+        self._keys = tuple(create_schema(view_of).keys())  # type: ignore
+        self._mapper = getattr(view_of, _ENCODE_MAPPER, None)
+
+    def encode(self, value: Any) -> StateObject:
+        if not isinstance(value, self.class_name):
+            raise EncoderError.invalid_input
+
+        data = getattr(value, _VIEW_DATA)
+        result = {key: data[key] for key in self._keys if key in data}
+        if self._mapper is not None:
+            return self._mapper.map(result)
+
+        return result
+
+
+class ProjectedClassEncoder(ClassEncoder):
+    def __init__(
+        self,
+        class_name: Type,
+        selection: Optional[Selection],
+        extra_encoders: TypeEncoders = None,
+        force: bool = False,
+        omit: Optional[OmitOptions] = None,
+    ):
+        # parametrized generic classes are encoded as their origin class with type variables of fields mapped
+        self._generic_parameters = get_parameters_map(class_name) if get_origin_type(class_name) else {}
+        super().__init__(get_origin_type(class_name) or class_name, extra_encoders, force)
+        self._selection = dict(select_fields(selection, self._schema.keys()))
+        self._schema = TypeSchema({name: prop for name, prop in self._schema.items() if name in self._selection})
+        self._omit = omit
+
+    def encode(self, value: Any) -> StateObject:
+        if not isinstance(value, self.class_name) and not issubclass(compact_origin(type(value)), self.class_name):
+            raise EncoderError.invalid_input
+
+        if not hasattr(self, "_plan"):
+            self._plan = self._build_plan()
+
+        result = {}
+        for name, field, encoder, omit in self._plan:
+            prop_value = getattr(value, name, UNDEFINED)
+            if prop_value is UNDEFINED:
+                prop_value = field.default_value
+            if omit is not None and omit(prop_value):
+                continue
+            prop_value = encoder.encode(prop_value)
+            if prop_value is not UNDEFINED:
+                result[name] = prop_value
+
+        return result
+
+    def _build(self) -> Dict[str, TypeEncoder]:
+        return {
+            name: build_projected_type_encoder(
+                map_generic_type(field.type, self._generic_parameters),
+                self._selection[name],
+                self._extra_encoders,
+                self.class_name.__module__,
+                self.force,
+                self._omit,
+            )
+            for name, field in self._schema.items()
+        }
+
+    def _build_plan(self) -> List[Tuple[str, Property, TypeEncoder, Optional[Callable[[Any], bool]]]]:
+        if not hasattr(self, "_fields"):
+            self._fields = self._build()
+
+        return [
+            (name, field, self._fields[name], compile_omit_check(field, self._omit))
+            for name, field in self._schema.items()
+        ]
+
+
+@lru_cache(maxsize=None)
+def build_projected_type_encoder(
+    a_type: Type,
+    selection: Optional[Selection],
+    extra_encoders: TypeEncoders = None,
+    module: Any = None,
+    force: bool = False,
+    omit: Optional[OmitOptions] = None,
+) -> TypeEncoder:
+    """
+    Builds encoder which encodes only selected properties of classes reachable from the type, unselected subtrees
+    are never visited. Omit options leave out `None`, default or empty values of the classes' properties.
+    """
+    if (selection is None and omit is None) or (extra_encoders and a_type in extra_encoders):
+        return build_type_encoder(a_type, extra_encoders, module, force)  # type: ignore
+
+    if is_newtype(a_type):
+        return build_projected_type_encoder(a_type.__supertype__, selection, extra_encoders, module, force, omit)
+
+    origin_type = get_origin_type(a_type)
+    type_args = get_type_args(a_type)
+
+    if is_optional(a_type) and len(type_args) == 2:
+        return OptionalTypeEncoder(
+            build_projected_type_encoder(
+                unpack_optional(a_type), selection, extra_encoders, module, force, omit  # type: ignore
+            )
+        )
+
+    if origin_type is None and is_class(a_type):
+        if is_dataclass(a_type) and not issubclass(a_type, Generic):  # type: ignore
+            return ProjectedClassEncoder(a_type, selection, extra_encoders, force, omit)
+        if hasattr(a_type, _PROPERTIES):
+            encoder = Encoder[a_type](encoders=extra_encoders)  # type: ignore[valid-type]
+            encoder.selection = selection
+            encoder.omit = omit
+            return encoder
+
+    if origin_type is not None and is_dataclass(origin_type) and issubclass(origin_type, Generic):  # type: ignore
+        return ProjectedClassEncoder(a_type, selection, extra_encoders, force, omit)
+
+    if origin_type is Union or (UnionType and isinstance(origin_type, UnionType)):
+        return ProjectedUnionEncoder(type_args, selection, extra_encoders, force, omit)
+
+    if origin_type in _supported_generics and type_args:
+        item_selection = select_items(selection)
+        type_attributes: List[Any] = [
+            ...
+            if subtype is ...
+            else build_type_encoder(subtype, extra_encoders, module, force)  # type: ignore
+            if index == 0 and origin_type in (dict, collections.OrderedDict)
+            else build_projected_type_encoder(
+                subtype, item_selection, extra_encoders, module, force, omit  # type: ignore
+            )
+            for index, subtype in enumerate(type_args)
+        ]
+        if len(type_attributes) == 1:
+            return _supported_generics[origin_type](type_attributes[0])  # type: ignore
+        return _supported_generics[origin_type](type_attributes)  # type: ignore
+
+    if selection is not None:
+        raise EncoderError.invalid_input(f"cannot select fields of {a_type}")
+
+    return build_type_encoder(a_type, extra_encoders, module, force)  # type: ignore
+
+
 class Encoder(Generic[T]):
     __generic__: Type[T]
     _encoders: Dict[str, TypeEncoder]
 
-    def __init__(self, encoders: Union[Dict, TypeEncoders] = None, mapper: Optional[Mapper] = None):
+    def __init__(
+        self,
+        encoders: Union[Dict, TypeEncoders] = None,
+        mapper: Optional[Mapper] = None,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        exclude_none: bool = False,
+        exclude_defaults: bool = False,
+        exclude_empty: bool = False,
+    ):
         if encoders and not isinstance(encoders, TypeEncoders):
             encoders = TypeEncoders(encoders)
         self.encode_mapper = mapper
         self.type_encoders = encoders
+        self.selection = create_selection(only, exclude)
+        self.omit = create_omit_options(exclude_none, exclude_defaults, exclude_empty)
 
     def encode(self, obj: T) -> StateObject:
-        if not hasattr(self, "_encoders"):
-            self._encoders = self._build_encoders()
+        result = self._encode_properties(obj)
+
+        mapper = getattr(self.__generic__, _ENCODE_MAPPER, None)
+        if mapper is not None:
+            return mapper.map(result)
+        elif self.encode_mapper:
+            return self.encode_mapper.map(result)
+
+        return result
+
+    def _encode_properties(self, obj: T) -> Dict[str, StateObject]:
+        if not hasattr(self, "_encode_plan"):
+            self._encode_plan = self._build_encode_plan()
 
         result = {}
-        for key, prop in self.schema.items():
-            if hasattr(obj, key):
-                value = getattr(obj, key)
-            elif is_optional(prop.type):
+        for key, prop, encoder, omit in self._encode_plan:
+            value = getattr(obj, key, UNDEFINED)
+            if value is UNDEFINED:
+                if not is_optional(prop.type):
+                    continue
                 value = prop.default_value
-            else:
+            if omit is not None and omit(value):
                 continue
-            result[key] = self._encoders[prop.name].encode(value)
+            result[key] = encoder.encode(value)
 
-        if hasattr(self.__generic__, _ENCODE_MAPPER):
-            mapper = getattr(self.__generic__, _ENCODE_MAPPER)
-            return mapper.map(result)
-        elif self.encode_mapper:
-            return self.encode_mapper.map(result)
+        return result
+
+    def encode_columns(self, items: Iterable[T], numpy: bool = False) -> Dict[str, Any]:
+        """
+        Encodes passed objects into columns: a dictionary holding list of encoded values for every property.
+        When `numpy` is set, numeric and temporal properties are returned as numpy arrays. Mappers are not applied.
+        """
+        if not hasattr(self, "_encoders"):
+            self._encoders = self._build_encoders()
+
+        if not isinstance(items, Sequence):
+            items = list(items)
+
+        result: Dict[str, Any] = {}
+        for key, encoder in self._encoders.items():
+            prop = self.schema[key]
+            values = [getattr(item, key, UNDEFINED) for item in items]
+            if any(value is UNDEFINED for value in values):
+                values = [prop.default_value if value is UNDEFINED else value for value in values]
+            if numpy and get_numpy_dtype(prop.type) is not None:
+                result[key] = to_numpy_column(values, prop.type)
+                continue
+            result[key] = [encoder.encode(value) for value in values]
 
         return result
 
@@ -491,12 +829,27 @@ class Encoder(Generic[T]):
     def schema(self) -> TypeSchema:
         return getattr(self.__generic__, _PROPERTIES)
 
+    def _build_encode_plan(self) -> List[Tuple[str, Property, TypeEncoder, Optional[Callable[[Any], bool]]]]:
+        if not hasattr(self, "_encoders"):
+            self._encoders = self._build_encoders()
+
+        return [
+            (name, self.schema[name], encoder, compile_omit_check(self.schema[name], self.omit))
+            for name, encoder in self._encoders.items()
+        ]
+
     def _build_encoders(self) -> Dict[str, TypeEncoder]:
         schema: TypeSchema = self.schema
 
         return {
-            prop.name: build_type_encoder(prop.type, extra_encoders=self.type_encoders, force=True)  # type: ignore
-            for prop in schema.values()
+            name: build_projected_type_encoder(
+                schema[name].type,  # type: ignore
+                selection,
+                extra_encoders=self.type_encoders,  # type: ignore
+                force=True,
+                omit=self.omit,
+            )
+            for name, selection in select_fields(self.selection, schema.keys())
         }
 
     @classmethod
@@ -524,14 +877,22 @@ def encode(
     type_hint: Type = None,
     encoders: Union[TypeEncoders, Dict[Any, TypeEncoder]] = None,
     force: bool = False,
+    only: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    exclude_none: bool = False,
+    exclude_defaults: bool = False,
+    exclude_empty: bool = False,
 ) -> StateObject:
     if encoders and not isinstance(encoders, TypeEncoders):
         encoders = TypeEncoders(encoders)
 
-    if type_hint is not None:
-        encoder = build_type_encoder(type_hint, extra_encoders=encoders, force=force)  # type: ignore
-    else:
-        encoder = build_type_encoder(type(obj), extra_encoders=encoders, force=force)  # type: ignore
+    encoder = build_projected_type_encoder(
+        type_hint if type_hint is not None else type(obj),  # type: ignore
+        create_selection(only, exclude),
+        extra_encoders=encoders,  # type: ignore
+        force=force,
+        omit=create_omit_options(exclude_none, exclude_defaults, exclude_empty),
+    )
 
     if encoder is None:
         raise EncoderError.invalid_input
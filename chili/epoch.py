@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from enum import Enum
+from typing import Optional, Union
+
+from .decoder import TypeDecoder, TypeDecoders
+from .encoder import TypeEncoder, TypeEncoders
+
+__all__ = [
+    "EpochUnit",
+    "datetime_to_epoch",
+    "epoch_to_datetime",
+    "date_to_epoch",
+    "epoch_to_date",
+    "timedelta_to_number",
+    "number_to_timedelta",
+    "EpochDatetimeEncoder",
+    "EpochDatetimeDecoder",
+    "EpochDateEncoder",
+    "EpochDateDecoder",
+    "DurationEncoder",
+    "DurationDecoder",
+    "epoch_encoders",
+    "epoch_decoders",
+]
+
+Number = Union[int, float]
+
+
+class EpochUnit(Enum):
+    SECONDS = 1
+    MILLISECONDS = 1_000
+    MICROSECONDS = 1_000_000
+
+
+_MICROSECONDS_IN_SECOND = 1_000_000
+_SECONDS_IN_DAY = 86_400
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _microseconds(delta: timedelta) -> int:
+    return (delta.days * _SECONDS_IN_DAY + delta.seconds) * _MICROSECONDS_IN_SECOND + delta.microseconds
+
+
+def datetime_to_epoch(value: datetime, unit: EpochUnit = EpochUnit.SECONDS) -> int:
+    """
+    Converts datetime into an integer number of units elapsed since unix epoch. Naive datetimes are treated as UTC,
+    precision below the selected unit is floored.
+    """
+    delta = value - (_NAIVE_EPOCH if value.tzinfo is None else _EPOCH)
+    return _microseconds(delta) // (_MICROSECONDS_IN_SECOND // unit.value)
+
+
+def epoch_to_datetime(
+    value: Number, unit: EpochUnit = EpochUnit.SECONDS, tz: Optional[tzinfo] = timezone.utc
+) -> datetime:
+    """
+    Converts number of units elapsed since unix epoch into datetime. When `tz` is `None` naive (UTC) datetime
+    is returned.
+    """
+    delta = timedelta(microseconds=value * (_MICROSECONDS_IN_SECOND // unit.value))
+    if tz is None:
+        return _NAIVE_EPOCH + delta
+    if tz is timezone.utc:
+        return _EPOCH + delta
+
+    return (_EPOCH + delta).astimezone(tz)
+
+
+def date_to_epoch(value: date, unit: EpochUnit = EpochUnit.SECONDS) -> int:
+    return (value.toordinal() - _EPOCH_ORDINAL) * _SECONDS_IN_DAY * unit.value
+
+
+def epoch_to_date(value: Number, unit: EpochUnit = EpochUnit.SECONDS) -> date:
+    return date.fromordinal(_EPOCH_ORDINAL + int(value // (_SECONDS_IN_DAY * unit.value)))
+
+
+def timedelta_to_number(value: timedelta, unit: EpochUnit = EpochUnit.SECONDS) -> Number:
+    """
+    Converts timedelta into total number of units. Durations expressed in seconds keep sub-second precision
+    (float is returned only when there is a fractional part), other units are floored to an integer.
+    """
+    microseconds = _microseconds(value)
+    if unit is EpochUnit.SECONDS:
+        seconds, remainder = divmod(microseconds, _MICROSECONDS_IN_SECOND)
+        return microseconds / _MICROSECONDS_IN_SECOND if remainder else seconds
+
+    return microseconds // (_MICROSECONDS_IN_SECOND // unit.value)
+
+
+def number_to_timedelta(value: Number, unit: EpochUnit = EpochUnit.SECONDS) -> timedelta:
+    return timedelta(microseconds=value * (_MICROSECONDS_IN_SECOND // unit.value))
+
+
+class EpochDatetimeEncoder(TypeEncoder):
+    def __init__(self, unit: EpochUnit = EpochUnit.SECONDS):
+        self.unit = unit
+        self._divisor = _MICROSECONDS_IN_SECOND // unit.value
+
+    def encode(self, value: datetime) -> int:
+        delta = value - (_NAIVE_EPOCH if value.tzinfo is None else _EPOCH)
+        return _microseconds(delta) // self._divisor
+
+
+class EpochDatetimeDecoder(TypeDecoder):
+    def __init__(self, unit: EpochUnit = EpochUnit.SECONDS, tz: Optional[tzinfo] = timezone.utc):
+        self.unit = unit
+        self.tz = tz
+
+    def decode(self, value: Number) -> datetime:
+        return epoch_to_datetime(value, self.unit, self.tz)
+
+
+class EpochDateEncoder(TypeEncoder):
+    def __init__(self, unit: EpochUnit = EpochUnit.SECONDS):
+        self.unit = unit
+
+    def encode(self, value: date) -> int:
+        return date_to_epoch(value, self.unit)
+
+
+class EpochDateDecoder(TypeDecoder):
+    def __init__(self, unit: EpochUnit = EpochUnit.SECONDS):
+        self.unit = unit
+
+    def decode(self, value: Number) -> date:
+        return epoch_to_date(value, self.unit)
+
+
+class DurationEncoder(TypeEncoder):
+    def __init__(self, unit: EpochUnit = EpochUnit.SECONDS):
+        self.unit = unit
+
+    def encode(self, value: timedelta) -> Number:
+        return timedelta_to_number(value, self.unit)
+
+
+class DurationDecoder(TypeDecoder):
+    def __init__(self, unit: EpochUnit = EpochUnit.SECONDS):
+        self.unit = unit
+
+    def decode(self, value: Number) -> timedelta:
+        return number_to_timedelta(value, self.unit)
+
+
+def epoch_encoders(unit: EpochUnit = EpochUnit.SECONDS) -> TypeEncoders:
+    """
+    Returns type encoders which represent datetime, date and timedelta values as numbers instead of ISO-8601 strings.
+    """
+    return TypeEncoders(
+        {
+            datetime: EpochDatetimeEncoder(unit),
+            date: EpochDateEncoder(unit),
+            timedelta: DurationEncoder(unit),
+        }
+    )
+
+
+def epoch_decoders(unit: EpochUnit = EpochUnit.SECONDS, tz: Optional[tzinfo] = timezone.utc) -> TypeDecoders:
+    """
+    Returns type decoders which hydrate datetime, date and timedelta values from numbers produced by `epoch_encoders`.
+    """
+    return TypeDecoders(
+        {
+            datetime: EpochDatetimeDecoder(unit, tz),
+            date: EpochDateDecoder(unit),
+            timedelta: DurationDecoder(unit),
+        }
+    )
@@ -7,6 +7,7 @@ class SerialisationError(Error):
     invalid_type: TypeError
     invalid_input: ValueError
     missing_property: KeyError
+    missing_dependency: ImportError
 
 
 class DecoderError(SerialisationError):
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import sys
+import threading
+from functools import partial, update_wrapper
+from typing import Any, Callable, Dict, List, Tuple
+
+__all__ = [
+    "add_hook",
+    "remove_hook",
+]
+
+# hook receives the next callable of the chain followed by arguments of the call, e.g. `hook(call, *args, **kwargs)`
+Hook = Callable[..., Any]
+
+_lock = threading.Lock()
+
+
+class _Chain:
+    """
+    Hooks installed on a single function or method. One wrapper, which calls hooks registered at the time of the call,
+    replaces the original, so hooks can be added and removed in any order. The wrapper is kept between installations,
+    references to it held after all hooks are removed call the original directly.
+    """
+
+    def __init__(self, owner: Any, name: str):
+        self.owner = owner
+        self.name = name
+        self.original = owner.__dict__[name] if isinstance(owner, type) else getattr(owner, name)
+        self.hooks: List[Hook] = []
+        self.call: Callable = self.original
+        self.bindings: List[Tuple[Any, str]] = []
+
+        chain = self
+
+        def _wrapper(*args: Any, **kwargs: Any) -> Any:
+            return chain.call(*args, **kwargs)
+
+        self.wrapper = update_wrapper(_wrapper, self.original)
+
+    def _targets(self) -> List[Tuple[Any, str]]:
+        if isinstance(self.owner, type):
+            return [(self.owner, self.name)]
+
+        # functions are usually imported by name, references held by chili's own modules are replaced as well
+        targets = []
+        for module_name, module in list(sys.modules.items()):
+            if module is None or (module_name != "chili" and not module_name.startswith("chili.")):
+                continue
+            for name, value in list(vars(module).items()):
+                if value is self.original:
+                    targets.append((module, name))
+
+        return targets
+
+    def update(self) -> None:
+        call = self.original
+        for hook in self.hooks:
+            call = partial(hook, call)
+        self.call = call
+
+        if self.hooks and not self.bindings:
+            self.bindings = self._targets()
+            for owner, name in self.bindings:
+                setattr(owner, name, self.wrapper)
+        elif not self.hooks and self.bindings:
+            for owner, name in self.bindings:
+                setattr(owner, name, self.original)
+            self.bindings = []
+
+
+_chains: Dict[Tuple[Any, str], _Chain] = {}
+
+
+def add_hook(owner: Any, name: str, hook: Hook) -> None:
+    """
+    Installs hook on `owner.name`, which is a method when owner is a class or a function when owner is a module.
+    Hooks added later run first.
+    """
+    with _lock:
+        chain = _chains.get((owner, name))
+        if chain is None:
+            chain = _chains[(owner, name)] = _Chain(owner, name)
+        chain.hooks.append(hook)
+        chain.update()
+
+
+def remove_hook(owner: Any, name: str, hook: Hook) -> None:
+    with _lock:
+        chain = _chains.get((owner, name))
+        if chain is None or hook not in chain.hooks:
+            return
+        chain.hooks.remove(hook)
+        chain.update()
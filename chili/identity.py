@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Generic, Hashable, Optional, Type, TypeVar, Union
+from weakref import WeakValueDictionary
+
+from .decoder import TypeDecoder, TypeDecoders, build_type_decoder
+from .error import DecoderError
+from .state import StateObject
+from .typing import create_schema
+
+__all__ = [
+    "IdentityMap",
+]
+
+T = TypeVar("T")
+
+
+class IdentityMap(TypeDecoder, Generic[T]):
+    """
+    Decodes instances of a class keeping track of them by their key property. When decoded record's key is already
+    known, the existing instance is reused (and updated with the decoded values when `update` is set) instead of
+    allocating a new one. Instances are held weakly, so they are dropped from the map once no longer referenced.
+    """
+
+    def __init__(
+        self,
+        class_name: Type[T],
+        key: str = "id",
+        decoders: Union[TypeDecoders, Dict[Any, TypeDecoder]] = None,
+        update: bool = True,
+    ):
+        schema = create_schema(class_name)  # type: ignore
+        if key not in schema:
+            raise DecoderError.invalid_type(class_name)
+        if not class_name.__weakrefoffset__:
+            raise DecoderError.invalid_type(class_name)
+
+        if decoders and not isinstance(decoders, TypeDecoders):
+            decoders = TypeDecoders(decoders)
+
+        self.class_name = class_name
+        self.key = key
+        self.update = update
+        self._instances: WeakValueDictionary = WeakValueDictionary()
+        self._decoder = build_type_decoder(class_name, decoders, force=True)  # type: ignore
+        self._key_decoder = build_type_decoder(schema[key].type, decoders, class_name.__module__)  # type: ignore
+
+    def decode(self, value: StateObject) -> T:
+        if not isinstance(value, dict) or self.key not in value:
+            return self._decoder.decode(value)
+
+        key = self._key_decoder.decode(value[self.key])
+        instance = self._instances.get(key)
+        if instance is None:
+            instance = self._decoder.decode(value)
+            self._instances[key] = instance
+        elif self.update:
+            self._decoder._populate(instance, value)  # type: ignore
+
+        return instance
+
+    def get(self, key: Hashable) -> Optional[T]:
+        return self._instances.get(key)
+
+    def discard(self, key: Hashable) -> None:
+        self._instances.pop(key, None)
+
+    def clear(self) -> None:
+        self._instances.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._instances
+
+    def __len__(self) -> int:
+        return len(self._instances)
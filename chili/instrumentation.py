@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+import threading
+from functools import partial
+from time import perf_counter_ns, time_ns
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from . import decoder as decoder_module, encoder as encoder_module, json_support
+from .decoder import Decoder, ScopedTypeDecoders, UnionDecoder
+from .encoder import Encoder
+from .error import SerialisationError
+from .hooks import add_hook, remove_hook
+from .json_support import JsonDecoder, JsonEncoder, JsonSerializer
+from .mapper import Mapper
+from .typing import type_name
+
+__all__ = [
+    "Event",
+    "Instrumentation",
+    "OpenTelemetryAdapter",
+]
+
+# lru caches of codec builders, a cache miss is a codec build
+_CODEC_CACHES: Dict[str, Any] = {
+    "type_decoder": decoder_module._cached_type_decoder,
+    "projected_type_decoder": decoder_module._cached_projected_type_decoder,
+    "compact_decoders": decoder_module._cached_compact_decoders,
+    "type_encoder": encoder_module.build_type_encoder,
+    "projected_type_encoder": encoder_module.build_projected_type_encoder,
+}
+
+# builders caching codecs in `ScopedTypeDecoders`, first item of the cache key
+_SCOPED_BUILDERS: Dict[Any, str] = {
+    decoder_module.build_type_decoder: "type_decoder",
+    decoder_module.build_projected_type_decoder: "projected_type_decoder",
+    decoder_module.build_compact_decoders: "compact_decoders",
+}
+
+
+class Event(NamedTuple):
+    operation: str  # "decode", "encode" or "map"
+    type: str  # type name in `module:qualname` format, mapper's class name for "map"
+    start_time: int  # nanoseconds since epoch
+    duration: int  # nanoseconds
+    error: Optional[BaseException]
+
+
+def _utf8_length(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value) if value.isascii() else len(value.encode("utf8"))
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+
+    return 0
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Instrumentation:
+    """
+    Collects per-type encode and decode counts and cumulative time, bytes passed through JSON helpers, codec builds,
+    union decode counts, time and failures, and time spent in mappers. Nothing is measured until
+    `install` is called (or the context is entered): hooks replace library functions and methods, so disabled
+    instrumentation costs nothing. Only chili's own modules are patched, modules which imported `decode` or `encode`
+    by name before installation keep calling the original functions. Times are inclusive, time of nested decoders is
+    counted for every level.
+
+    Callbacks receive an `Event` after every encode, decode and map call.
+    """
+
+    def __init__(self, callbacks: Iterable[Callable[[Event], None]] = ()):
+        self.callbacks: List[Callable[[Event], None]] = list(callbacks)
+        self._lock = threading.Lock()
+        self._names: Dict[Any, str] = {}
+        self._patches: List[Tuple[Any, str, Any]] = []
+        self._cache_baseline: Dict[str, int] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls: Dict[Tuple[str, str], List[int]] = {}  # (operation, type) -> [count, nanoseconds, errors]
+            self._json: Dict[str, List[int]] = {}  # helper -> [count, bytes in, bytes out]
+            self._unions: Dict[str, List[int]] = {}  # type -> [count, nanoseconds, failures]
+            self._mapper = [0, 0]  # [count, nanoseconds]
+            self._builds = {name: 0 for name in _CODEC_CACHES}
+            if self._patches:
+                self._cache_baseline = {name: cache.cache_info().misses for name, cache in _CODEC_CACHES.items()}
+
+    def _type_name(self, a_type: Any) -> str:
+        try:
+            return self._names[a_type]
+        except KeyError:
+            name = self._names[a_type] = type_name(a_type)
+            return name
+        except TypeError:  # unhashable type hint
+            return type_name(a_type)
+
+    def _union_name(self, valid_types: Any) -> str:
+        key = (Union, tuple(valid_types))
+        name = self._names.get(key)
+        if name is None:
+            name = self._names[key] = type_name(Union[key[1]])  # type: ignore
+
+        return name
+
+    def _record_call(self, operation: str, a_type: Any, start: int, error: Optional[BaseException]) -> None:
+        duration = perf_counter_ns() - start
+        name = self._type_name(a_type)
+        with self._lock:
+            stats = self._calls.get((operation, name))
+            if stats is None:
+                stats = self._calls[(operation, name)] = [0, 0, 0]
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] += error is not None
+
+        self._emit(operation, name, duration, error)
+
+    def _emit(self, operation: str, name: str, duration: int, error: Optional[BaseException]) -> None:
+        if not self.callbacks:
+            return
+        event = Event(operation, name, time_ns() - duration, duration, error)
+        for callback in self.callbacks:
+            try:
+                callback(event)
+            except Exception:  # instrumentation must never break encoding or decoding
+                pass
+
+    def _record_json(self, helper: str, bytes_in: int, bytes_out: int) -> None:
+        with self._lock:
+            stats = self._json.get(helper)
+            if stats is None:
+                stats = self._json[helper] = [0, 0, 0]
+            stats[0] += 1
+            stats[1] += bytes_in
+            stats[2] += bytes_out
+
+    def _timed(self, operation: str, get_type: Callable[[tuple, dict], Any]) -> Callable:
+        instrumentation = self
+
+        def _hook(func: Callable, *args: Any, **kwargs: Any) -> Any:
+            start = perf_counter_ns()
+            error = None
+            try:
+                return func(*args, **kwargs)
+            except BaseException as exception:
+                error = exception
+                raise
+            finally:
+                instrumentation._record_call(operation, get_type(args, kwargs), start, error)
+
+        return _hook
+
+    def _record_build(self, name: str, build: Callable[[], Any]) -> Any:
+        with self._lock:
+            self._builds[name] += 1
+
+        return build()
+
+    def _json_helper(self, helper: str, document_index: int, decodes: bool) -> Callable:
+        instrumentation = self
+
+        def _hook(func: Callable, *args: Any, **kwargs: Any) -> Any:
+            result = func(*args, **kwargs)
+            if decodes:
+                document = args[document_index] if len(args) > document_index else kwargs.get("json_str")
+                instrumentation._record_json(helper, _utf8_length(document), 0)
+            else:
+                instrumentation._record_json(helper, 0, _utf8_length(result))
+            return result
+
+        return _hook
+
+    def _union_decode(self) -> Callable:
+        instrumentation = self
+
+        def _decode(decode: Callable[[UnionDecoder, Any], Any], union: UnionDecoder, value: Any) -> Any:
+            start = perf_counter_ns()
+            failed = False
+            try:
+                return decode(union, value)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                duration = perf_counter_ns() - start
+                name = instrumentation._union_name(union.valid_types)
+                with instrumentation._lock:
+                    stats = instrumentation._unions.get(name)
+                    if stats is None:
+                        stats = instrumentation._unions[name] = [0, 0, 0]
+                    stats[0] += 1
+                    stats[1] += duration
+                    stats[2] += failed
+
+        return _decode
+
+    def _scoped_build(self) -> Callable:
+        instrumentation = self
+
+        def _cached(cached: Callable, registry: ScopedTypeDecoders, key: Any, build: Callable[[], Any]) -> Any:
+            name = _SCOPED_BUILDERS.get(key[0])
+            if name is None:
+                return cached(registry, key, build)
+
+            return cached(registry, key, partial(instrumentation._record_build, name, build))
+
+        return _cached
+
+    def _mapper_map(self) -> Callable:
+        instrumentation = self
+
+        def _map(func: Callable, mapper: Mapper, *args: Any, **kwargs: Any) -> Any:
+            start = perf_counter_ns()
+            error = None
+            try:
+                return func(mapper, *args, **kwargs)
+            except BaseException as exception:
+                error = exception
+                raise
+            finally:
+                duration = perf_counter_ns() - start
+                with instrumentation._lock:
+                    instrumentation._mapper[0] += 1
+                    instrumentation._mapper[1] += duration
+                instrumentation._emit("map", type(mapper).__qualname__, duration, error)
+
+        return _map
+
+    def _patch(self, owner: Any, name: str, hook: Callable) -> None:
+        add_hook(owner, name, hook)
+        self._patches.append((owner, name, hook))
+
+    def install(self) -> Instrumentation:
+        if self._patches:
+            return self
+
+        self._patch(
+            decoder_module,
+            "decode",
+            self._timed("decode", lambda args, kwargs: args[1] if len(args) > 1 else kwargs["a_type"]),
+        )
+        self._patch(
+            encoder_module,
+            "encode",
+            self._timed(
+                "encode", lambda args, kwargs: (args[1] if len(args) > 1 else kwargs.get("type_hint")) or type(args[0])
+            ),
+        )
+        self._patch(Decoder, "decode", self._timed("decode", lambda args, _: args[0].__generic__))
+        self._patch(Encoder, "encode", self._timed("encode", lambda args, _: args[0].__generic__))
+
+        for helper, decodes in (
+            ("json_decode", True),
+            ("json_encode", False),
+            ("json_decode_columns", True),
+            ("json_encode_columns", False),
+        ):
+            self._patch(json_support, helper, self._json_helper(helper, 0, decodes))
+        for cls in (JsonDecoder, JsonSerializer):
+            self._patch(cls, "decode", self._json_helper(cls.__name__, 1, True))
+        for cls in (JsonEncoder, JsonSerializer):
+            self._patch(cls, "encode", self._json_helper(cls.__name__, 1, False))
+
+        self._patch(UnionDecoder, "decode", self._union_decode())
+        self._patch(ScopedTypeDecoders, "cached", self._scoped_build())
+        self._patch(Mapper, "map", self._mapper_map())
+        self._cache_baseline = {name: cache.cache_info().misses for name, cache in _CODEC_CACHES.items()}
+
+        return self
+
+    def uninstall(self) -> None:
+        if not self._patches:
+            return
+
+        self._builds = self._codec_builds()
+        for owner, name, hook in self._patches:
+            remove_hook(owner, name, hook)
+        self._patches = []
+
+    def _codec_builds(self) -> Dict[str, int]:
+        if not self._patches:
+            return dict(self._builds)
+
+        return {
+            name: self._builds[name] + max(0, cache.cache_info().misses - self._cache_baseline[name])
+            for name, cache in _CODEC_CACHES.items()
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Returns collected metrics, times are in seconds:
+        `{"decode": {type: {"count", "seconds", "errors"}}, "encode": {...}, "json": {helper: {"count", "bytes_in",
+        "bytes_out"}}, "codec_builds": {cache: count}, "unions": {type: {"count", "seconds", "failures"}},
+        "mapper": {"count", "seconds"}}`.
+        """
+        with self._lock:
+            result: Dict[str, Any] = {"decode": {}, "encode": {}}
+            for (operation, name), (count, duration, errors) in sorted(self._calls.items()):
+                result[operation][name] = {"count": count, "seconds": duration / 1e9, "errors": errors}
+            result["json"] = {
+                helper: {"count": count, "bytes_in": bytes_in, "bytes_out": bytes_out}
+                for helper, (count, bytes_in, bytes_out) in sorted(self._json.items())
+            }
+            result["codec_builds"] = self._codec_builds()
+            result["unions"] = {
+                name: {"count": count, "seconds": duration / 1e9, "failures": failures}
+                for name, (count, duration, failures) in sorted(self._unions.items())
+            }
+            result["mapper"] = {"count": self._mapper[0], "seconds": self._mapper[1] / 1e9}
+
+        return result
+
+    def to_prometheus(self, prefix: str = "chili") -> str:
+        """
+        Returns collected metrics in Prometheus text exposition format.
+        """
+        metrics = self.as_dict()
+        samples: List[Tuple[str, str, List[Tuple[Dict[str, str], Any]]]] = []
+
+        def _add(name: str, help_text: str, values: List[Tuple[Dict[str, str], Any]]) -> None:
+            samples.append((f"{prefix}_{name}", help_text, values))
+
+        calls = [
+            ({"operation": operation, "type": name}, stats)
+            for operation in ("decode", "encode")
+            for name, stats in metrics[operation].items()
+        ]
+        for key, name, help_text in (
+            ("count", "calls_total", "Number of encode and decode calls."),
+            ("seconds", "call_seconds_total", "Time spent encoding and decoding."),
+            ("errors", "call_errors_total", "Number of failed encode and decode calls."),
+        ):
+            _add(name, help_text, [(labels, stats[key]) for labels, stats in calls])
+
+        helpers = list(metrics["json"].items())
+        _add("json_calls_total", "Number of JSON helper calls.", [({"helper": h}, s["count"]) for h, s in helpers])
+        _add(
+            "json_bytes_total",
+            "Bytes of JSON documents read and written by JSON helpers.",
+            [({"helper": h, "direction": "in"}, s["bytes_in"]) for h, s in helpers]
+            + [({"helper": h, "direction": "out"}, s["bytes_out"]) for h, s in helpers],
+        )
+        _add(
+            "codec_builds_total",
+            "Number of encoders and decoders built.",
+            [({"cache": name}, count) for name, count in metrics["codec_builds"].items()],
+        )
+
+        unions = list(metrics["unions"].items())
+        for key, name, help_text in (
+            ("count", "union_decodes_total", "Number of union decode calls."),
+            ("seconds", "union_seconds_total", "Time spent decoding unions."),
+            ("failures", "union_failures_total", "Number of values matching none of union candidates."),
+        ):
+            _add(name, help_text, [({"type": union}, stats[key]) for union, stats in unions])
+
+        _add("mapper_calls_total", "Number of mapper calls.", [({}, metrics["mapper"]["count"])])
+        _add("mapper_seconds_total", "Time spent in mappers.", [({}, metrics["mapper"]["seconds"])])
+
+        lines = []
+        for name, help_text, values in samples:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in values:
+                label_text = ",".join(f'{key}="{_escape_label(label)}"' for key, label in labels.items())
+                lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def __enter__(self) -> Instrumentation:
+        return self.install()
+
+    def __exit__(self, *args: Any) -> None:
+        self.uninstall()
+
+
+class OpenTelemetryAdapter:
+    """
+    Instrumentation callback creating OpenTelemetry span for every event, e.g.
+    `Instrumentation([OpenTelemetryAdapter()])`. Spans are created when calls finish, so they are children of the
+    span current at that time rather than of each other.
+    """
+
+    def __init__(self, tracer: Any = None):
+        if tracer is None:
+            try:
+                from opentelemetry import trace
+            except ImportError:
+                raise SerialisationError.missing_dependency(
+                    message="opentelemetry-api is required, install it with `pip install opentelemetry-api`"
+                )
+            tracer = trace.get_tracer("chili")
+        self.tracer = tracer
+
+    def __call__(self, event: Event) -> None:
+        span = self.tracer.start_span(
+            f"chili.{event.operation}", start_time=event.start_time, attributes={"chili.type": event.type}
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+        span.end(end_time=event.start_time + event.duration)
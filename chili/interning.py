@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import re
+import sys
+from functools import lru_cache
+from ipaddress import IPv4Address, IPv6Address
+from pathlib import Path, PosixPath, PurePath, PurePosixPath, PureWindowsPath, WindowsPath
+from typing import Any, Iterable, Optional, Pattern, Type
+from uuid import UUID
+
+from .decoder import ScopedTypeDecoders, TypeDecoder, TypeDecoders, build_type_decoder
+
+__all__ = [
+    "DEFAULT_INTERNED_TYPES",
+    "InternedDecoder",
+    "InternedDecoders",
+    "StringInterningDecoder",
+    "interning_decoders",
+]
+
+DEFAULT_INTERNED_TYPES = (
+    str,
+    UUID,
+    IPv4Address,
+    IPv6Address,
+    decimal.Decimal,
+    datetime.date,
+    datetime.datetime,
+    datetime.time,
+    datetime.timedelta,
+    PurePath,
+    PurePosixPath,
+    PureWindowsPath,
+    Path,
+    PosixPath,
+    WindowsPath,
+    Pattern,
+    re.Pattern,
+)
+
+
+class InternedDecoder(TypeDecoder):
+    """
+    Wraps decoder of an immutable type with a bounded LRU cache keyed by the raw input, so repeated input values
+    are decoded once and share the same decoded object. Unhashable input bypasses the cache.
+    """
+
+    def __init__(self, decoder: TypeDecoder, maxsize: Optional[int] = 4096):
+        self._decoder = decoder
+        self._cached_decode = lru_cache(maxsize=maxsize, typed=True)(decoder.decode)
+
+    def decode(self, value: Any) -> Any:
+        try:
+            return self._cached_decode(value)
+        except TypeError:
+            if value.__hash__ is not None:
+                raise
+            return self._decoder.decode(value)
+
+    def clear(self) -> None:
+        self._cached_decode.cache_clear()
+
+
+class StringInterningDecoder(TypeDecoder):
+    """
+    Decodes strings and interns those not longer than `max_length` with `sys.intern`.
+    """
+
+    def __init__(self, max_length: int = 64):
+        self.max_length = max_length
+
+    def decode(self, value: Any) -> str:
+        if value.__class__ is not str:  # `sys.intern` rejects str subclasses
+            value = str(value)
+        if len(value) <= self.max_length:
+            return sys.intern(value)
+
+        return value
+
+
+class InternedDecoders(ScopedTypeDecoders):
+    """
+    Registry returned by `interning_decoders`, decoders built with it are cached in the registry rather than globally.
+    """
+
+    def clear(self) -> None:
+        for decoder in self.values():
+            if isinstance(decoder, InternedDecoder):
+                decoder.clear()
+
+
+def interning_decoders(
+    types: Iterable[Type] = DEFAULT_INTERNED_TYPES,
+    maxsize: Optional[int] = 4096,
+    max_string_length: int = 64,
+    decoders: Optional[TypeDecoders] = None,
+) -> InternedDecoders:
+    """
+    Returns type decoders which share decoded instances of repeated immutable values. The result can be passed
+    as `decoders` to `Decoder` or `decode`; call `clear()` on it to drop cached values, e.g. after each batch.
+    """
+    if decoders and not isinstance(decoders, TypeDecoders):
+        decoders = TypeDecoders(decoders)
+
+    result = InternedDecoders(decoders or {})
+    for a_type in types:
+        if a_type is str:
+            result[a_type] = StringInterningDecoder(max_string_length)
+            continue
+        result[a_type] = InternedDecoder(build_type_decoder(a_type, decoders), maxsize)  # type: ignore
+
+    return result
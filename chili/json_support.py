@@ -1,5 +1,5 @@
 from json import dumps, loads
-from typing import Any, Generic, Type, TypeVar, Union
+from typing import Any, Generic, Iterable, List, Type, TypeVar, Union
 
 from .decoder import Decoder, TypeDecoders, decode
 from .encoder import Encoder, TypeEncoders, encode
@@ -16,6 +16,24 @@ def json_decode(json_str: str, type_hint: Type[T], type_decoders: TypeDecoders =
     return decode(loads(json_str), type_hint, type_decoders)
 
 
+def json_encode_columns(items: Iterable[Any], type_hint: Type, type_encoders: TypeEncoders = None) -> str:
+    """
+    Encodes objects into columnar json document: `{"fields": [...], "columns": [[...], ...]}`, where every column
+    holds values of the corresponding field for all objects.
+    """
+    columns = Encoder[type_hint](type_encoders).encode_columns(items)  # type: ignore
+
+    return dumps({"fields": list(columns.keys()), "columns": list(columns.values())})
+
+
+def json_decode_columns(json_str: str, type_hint: Type[T], type_decoders: TypeDecoders = None) -> List[T]:
+    document = loads(json_str)
+
+    return Decoder[type_hint](type_decoders).decode_columns(  # type: ignore
+        dict(zip(document["fields"], document["columns"]))
+    )
+
+
 class JsonEncoder(Encoder, Generic[T]):
     def encode(self, obj: T) -> str:  # type: ignore
         return dumps(super().encode(obj))
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import copyreg
+from dataclasses import is_dataclass
+from inspect import getattr_static
+from typing import Any, Dict, Generic, List, Type, TypeVar, Union
+
+from .decoder import ClassDecoder, TypeDecoder, TypeDecoders, build_type_decoder
+from .error import DecoderError
+from .state import StateObject
+from .typing import (
+    _PROPERTIES,
+    UNDEFINED,
+    _is_class_with_schema,
+    get_nested_types,
+    get_origin_type,
+    is_class,
+    is_named_tuple,
+    is_optional,
+    is_typed_dict,
+    unpack_optional,
+)
+
+__all__ = [
+    "LazyClassDecoder",
+    "LazyDecoder",
+    "is_lazy",
+]
+
+T = TypeVar("T")
+
+_LAZY_STATE = "__lazy_state__"
+_LAZY_OF = "__lazy_of__"
+
+
+def is_lazy(cls: Type) -> bool:
+    return _LAZY_OF in cls.__dict__
+
+
+def _is_deferred_type(a_type: Any) -> bool:
+    if is_optional(a_type):
+        a_type = unpack_optional(a_type)
+
+    if get_origin_type(a_type) is not None:
+        return True
+
+    return is_class(a_type) and (
+        is_dataclass(a_type) or hasattr(a_type, _PROPERTIES) or is_named_tuple(a_type) or is_typed_dict(a_type)
+    )
+
+
+def _materialize(instance: Any) -> Any:
+    """
+    Returns instance of the decoded class with all lazy properties decoded.
+    """
+    cls = type(instance)
+    if not is_lazy(cls):
+        return instance
+
+    base = cls.__dict__[_LAZY_OF]
+    for name in getattr(instance, _LAZY_STATE, {}):
+        getattr(instance, name, None)  # decodes and stores property in instance's `__dict__`
+    result = base.__new__(base)
+    result.__dict__.update(instance.__dict__)
+
+    return result
+
+
+def _lazy_eq(self: Any, other: Any) -> Any:
+    return _materialize(self) == _materialize(other)
+
+
+def _lazy_copy(self: Any) -> Any:
+    cls = type(self)
+    result = cls.__new__(cls)  # type: ignore
+    result.__dict__.update(self.__dict__)
+    setattr(result, _LAZY_STATE, dict(getattr(self, _LAZY_STATE, {})))
+
+    return result
+
+
+def _new_object(cls: Type, *args: Any) -> Any:
+    return cls.__new__(cls, *args)
+
+
+def _lazy_reduce_ex(self: Any, protocol: int) -> Any:
+    # pickles instance as the decoded class; pickle rejects `copyreg.__newobj__` called with a different class
+    reduced = _materialize(self).__reduce_ex__(protocol)
+    if isinstance(reduced, tuple) and reduced[0] is copyreg.__newobj__:  # type: ignore
+        reduced = (_new_object, *reduced[1:])
+
+    return reduced
+
+
+class _LazyProperty:
+    """
+    Non-data descriptor which decodes raw state of the property on first access and stores the result in instance's
+    `__dict__`, so following reads do not go through the descriptor. Raw state is kept in a slot of the instance
+    and is never modified by reads.
+    """
+
+    def __init__(self, name: str, decoder: TypeDecoder):
+        self.name = name
+        self.decoder = decoder
+
+    def __get__(self, instance: Any, owner: Type) -> Any:
+        if instance is None:
+            return self
+
+        state = getattr(instance, _LAZY_STATE, None)
+        if state is None or self.name not in state:
+            raise AttributeError(f"'{owner.__name__}' object has no attribute '{self.name}'")
+
+        # concurrent readers may both decode, the first stored value wins
+        return instance.__dict__.setdefault(self.name, self.decoder.decode(state[self.name]))
+
+
+class LazyClassDecoder(ClassDecoder):
+    """
+    Decodes class keeping raw state of nested class, list and dict properties, which are decoded on first attribute
+    access. Instances are created from a generated subclass holding lazy descriptors; they compare equal to eagerly
+    decoded instances, and are pickled (and deep copied) as instances of the decoded class. Classes without
+    `__dict__` are decoded eagerly.
+    """
+
+    def decode(self, value: StateObject) -> Any:
+        if not isinstance(value, dict):
+            raise DecoderError.invalid_input
+
+        if not hasattr(self, "_plan"):
+            self._plan = self._build_plan()
+
+        instance = self._instance_type.__new__(self._instance_type)  # type: ignore
+
+        return self._populate(instance, value)
+
+    def _populate(self, instance: Any, value: Dict[str, Any], partial: bool = False) -> Any:
+        if not hasattr(self, "_plan"):
+            self._plan = self._build_plan()
+
+        lazy_fields = self._lazy_fields if type(instance) is self._instance_type else ()
+        state = None
+        if lazy_fields:
+            state = getattr(instance, _LAZY_STATE, None)
+            if state is None:
+                state = {}
+                setattr(instance, _LAZY_STATE, state)
+        for key, prop, decoder, attribute, setter in self._plan:
+            if key in value:
+                if key in lazy_fields:
+                    instance.__dict__.pop(key, None)
+                    state[key] = value[key]  # type: ignore
+                    continue
+                prop_value = decoder.decode(value[key])
+            elif partial:
+                continue
+            else:
+                prop_value = prop.default_value
+            if prop_value is UNDEFINED:
+                continue
+            if setter is None:
+                setattr(instance, attribute, prop_value)
+            else:
+                setter(instance, prop_value)
+
+        if hasattr(instance, "__post_init__"):
+            instance.__post_init__()
+
+        return instance
+
+    def _build_plan(self) -> List[Any]:
+        plan = super()._build_plan()
+        self._lazy_fields = {
+            key
+            for key, prop, _, attribute, _ in plan
+            if self.class_name.__dictoffset__
+            and attribute == key
+            and _is_deferred_type(prop.type)
+            and not hasattr(type(getattr_static(self.class_name, key, None)), "__set__")
+        }
+        self._instance_type = self._build_lazy_class(plan) if self._lazy_fields else self.class_name
+
+        return plan
+
+    def _build_lazy_class(self, plan: List[Any]) -> Type:
+        namespace: Dict[str, Any] = {
+            key: _LazyProperty(key, decoder) for key, _, decoder, _, _ in plan if key in self._lazy_fields
+        }
+        namespace["__slots__"] = (_LAZY_STATE,)
+        if self.class_name.__eq__ is not object.__eq__:
+            namespace["__eq__"] = _lazy_eq
+            namespace["__hash__"] = self.class_name.__hash__
+        namespace["__copy__"] = _lazy_copy
+        namespace["__reduce_ex__"] = _lazy_reduce_ex
+        namespace["__qualname__"] = self.class_name.__qualname__
+        namespace["__module__"] = self.class_name.__module__
+        namespace[_LAZY_OF] = self.class_name
+
+        return type(self.class_name)(self.class_name.__name__, (self.class_name,), namespace)  # type: ignore
+
+
+class LazyDecoder(Generic[T]):
+    """
+    Decodes values of the type (a class, or any type hint e.g. `List[Book]`) lazily: nested class, list and dict
+    properties of all classes reachable from the type are decoded on first attribute access.
+    """
+
+    def __init__(self, a_type: Type[T], decoders: Union[TypeDecoders, dict] = None):
+        registry = TypeDecoders(decoders or {})
+        for cls in get_nested_types(a_type):
+            if _is_class_with_schema(cls) and cls not in registry:
+                registry[cls] = LazyClassDecoder(cls, registry, force=True)
+
+        self.type_decoders = registry
+        self._decoder: TypeDecoder = build_type_decoder(a_type, registry, force=True)  # type: ignore
+
+    def decode(self, value: Any) -> T:
+        return self._decoder.decode(value)
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import datetime
+import sys
+from json import loads
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Type, Union
+
+from .error import DecoderError, EncoderError, SerialisationError
+from .iso_datetime import parse_iso_date, parse_iso_datetime, parse_iso_duration, timedelta_to_iso_duration
+from .typing import Property, create_schema, get_type_args
+
+__all__ = [
+    "decode_array",
+    "encode_array",
+    "get_ndarray_dtype",
+    "get_numpy_dtype",
+    "get_structured_dtype",
+    "from_numpy_column",
+    "is_ndarray",
+    "is_ndarray_type",
+    "is_temporal_column",
+    "require_numpy",
+    "to_numpy_column",
+]
+
+_NUMPY_DTYPES = {
+    bool: "bool",
+    int: "int64",
+    float: "float64",
+    datetime.datetime: "datetime64[us]",
+    datetime.date: "datetime64[D]",
+    datetime.timedelta: "timedelta64[us]",
+}
+
+
+def require_numpy() -> Any:
+    """
+    Imports numpy on first use, so importing chili does not import it.
+    """
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        raise SerialisationError.missing_dependency(message="numpy is required, install it with `pip install numpy`")
+
+    return numpy
+
+
+def is_ndarray(value: Any) -> bool:
+    # arrays can only exist if numpy has been imported already
+    numpy = sys.modules.get("numpy")
+
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def is_ndarray_type(a_type: Any) -> bool:
+    numpy = sys.modules.get("numpy")
+
+    return numpy is not None and a_type is numpy.ndarray
+
+
+def get_ndarray_dtype(a_type: Any) -> Any:
+    """
+    Returns dtype from `numpy.ndarray[shape, numpy.dtype[scalar]]` (`numpy.typing.NDArray[scalar]`) annotation,
+    or `None` if dtype is not specified.
+    """
+    type_args = get_type_args(a_type)
+    if len(type_args) != 2:
+        return None
+
+    dtype_args = get_type_args(type_args[1])
+    if not dtype_args or dtype_args[0] is Any:
+        return None
+
+    try:
+        return require_numpy().dtype(dtype_args[0])
+    except TypeError:
+        return None
+
+
+def get_numpy_dtype(a_type: Type) -> Optional[str]:
+    """
+    Returns name of numpy dtype corresponding to the type, or `None` if the type has no native numpy counterpart.
+    """
+    return _NUMPY_DTYPES.get(a_type)
+
+
+def _to_naive_utc(value: datetime.datetime) -> datetime.datetime:
+    if value.tzinfo is None:
+        return value
+
+    return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def to_numpy_column(values: Sequence[Any], a_type: Type) -> Union[List[Any], Any]:
+    """
+    Converts list of values into numpy array if the type has a native numpy dtype. Other values are returned
+    untouched. `datetime64` holds no timezone, so timezone aware datetimes are rejected.
+    """
+    dtype = _NUMPY_DTYPES.get(a_type)
+    if dtype is None:
+        return values
+
+    numpy = require_numpy()
+    if a_type is datetime.datetime:
+        aware = next((value for value in values if value is not None and value.tzinfo is not None), None)
+        if aware is not None:
+            raise EncoderError.invalid_input(f"timezone aware datetime {aware} cannot be stored in numpy column")
+
+    return numpy.array(values, dtype=dtype)
+
+
+def from_numpy_column(column: Any) -> List[Any]:
+    """
+    Converts numpy array into list of python values, datetime64 and timedelta64 items become
+    `datetime.datetime`, `datetime.date` and `datetime.timedelta` instances.
+    """
+    if not is_ndarray(column):
+        return column
+
+    if column.dtype.kind == "M" and column.dtype.name != "datetime64[D]":
+        column = column.astype("datetime64[us]")
+    elif column.dtype.kind == "m":
+        column = column.astype("timedelta64[us]")
+
+    return column.tolist()
+
+
+def is_temporal_column(column: Any) -> bool:
+    return is_ndarray(column) and column.dtype.kind in "Mm"
+
+
+def _parse_datetime(value: Any) -> datetime.datetime:
+    if isinstance(value, str):
+        value = parse_iso_datetime(value)
+
+    return _to_naive_utc(value)
+
+
+def _parse_date(value: Any) -> datetime.date:
+    return parse_iso_date(value) if isinstance(value, str) else value
+
+
+def _parse_duration(value: Any) -> datetime.timedelta:
+    return parse_iso_duration(value) if isinstance(value, str) else value
+
+
+_ARRAY_PARSERS: Dict[Type, Callable[[Any], Any]] = {
+    datetime.datetime: _parse_datetime,
+    datetime.date: _parse_date,
+    datetime.timedelta: _parse_duration,
+}
+
+_ARRAY_FORMATTERS: Dict[Type, Callable[[Any], Any]] = {
+    datetime.datetime: lambda value: value.isoformat(),
+    datetime.date: lambda value: value.isoformat(),
+    datetime.timedelta: timedelta_to_iso_duration,
+}
+
+
+def get_structured_dtype(a_type: Type, str_sizes: Optional[Dict[str, int]] = None) -> Any:
+    """
+    Returns numpy structured dtype for a flat class built of `bool`, `int`, `float`, `str`, `datetime`,
+    `date` and `timedelta` properties. Strings are stored in fixed-size fields, so every `str` property
+    requires its size (in characters) in `str_sizes`.
+    """
+    numpy = require_numpy()
+    str_sizes = str_sizes or {}
+    fields = []
+    for name, prop in create_schema(a_type).items():  # type: ignore
+        if prop.type is str:
+            if name not in str_sizes:
+                raise DecoderError.invalid_type(f"size of string property `{name}` is required")
+            fields.append((name, f"U{max(str_sizes[name], 1)}"))
+            continue
+        if prop.type not in _NUMPY_DTYPES:
+            raise DecoderError.invalid_type(prop.type)
+        fields.append((name, _NUMPY_DTYPES[prop.type]))
+
+    return numpy.dtype(fields)
+
+
+def _read_columns(data: Any, schema: Dict[str, Property]) -> Dict[str, Sequence[Any]]:
+    if isinstance(data, (str, bytes)):
+        data = [loads(line) for line in data.splitlines() if line.strip()]
+
+    if isinstance(data, dict):
+        if set(data.keys()) == {"fields", "columns"}:
+            return dict(zip(data["fields"], data["columns"]))
+        return data
+
+    if not isinstance(data, list):
+        data = list(data)
+
+    return {
+        name: [item[name] if name in item else _default_value(prop) for item in data] for name, prop in schema.items()
+    }
+
+
+def _default_value(prop: Property) -> Any:
+    if not prop.has_default:
+        raise DecoderError.missing_property(key=prop.name)
+
+    return prop.default_value
+
+
+def decode_array(
+    data: Union[Iterable[Dict[str, Any]], Dict[str, Sequence[Any]], str, bytes],
+    a_type: Type,
+    str_sizes: Optional[Dict[str, int]] = None,
+) -> Any:
+    """
+    Decodes flat records into numpy structured array without creating instances of the type. Data can be
+    a list of dictionaries, columns (a dictionary holding list of values for every property, also in
+    `{"fields": [...], "columns": [...]}` layout) or NDJSON document. Sizes of string fields which are not
+    present in `str_sizes` are set to the longest value in data, longer values are truncated.
+    Datetimes are stored as naive UTC.
+    """
+    numpy = require_numpy()
+    schema = create_schema(a_type)  # type: ignore
+    columns = _read_columns(data, schema)
+
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise DecoderError.invalid_input(data)
+    length = lengths.pop() if lengths else 0
+
+    for name, prop in schema.items():
+        if name not in columns:
+            columns[name] = [_default_value(prop)] * length
+
+    str_sizes = dict(str_sizes or {})
+    for name, prop in schema.items():
+        if prop.type is str and name not in str_sizes:
+            str_sizes[name] = max((len(value) for value in columns[name]), default=1)
+
+    array = numpy.empty(length, dtype=get_structured_dtype(a_type, str_sizes))
+    for name, prop in schema.items():
+        column = columns[name]
+        parser = _ARRAY_PARSERS.get(prop.type)
+        if parser is not None and not isinstance(column, numpy.ndarray):
+            column = [parser(value) for value in column]
+        try:
+            array[name] = column
+        except (TypeError, ValueError) as error:
+            raise DecoderError.invalid_input(column) from error
+
+    return array
+
+
+def encode_array(array: Any, a_type: Type) -> List[Dict[str, Any]]:
+    """
+    Encodes numpy structured array into list of dictionaries, datetimes, dates and timedeltas are encoded
+    as iso strings.
+    """
+    require_numpy()
+    schema = create_schema(a_type)  # type: ignore
+    if array.dtype.names is None or set(schema.keys()) - set(array.dtype.names):
+        raise EncoderError.invalid_input(array.dtype)
+
+    columns = {}
+    for name, prop in schema.items():
+        values = from_numpy_column(array[name])
+        formatter = _ARRAY_FORMATTERS.get(prop.type)
+        columns[name] = [formatter(value) for value in values] if formatter is not None else values
+
+    names = list(columns.keys())
+
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Any, Generic, List, Type, TypeVar, Union
+
+from .decoder import ClassDecoder, TypeDecoder, TypeDecoders, build_type_decoder
+from .encoder import ClassEncoder, TypeEncoder, TypeEncoders, build_type_encoder
+from .error import DecoderError
+from .typing import UNDEFINED, _is_class_with_schema, create_schema, get_nested_types, type_name
+
+__all__ = [
+    "PositionalClassEncoder",
+    "PositionalClassDecoder",
+    "PositionalEncoder",
+    "PositionalDecoder",
+    "schema_fingerprint",
+]
+
+T = TypeVar("T")
+
+
+def _positional_classes(a_type: Type) -> List[Type]:
+    return [nested_type for nested_type in get_nested_types(a_type) if _is_class_with_schema(nested_type)]
+
+
+@lru_cache(maxsize=None)
+def schema_fingerprint(a_type: Type) -> str:
+    """
+    Returns short hash of the type and schemas (property names, order and types) of all classes reachable from it.
+    Fingerprint changes whenever positional layout of encoded data changes.
+    """
+    digest = blake2b(type_name(a_type).encode("utf8"), digest_size=4)
+    for cls in sorted(_positional_classes(a_type), key=type_name):
+        digest.update(type_name(cls).encode("utf8"))
+        for name, prop in create_schema(cls).items():  # type: ignore
+            digest.update(f"{name}={type_name(prop.type)}".encode("utf8"))
+
+    return digest.hexdigest()
+
+
+class PositionalClassEncoder(ClassEncoder):
+    """
+    Encodes object into a list of its property values in the schema order.
+    """
+
+    def encode(self, value: Any) -> List[Any]:  # type: ignore[override]
+        if not hasattr(self, "_fields"):
+            self._fields = self._build()
+
+        result = []
+        for name, field in self._schema.items():
+            prop_value = getattr(value, name, UNDEFINED)
+            if prop_value is UNDEFINED:
+                prop_value = field.default_value
+            result.append(self._fields[name].encode(prop_value))
+
+        return result
+
+
+class PositionalClassDecoder(ClassDecoder):
+    """
+    Decodes list of property values in the schema order into an instance of the class.
+    """
+
+    def decode(self, value: List[Any]) -> Any:  # type: ignore[override]
+        if not hasattr(self, "_plan"):
+            self._plan = self._build_plan()
+
+        if not isinstance(value, (list, tuple)) or len(value) != len(self._plan):
+            raise DecoderError.invalid_input(value)
+
+        instance = self.class_name.__new__(self.class_name)  # type: ignore
+        for (_, _, decoder, attribute, setter), item in zip(self._plan, value):
+            prop_value = decoder.decode(item)
+            if prop_value is UNDEFINED:
+                continue
+            if setter is None:
+                setattr(instance, attribute, prop_value)
+            else:
+                setter(instance, prop_value)
+
+        if hasattr(instance, "__post_init__"):
+            instance.__post_init__()
+
+        return instance
+
+
+class PositionalEncoder(Generic[T]):
+    """
+    Encodes values of the type (a class, or any type hint e.g. `List[Book]`) in positional mode: objects of all
+    classes reachable from the type become lists of their property values. Result is a pair of the schema
+    fingerprint and the encoded value.
+    """
+
+    def __init__(self, a_type: Type[T], encoders: Union[TypeEncoders, dict] = None):
+        registry = TypeEncoders(encoders or {})
+        for cls in _positional_classes(a_type):
+            if cls not in registry:
+                registry[cls] = PositionalClassEncoder(cls, registry, force=True)
+
+        self.fingerprint = schema_fingerprint(a_type)  # type: ignore
+        self.type_encoders = registry
+        self._encoder: TypeEncoder = build_type_encoder(a_type, registry, force=True)  # type: ignore
+
+    def encode(self, obj: T) -> List[Any]:
+        return [self.fingerprint, self._encoder.encode(obj)]
+
+
+class PositionalDecoder(Generic[T]):
+    """
+    Decodes data produced by `PositionalEncoder`, fails with `DecoderError.invalid_input` if the data was
+    encoded with a different schema.
+    """
+
+    def __init__(self, a_type: Type[T], decoders: Union[TypeDecoders, dict] = None):
+        registry = TypeDecoders(decoders or {})
+        for cls in _positional_classes(a_type):
+            if cls not in registry:
+                registry[cls] = PositionalClassDecoder(cls, registry, force=True)
+
+        self.fingerprint = schema_fingerprint(a_type)  # type: ignore
+        self.type_decoders = registry
+        self._decoder: TypeDecoder = build_type_decoder(a_type, registry, force=True)  # type: ignore
+
+    def decode(self, data: List[Any]) -> T:
+        if not isinstance(data, (list, tuple)) or len(data) != 2:
+            raise DecoderError.invalid_input(data)
+
+        fingerprint, value = data
+        if fingerprint != self.fingerprint:
+            raise DecoderError.invalid_input(f"schema fingerprint mismatch: {fingerprint} != {self.fingerprint}")
+
+        return self._decoder.decode(value)
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from collections.abc import Sized
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .error import SerialisationError
+from .typing import _PROPERTIES, Property, create_schema, get_origin_type, is_class, is_dataclass
+
+__all__ = [
+    "OmitOptions",
+    "Selection",
+    "create_omit_options",
+    "create_selection",
+    "compile_omit_check",
+    "check_fields",
+    "restrict_selection",
+    "selectable_fields",
+    "select_fields",
+    "select_items",
+]
+
+WILDCARD = "*"
+
+# Selection tree: sorted pairs of field name and subtree, empty subtree selects the whole field.
+SelectionTree = Tuple[Tuple[str, "SelectionTree"], ...]  # type: ignore
+
+
+class Selection(NamedTuple):
+    only: Optional[SelectionTree]
+    exclude: Optional[SelectionTree]
+
+
+def _create_tree(paths: Iterable[str]) -> SelectionTree:
+    root: Dict[str, dict] = {}
+    for path in paths:
+        node = root
+        for name in path.split("."):
+            if not name:
+                raise SerialisationError.invalid_input(path)
+            node = node.setdefault(name, {})
+
+    def _freeze(node: Dict[str, dict]) -> SelectionTree:
+        return tuple(sorted((name, _freeze(child)) for name, child in node.items()))
+
+    return _freeze(root)
+
+
+@lru_cache(maxsize=None)
+def _cached_selection(only: Optional[Tuple[str, ...]], exclude: Optional[Tuple[str, ...]]) -> Optional[Selection]:
+    if only is None and not exclude:
+        return None
+
+    return Selection(
+        _create_tree(only) if only is not None else None,
+        _create_tree(exclude) if exclude else None,
+    )
+
+
+def create_selection(
+    only: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None
+) -> Optional[Selection]:
+    """
+    Compiles `only` and `exclude` field paths (e.g. `author.last_name`, `tags.*.name`) into a selection,
+    returns `None` when all fields are selected.
+    """
+    if isinstance(only, str) or isinstance(exclude, str):
+        raise SerialisationError.invalid_input("field paths have to be passed as a collection of strings")
+
+    return _cached_selection(
+        tuple(sorted(only)) if only is not None else None,
+        tuple(sorted(exclude)) if exclude is not None else None,
+    )
+
+
+def _child(selection: Optional[Selection]) -> Optional[Selection]:
+    if selection is None or (not selection.only and not selection.exclude):
+        return None
+
+    return Selection(selection.only or None, selection.exclude or None)
+
+
+def check_fields(selection: Optional[Selection], names: Iterable[str]) -> None:
+    """
+    Raises an error when selection refers to fields missing from `names`.
+    """
+    if selection is None:
+        return
+
+    unknown = {name for name, _ in (selection.only or ()) + (selection.exclude or ())} - set(names) - {WILDCARD}
+    if unknown:
+        raise SerialisationError.invalid_input(f"unknown fields: {', '.join(sorted(unknown))}")
+
+
+def select_fields(selection: Optional[Selection], names: Iterable[str]) -> List[Tuple[str, Optional[Selection]]]:
+    """
+    Returns selected field names in the given order with selection applying to each field's value.
+    """
+    names = list(names)
+    if selection is None:
+        return [(name, None) for name in names]
+
+    check_fields(selection, names)
+    only = dict(selection.only) if selection.only is not None else None
+    exclude = dict(selection.exclude) if selection.exclude is not None else {}
+
+    result = []
+    for name in names:
+        only_tree = None
+        if only is not None:
+            if name not in only and WILDCARD not in only:
+                continue
+            only_tree = only.get(name, only.get(WILDCARD))
+        exclude_tree = exclude.get(name)
+        if exclude_tree == ():
+            continue
+        result.append((name, _child(Selection(only_tree, exclude_tree))))
+
+    return result
+
+
+def _item_tree(tree: Optional[SelectionTree]) -> Optional[SelectionTree]:
+    if not tree:
+        return None
+
+    nodes = dict(tree)
+    if WILDCARD in nodes:
+        return nodes[WILDCARD] or None
+
+    return tree
+
+
+def select_items(selection: Optional[Selection]) -> Optional[Selection]:
+    """
+    Returns selection applying to items of a collection, `tags.*.name` and `tags.name` are equivalent.
+    """
+    if selection is None:
+        return None
+
+    return _child(Selection(_item_tree(selection.only), _item_tree(selection.exclude)))
+
+
+def selectable_fields(a_type: Any) -> Optional[List[str]]:
+    """
+    Returns names of fields which can be selected in values of the type (a dataclass or a class with a schema,
+    possibly parametrized), or `None` when fields of the type cannot be selected.
+    """
+    cls = get_origin_type(a_type) or a_type
+    if not is_class(cls) or not (is_dataclass(cls) or hasattr(cls, _PROPERTIES)):
+        return None
+
+    return list(create_schema(cls).keys())  # type: ignore
+
+
+def restrict_selection(selection: Optional[Selection], names: Iterable[str]) -> Optional[Selection]:
+    """
+    Returns selection without paths starting at fields missing from `names`, used for members of a union which
+    do not declare every selected field.
+    """
+    if selection is None:
+        return None
+
+    known = set(names) | {WILDCARD}
+
+    def _restrict(tree: Optional[SelectionTree]) -> Optional[SelectionTree]:
+        return None if tree is None else tuple(node for node in tree if node[0] in known)
+
+    return Selection(_restrict(selection.only), _restrict(selection.exclude) or None)
+
+
+class OmitOptions(NamedTuple):
+    exclude_none: bool
+    exclude_defaults: bool
+    exclude_empty: bool
+
+
+def create_omit_options(
+    exclude_none: bool = False, exclude_defaults: bool = False, exclude_empty: bool = False
+) -> Optional[OmitOptions]:
+    if not (exclude_none or exclude_defaults or exclude_empty):
+        return None
+
+    return OmitOptions(exclude_none, exclude_defaults, exclude_empty)
+
+
+def _is_empty(value: Any) -> bool:
+    return isinstance(value, Sized) and not isinstance(value, type) and len(value) == 0
+
+
+def compile_omit_check(prop: Property, options: Optional[OmitOptions]) -> Optional[Callable[[Any], bool]]:
+    """
+    Returns predicate telling whether value of the property should be left out of encoded data,
+    or `None` if the value is always encoded. Default value is evaluated once.
+    """
+    if options is None:
+        return None
+
+    checks: List[Callable[[Any], bool]] = []
+    if options.exclude_none:
+        checks.append(lambda value: value is None)
+    if options.exclude_defaults and prop.has_default:
+        default = prop.default_value
+        checks.append(lambda value: value is default or type(value) is type(default) and value == default)
+    if options.exclude_empty:
+        checks.append(_is_empty)
+
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+
+    return lambda value: any(check(value) for check in checks)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from enum import Enum
+from json import dumps, loads
+from typing import Any, BinaryIO, Generic, Iterable, Iterator, List, Optional, Type, TypeVar, Union, overload
+
+from . import binary
+from .error import SerialisationError
+from .serializer import Serializer
+from .typing import is_class
+
+__all__ = [
+    "RecordFile",
+    "RecordFormat",
+]
+
+T = TypeVar("T")
+
+_INDEX_SUFFIX = ".idx"
+_OFFSET_TYPECODE = "Q"
+_OFFSET = struct.Struct(f"<{_OFFSET_TYPECODE}")
+
+
+class RecordFormat(Enum):
+    NDJSON = "ndjson"
+    BINARY = "binary"
+
+
+class _MappedFile:
+    """
+    Read-only memory map of a growing file. The map is kept between reads, `refresh` remaps the file once it grew.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.size = 0
+        self._file: Optional[BinaryIO] = None
+        self._map: Optional[mmap.mmap] = None
+
+    @property
+    def map(self) -> Union[mmap.mmap, bytes]:
+        return self._map if self._map is not None else b""
+
+    def refresh(self) -> None:
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if size != self.size:
+            self.close()
+            self.size = size
+            if size:
+                self._file = open(self.path, "rb")
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.size = 0
+
+
+class RecordFile(Generic[T]):
+    """
+    Append-only file of records with random access by index. Every appended record's offset is stored in
+    a sidecar index file (`<path>.idx`), reading memory maps both files and decodes only requested records.
+    Records are stored as NDJSON lines or as `chili.binary` records.
+    """
+
+    __generic__: Type[T]
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        record_format: RecordFormat = RecordFormat.NDJSON,
+        encoders: Any = None,
+        decoders: Any = None,
+    ):
+        self.path = os.fspath(path)
+        self.index_path = self.path + _INDEX_SUFFIX
+        self.record_format = record_format
+        self._serializer = Serializer[self.__generic__](encoders, decoders)  # type: ignore
+        self._writer: Optional[BinaryIO] = None
+        self._index_writer: Optional[BinaryIO] = None
+        self._data = _MappedFile(self.path)
+        self._index = _MappedFile(self.index_path)
+        self._stale = True
+
+        if os.path.exists(self.path) and not os.path.exists(self.index_path):
+            self.rebuild_index()
+
+    def append(self, obj: T) -> int:
+        """
+        Appends record and returns its index.
+        """
+        if self._writer is None:
+            self._writer = open(self.path, "ab")
+            self._index_writer = open(self.index_path, "ab")
+
+        offset = self._writer.seek(0, os.SEEK_END)
+        self._writer.write(self._encode(obj))
+        self._index_writer.write(_OFFSET.pack(offset))  # type: ignore
+        self._stale = True
+
+        return self._index_writer.tell() // _OFFSET.size - 1  # type: ignore
+
+    def extend(self, objs: Iterable[T]) -> None:
+        for obj in objs:
+            self.append(obj)
+
+    def flush(self) -> None:
+        if self._writer is not None:
+            self._writer.flush()
+            self._index_writer.flush()  # type: ignore
+
+    def rebuild_index(self) -> None:
+        """
+        Recreates sidecar index by scanning the data file. NDJSON line without trailing newline is a partially written
+        record and is left out of the index.
+        """
+        self.flush()
+        self._data.refresh()
+        data = self._data.map
+        offsets = array(_OFFSET_TYPECODE)
+        offset = 0
+        while offset < len(data):
+            if self.record_format is RecordFormat.BINARY:
+                offsets.append(offset)
+                _, size = binary.unpack_from(memoryview(data), self.__generic__, offset)
+                offset += size
+                continue
+            end = data.find(b"\n", offset)
+            if end == -1:
+                break
+            offsets.append(offset)
+            offset = end + 1
+
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        self._index.close()
+        self._stale = True
+        with open(self.index_path, "wb") as index_file:
+            offsets.tofile(index_file)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._index_writer.close()  # type: ignore
+            self._writer = None
+            self._index_writer = None
+        self._data.close()
+        self._index.close()
+        self._stale = True
+
+    def __enter__(self) -> RecordFile[T]:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        if self._stale:
+            self.flush()
+            self._data.refresh()
+            self._index.refresh()
+            self._stale = False
+
+        return len(self._index.map) // _OFFSET.size
+
+    @overload
+    def __getitem__(self, index: int) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        length = len(self)
+        if isinstance(index, slice):
+            return [self._read(position) for position in range(*index.indices(length))]
+
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("record index out of range")
+
+        return self._read(index)
+
+    def __iter__(self) -> Iterator[T]:
+        for position in range(len(self)):
+            yield self._read(position)
+
+    def _read(self, position: int) -> T:
+        start = _OFFSET.unpack_from(self._index.map, position * _OFFSET.size)[0]
+        data = self._data.map
+
+        if self.record_format is RecordFormat.BINARY:
+            return binary.unpack_from(memoryview(data), self.__generic__, start)[0]
+
+        return self._serializer.decode(loads(data[start : data.find(b"\n", start)]))
+
+    def _encode(self, obj: T) -> bytes:
+        if self.record_format is RecordFormat.BINARY:
+            return binary.dumps(obj, self.__generic__)
+
+        return dumps(self._serializer.encode(obj)).encode("utf8") + b"\n"
+
+    @classmethod
+    def __class_getitem__(cls, item: Type[T]) -> Type[RecordFile]:  # noqa: E501
+        if not is_class(item):
+            raise SerialisationError.invalid_generic_type
+
+        return type(  # type: ignore
+            f"{cls.__qualname__}[{item.__module__}.{item.__qualname__}]",
+            tuple([cls]),
+            {
+                "__generic__": item,
+            },
+        )
@@ -27,12 +27,15 @@ _DECODE_MAPPER = "__decode_mapper__"
 _ENCODE_MAPPER = "__encode_mapper__"
 _ENCODABLE = "__encodable__"
 _DECODABLE = "__decodable__"
+_VIEW_OF = "__view_of__"
+_VIEW_DATA = "__view_data__"
 UNDEFINED = object()
 
 
 __all__ = [
     "get_class_fields",
     "get_dataclass_fields",
+    "get_nested_types",
     "get_origin_type",
     "get_parameters_map",
     "get_type_args",
@@ -41,12 +44,14 @@ __all__ = [
     "is_class",
     "is_dataclass",
     "is_enum_type",
+    "is_frozen_dataclass",
     "is_named_tuple",
     "is_optional",
     "is_typed_dict",
     "map_generic_type",
     "unpack_optional",
     "resolve_forward_reference",
+    "type_name",
     "create_schema",
     "TypeSchema",
     "Property",
@@ -54,10 +59,7 @@ __all__ = [
 
 
 def get_non_optional_fields(type_name: Type) -> List[str]:
-    if is_encodable(type_name):
-        schema = getattr(type_name, _ENCODABLE)
-    else:
-        schema = create_schema(type_name)  # type: ignore
+    schema = create_schema(type_name)  # type: ignore
 
     return [field.name for field in schema.values() if not is_optional(field.type)]
 
@@ -67,7 +69,7 @@ def get_origin_type(type_name: Type) -> Optional[Type]:
 
 
 def get_type_args(type_name: Type) -> List[Type]:
-    return getattr(type_name, "__args__", [])
+    return list(getattr(type_name, "__args__", ()))
 
 
 def is_encodable(type_name: Type) -> bool:
@@ -86,11 +88,12 @@ def is_optional(type_name: Type) -> bool:
     is_new_union = False
     if _SUPPORT_NEW_UNION:
         is_new_union = type(type_name) is UnionType
-    return (
-        (get_origin_type(type_name) is Union or type(type_name) is Union or is_new_union)
-        and bool(get_type_args(type_name))
-        and get_type_args(type_name)[-1] is type(None)  # noqa
-    )
+    if not (get_origin_type(type_name) is Union or type(type_name) is Union or is_new_union):
+        return False
+
+    type_args = get_type_args(type_name)
+
+    return bool(type_args) and type_args[-1] is type(None)  # noqa
 
 
 def is_newtype(type_name: Type) -> bool:
@@ -107,7 +110,7 @@ def is_newtype(type_name: Type) -> bool:
 
 
 def get_type_parameters(type_name: Type) -> List[Type]:
-    return getattr(get_origin_type(type_name), "__parameters__", [])
+    return list(getattr(get_origin_type(type_name), "__parameters__", ()))
 
 
 def get_parameters_map(type_name: Type) -> Dict[Type, Type]:
@@ -133,6 +136,11 @@ def is_enum_type(type_name: Type) -> bool:
     return issubclass(type_name, Enum)
 
 
+def is_frozen_dataclass(type_name: Type) -> bool:
+    params = getattr(type_name, "__dataclass_params__", None)
+    return params is not None and params.frozen
+
+
 def is_named_tuple(type_name: Type) -> bool:
     return issubclass(type_name, tuple) and hasattr(type_name, "_fields")
 
@@ -145,6 +153,14 @@ def is_user_string(type_name: Type) -> bool:
     return issubclass(type_name, UserString)
 
 
+def _is_class_with_schema(type_name: Any) -> bool:
+    return (
+        is_class(type_name)
+        and get_origin_type(type_name) is None
+        and (is_dataclass(type_name) or hasattr(type_name, _PROPERTIES))
+    )
+
+
 def map_generic_type(type_name: Any, type_map: Dict[Any, Any]) -> Any:
     if not type_map:
         return type_name
@@ -152,16 +168,90 @@ def map_generic_type(type_name: Any, type_map: Dict[Any, Any]) -> Any:
     type_args = get_type_args(type_name)
     origin_type = get_origin_type(type_name)
 
-    if origin_type is None:  # not a generic type
-        return type_name
+    if origin_type is None:  # not a generic type, or a bare type variable
+        return type_map.get(type_name, type_name)
 
     if type_args:
-        mapped_args = tuple([type_map[arg] for arg in type_args])
+        mapped_args = tuple(map_generic_type(arg, type_map) for arg in type_args)
+        if mapped_args == type_args:
+            return type_name
+        if hasattr(type_name, "copy_with"):  # keeps special forms, e.g. `Optional[T]`
+            return type_name.copy_with(mapped_args)
         return _GenericAlias(origin_type, mapped_args)
 
     return type_name
 
 
+def get_nested_types(type_name: Type) -> List[Type]:
+    """
+    Returns passed type followed by every type reachable from it through type arguments, newtype supertypes
+    and properties of classes with a schema (dataclasses, decodable/encodable classes, named tuples and typed dicts).
+    """
+    result: List[Type] = []
+    seen = set()
+
+    def _collect(a_type: Type) -> None:
+        try:
+            if a_type in seen:
+                return
+            seen.add(a_type)
+        except TypeError:
+            return
+        result.append(a_type)
+
+        if is_newtype(a_type):
+            _collect(a_type.__supertype__)
+            return
+
+        for type_arg in get_type_args(a_type):
+            if type_arg is not Ellipsis:
+                _collect(type_arg)
+
+        origin_type = get_origin_type(a_type) or a_type
+        if not is_class(origin_type) or not (
+            is_dataclass(origin_type)
+            or hasattr(origin_type, _PROPERTIES)
+            or is_named_tuple(origin_type)
+            or is_typed_dict(origin_type)
+        ):
+            return
+
+        try:
+            schema = create_schema(origin_type)  # type: ignore
+        except SerialisationError:
+            return
+        parameters = get_parameters_map(a_type)
+        for prop in schema.values():
+            _collect(parameters.get(prop.type, prop.type) if parameters else prop.type)
+
+    _collect(type_name)
+
+    return result
+
+
+def type_name(a_type: Any) -> str:
+    """
+    Returns name of the type in `module:qualname` format, parametrized types are written as
+    `module:qualname[argument, ...]`, e.g. `builtins:list[app.models:Book]`. Names do not depend on memory
+    addresses, so they are stable between processes.
+    """
+    if a_type is None or a_type is type(None):
+        return "None"
+    if isinstance(a_type, (str, bytes, int)):  # arguments of Literal
+        return repr(a_type)
+    if is_newtype(a_type):  # repr of NewType holds memory address on older pythons
+        return f"{getattr(a_type, '__module__', 'typing')}:{a_type.__name__}"
+
+    origin_type = get_origin_type(a_type)
+    if origin_type is not None and get_type_args(a_type):
+        return f"{type_name(origin_type)}[{', '.join(type_name(arg) for arg in get_type_args(a_type))}]"
+
+    module = getattr(a_type, "__module__", "builtins")
+    name = getattr(a_type, "__qualname__", None) or getattr(a_type, "_name", None) or repr(a_type)
+
+    return f"{module}:{name}"
+
+
 def resolve_forward_reference(module: Any, ref: Union[typing.ForwardRef, str]) -> Any:
     if isinstance(ref, typing.ForwardRef):
         name = ref.__forward_arg__
@@ -191,6 +281,10 @@ class Property:
         self._default_value = default_value if default_value is not MISSING else UNDEFINED
         self._default_factory = default_factory
 
+    @property
+    def has_default(self) -> bool:
+        return self._default_value is not UNDEFINED or self._default_factory is not None
+
     @property
     def default_value(self) -> Any:
         if self._default_value is not UNDEFINED:
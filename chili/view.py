@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Type, TypeVar
+
+from .decoder import TypeDecoders, build_type_decoder
+from .error import DecoderError
+from .state import StateObject
+from .typing import (
+    _VIEW_DATA,
+    _VIEW_OF,
+    Property,
+    _is_class_with_schema,
+    create_schema,
+    get_origin_type,
+    get_type_args,
+    is_optional,
+    unpack_optional,
+)
+
+__all__ = [
+    "view",
+    "view_type",
+    "is_view",
+]
+
+T = TypeVar("T")
+
+_VIEW_CACHE = "__view_cache__"
+_SEQUENCE_TYPES = {list, tuple, set, frozenset}
+
+
+def is_view(obj: Any) -> bool:
+    return _VIEW_OF in type(obj).__dict__
+
+
+def _build_converter(a_type: Any, decoders: TypeDecoders) -> Callable[[Any], Any]:
+    if decoders and a_type in decoders:
+        return decoders[a_type].decode
+
+    if is_optional(a_type) and len(get_type_args(a_type)) == 2:
+        convert = _build_converter(unpack_optional(a_type), decoders)
+        return lambda value: None if value is None else convert(value)
+
+    if _is_class_with_schema(a_type):
+        return lambda value: view(value, a_type, decoders)
+
+    type_args = get_type_args(a_type)
+    origin_type = get_origin_type(a_type)
+    if origin_type in _SEQUENCE_TYPES and len(type_args) == 1 and _is_class_with_schema(type_args[0]):
+        item_type = type_args[0]
+        return lambda value: origin_type(view(item, item_type, decoders) for item in value)  # type: ignore
+
+    return build_type_decoder(a_type, decoders, force=True).decode  # type: ignore
+
+
+class _ViewProperty:
+    """
+    Read-only descriptor converting property's raw value on first access and memoizing the result.
+    """
+
+    def __init__(self, prop: Property, decoders: TypeDecoders):
+        self.name = prop.name
+        self.prop = prop
+        self.decoders = decoders
+
+    def __get__(self, instance: Any, owner: Type) -> Any:
+        if instance is None:
+            return self
+
+        cache = getattr(instance, _VIEW_CACHE)
+        if self.name in cache:
+            return cache[self.name]
+
+        data = getattr(instance, _VIEW_DATA)
+        if self.name in data:
+            if not hasattr(self, "_convert"):
+                self._convert = _build_converter(self.prop.type, self.decoders)
+            value = self._convert(data[self.name])
+        elif is_optional(self.prop.type) or self.prop.has_default:
+            value = self.prop.default_value
+        else:
+            raise DecoderError.missing_property(key=self.name)
+
+        cache[self.name] = value
+
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        raise AttributeError(f"cannot assign to field '{self.name}' of a read-only view")
+
+    def __delete__(self, instance: Any) -> None:
+        raise AttributeError(f"cannot delete field '{self.name}' of a read-only view")
+
+
+def _read_only(self: Any, name: str, value: Any = None) -> None:
+    raise AttributeError(f"cannot modify read-only view of {type(self).__qualname__}")
+
+
+@lru_cache(maxsize=None)
+def view_type(a_type: Type[T], decoders: TypeDecoders = None) -> Type[T]:
+    """
+    Returns generated read-only subclass of the type, which exposes properties of the type's schema over a dict.
+    """
+    if not _is_class_with_schema(a_type):
+        raise DecoderError.invalid_type(a_type)
+
+    namespace: Dict[str, Any] = {
+        name: _ViewProperty(prop, decoders) for name, prop in create_schema(a_type).items()  # type: ignore
+    }
+    namespace["__slots__"] = (_VIEW_DATA, _VIEW_CACHE)
+    namespace["__qualname__"] = a_type.__qualname__
+    namespace["__module__"] = a_type.__module__
+    namespace["__setattr__"] = _read_only
+    namespace["__delattr__"] = _read_only
+    namespace[_VIEW_OF] = a_type
+
+    return type(a_type)(a_type.__name__, (a_type,), namespace)  # type: ignore
+
+
+def view(data: StateObject, a_type: Type[T], decoders: Any = None) -> T:
+    """
+    Returns read-only proxy over the dict, which exposes properties of the type. Values are converted on first
+    access and memoized, nested objects are views as well and collections of them keep their declared type
+    (`List[T]` is a list of views). Encoding a view returns properties of the dict without converting them.
+    """
+    if not isinstance(data, dict):
+        raise DecoderError.invalid_input(data)
+
+    if decoders and not isinstance(decoders, TypeDecoders):
+        decoders = TypeDecoders(decoders)
+
+    cls = view_type(a_type, decoders or None)  # type: ignore
+    instance = cls.__new__(cls)
+    object.__setattr__(instance, _VIEW_DATA, data)
+    object.__setattr__(instance, _VIEW_CACHE, {})
+
+    return instance
@@ -0,0 +1,154 @@
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from chili.bench import (
+    benchmark,
+    compare,
+    get_cases,
+    load_results,
+    main,
+    measure,
+    run,
+    save_results,
+    summarize,
+    welch_test,
+)
+
+
+def test_can_measure_callable() -> None:
+    # given
+    calls = []
+
+    # when
+    loops, values = measure(lambda: calls.append(1), repeat=3, min_time=0.001)
+
+    # then
+    assert loops > 1
+    assert len(values) == 3
+    assert all(value > 0 for value in values)
+    assert len(calls) >= loops * 4
+
+
+def test_can_register_and_filter_cases() -> None:
+    # given
+    @benchmark("test_bench.sum", "encode", repeat=2)
+    def _sum():
+        numbers = list(range(10))
+        return lambda: sum(numbers)
+
+    # when
+    cases = get_cases(r"^test_bench\.")
+
+    # then
+    assert [case.name for case in cases] == ["test_bench.sum"]
+    assert cases[0].group == "encode"
+    assert cases[0].repeat == 2
+    assert cases[0].setup()() == 45
+
+
+def test_can_run_cases_and_store_results(tmp_path: Path) -> None:
+    # given
+    @benchmark("test_bench.len", "decode")
+    def _len():
+        return lambda: len("chili")
+
+    reported = []
+
+    # when
+    results = run(
+        get_cases(r"^test_bench\.len$"), repeat=2, min_time=0.001, progress=lambda name, _: reported.append(name)
+    )
+    save_results(results, tmp_path / "results.json")
+
+    # then
+    assert reported == ["test_bench.len"]
+    assert set(results["metadata"]) == {"chili", "python", "implementation", "platform", "created"}
+    assert results["benchmarks"]["test_bench.len"]["group"] == "decode"
+    assert len(results["benchmarks"]["test_bench.len"]["values"]) == 2
+    assert load_results(tmp_path / "results.json") == results
+
+
+def test_can_summarize_values() -> None:
+    # when
+    summary = summarize([float(value) for value in range(1, 101)])
+
+    # then
+    assert summary.samples == 100
+    assert summary.mean == 50.5
+    assert summary.p50 == 50.5
+    assert summary.p99 == 99.0
+
+
+@pytest.mark.parametrize(
+    "base, head, expected",
+    [
+        ([1.0, 2.0, 3.0, 4.0, 5.0], [2.0, 3.0, 4.0, 5.0, 6.0], 0.3466),
+        ([1.0, 1.0], [1.0, 1.0], 1.0),
+        ([1.0, 1.0], [2.0, 2.0], 0.0),
+        ([1.0], [2.0, 3.0], 1.0),
+    ],
+)
+def test_welch_test(base: List[float], head: List[float], expected: float) -> None:
+    assert welch_test(base, head) == pytest.approx(expected, abs=1e-4)
+
+
+def _results(**benchmarks: List[float]) -> Dict[str, Any]:
+    return {"metadata": {}, "benchmarks": {name: {"values": values} for name, values in benchmarks.items()}}
+
+
+def test_can_compare_results() -> None:
+    # given
+    base = _results(fast=[1.0, 1.1, 0.9, 1.0], slow=[1.0, 1.1, 0.9, 1.0], same=[1.0, 1.1, 0.9, 1.0], gone=[1.0])
+    head = _results(fast=[0.5, 0.55, 0.45, 0.5], slow=[2.0, 2.2, 1.8, 2.0], same=[1.0, 0.9, 1.1, 1.0], new=[1.0])
+
+    # when
+    comparisons = {item.name: item for item in compare(base, head, threshold=0.1)}
+
+    # then
+    assert set(comparisons) == {"fast", "slow", "same"}
+    assert comparisons["fast"].verdict == "2.00x faster"
+    assert not comparisons["fast"].regression
+    assert comparisons["slow"].verdict == "2.00x slower"
+    assert comparisons["slow"].regression
+    assert comparisons["same"].verdict == "not significant"
+    assert not comparisons["same"].regression
+
+
+def test_compare_command_fails_on_regression(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    # given
+    save_results(_results(decode=[1.0, 1.1, 0.9, 1.0]), tmp_path / "base.json")
+    save_results(_results(decode=[1.2, 1.3, 1.1, 1.2]), tmp_path / "head.json")
+
+    # when
+    failed = main(["compare", str(tmp_path / "base.json"), str(tmp_path / "head.json"), "--threshold", "0.1"])
+    passed = main(["compare", str(tmp_path / "base.json"), str(tmp_path / "head.json"), "--threshold", "0.5"])
+
+    # then
+    assert failed == 1
+    assert passed == 0
+    assert "1.20x slower" in capsys.readouterr().out
+
+
+def test_run_command_loads_suite(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    # given
+    suite = tmp_path / "suite.py"
+    output = tmp_path / "results.json"
+    suite.write_text(
+        "from chili.bench import benchmark\n"
+        "\n"
+        "@benchmark('test_bench_suite.join', 'encode')\n"
+        "def _join():\n"
+        "    return lambda: ','.join('chili')\n"
+    )
+
+    # when
+    code = main(
+        ["run", str(suite), "-k", "^test_bench_suite", "--repeat", "2", "--min-time", "0.001", "-o", str(output)]
+    )
+
+    # then
+    assert code == 0
+    assert "test_bench_suite.join" in capsys.readouterr().out
+    assert list(load_results(output)["benchmarks"]) == ["test_bench_suite.join"]
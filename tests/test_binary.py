@@ -0,0 +1,123 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from chili import binary
+from chili.error import DecoderError, EncoderError
+
+
+@dataclass
+class Sample:
+    value: float
+    count: int
+    valid: bool
+
+
+@dataclass
+class Measurement:
+    sensor: str
+    taken_at: datetime
+    day: date
+    interval: timedelta
+    samples: List[Sample] = field(default_factory=list)
+    labels: Dict[str, int] = field(default_factory=dict)
+    payload: bytes = b""
+    note: Optional[str] = None
+    price: Decimal = Decimal("0")
+    location: Tuple[float, float] = (0.0, 0.0)
+
+
+measurement = Measurement(
+    sensor="s-1",
+    taken_at=datetime(2024, 1, 1, 10, 30, tzinfo=timezone(timedelta(hours=2))),
+    day=date(2024, 1, 1),
+    interval=timedelta(seconds=1.5),
+    samples=[Sample(1.5, 2, True), Sample(-1.0, -3, False)],
+    labels={"a": 1},
+    payload=b"\x00\xff",
+    note="ząb",
+    price=Decimal("1.10"),
+    location=(52.2, 21.0),
+)
+
+
+def test_can_dump_and_load_object() -> None:
+    # when
+    data = binary.dumps(measurement)
+    result = binary.loads(data, Measurement)
+
+    # then
+    assert data[:4] == binary.get_fingerprint(Measurement)
+    assert result == measurement
+    assert result.taken_at.utcoffset() == timedelta(hours=2)
+
+
+def test_keeps_naive_datetimes_naive() -> None:
+    # given
+    naive = Measurement("s-1", datetime(2024, 1, 1, 10, 30), date(2024, 1, 1), timedelta(0))
+
+    # when
+    result = binary.loads(binary.dumps(naive), Measurement)
+
+    # then
+    assert result.taken_at == datetime(2024, 1, 1, 10, 30)
+    assert result.note is None
+
+
+def test_record_is_smaller_than_json() -> None:
+    # given
+    from chili import json_encode
+
+    # then
+    assert len(binary.dumps(Sample(1.5, 2, True))) == 4 + 8 + 8 + 1
+    assert len(binary.dumps(measurement)) < len(json_encode(measurement))
+
+
+def test_can_pack_records_into_preallocated_buffer() -> None:
+    # given
+    buffer = bytearray(256)
+    samples = [Sample(1.0, 1, True), Sample(2.0, 2, False)]
+
+    # when
+    offset = 0
+    for sample in samples:
+        offset += binary.pack_into(buffer, offset, sample)
+
+    first, size = binary.unpack_from(buffer, Sample)
+    second, _ = binary.unpack_from(buffer, Sample, size)
+
+    # then
+    assert offset == 2 * size
+    assert [first, second] == samples
+
+
+def test_can_dump_list_of_objects() -> None:
+    # given
+    samples = [Sample(1.0, 1, True)]
+
+    # when
+    result = binary.loads(binary.dumps(samples, List[Sample]), List[Sample])
+
+    # then
+    assert result == samples
+
+
+def test_fails_for_invalid_data() -> None:
+    # given
+    data = binary.dumps(Sample(1.0, 1, True))
+
+    # then
+    with pytest.raises(DecoderError.invalid_input):
+        binary.loads(data, Measurement)
+
+    with pytest.raises(DecoderError.invalid_input):
+        binary.loads(data[:-2], Sample)
+
+    with pytest.raises(EncoderError.invalid_input):
+        binary.pack_into(bytearray(8), 0, Sample(1.0, 1, True))
+
+    with pytest.raises(EncoderError.invalid_input):
+        binary.dumps(Sample(1.0, 2**64, True))
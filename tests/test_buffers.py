@@ -0,0 +1,112 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import NewType
+
+import pytest
+
+from chili import Decoder, Encoder, decode, encode
+from chili.buffers import ArrayDecoder, ArrayEncoder, BufferFormat, MemoryviewDecoder, MemoryviewEncoder
+from chili.error import DecoderError
+
+Signal = NewType("Signal", array)
+
+
+@dataclass
+class Recording:
+    samples: array
+    signal: Signal
+    view: memoryview = field(default_factory=lambda: memoryview(b""))
+
+
+def test_can_encode_and_decode_array_as_list() -> None:
+    # when
+    encoded = encode(array("d", [1.0, 2.5]))
+    decoded = decode({"typecode": "i", "data": [1, 2]}, array)
+
+    # then
+    assert encoded == {"typecode": "d", "data": [1.0, 2.5]}
+    assert decode(encoded, array) == array("d", [1.0, 2.5])
+    assert decoded == array("i", [1, 2])
+    assert decoded.typecode == "i"
+
+
+def test_fails_to_decode_array_without_typecode() -> None:
+    with pytest.raises(DecoderError.invalid_input):
+        decode([1, 2], array)
+
+    with pytest.raises(DecoderError.invalid_input):
+        decode({"typecode": "i", "data": "AQ=="}, array)
+
+
+def test_can_choose_buffer_format_per_field() -> None:
+    # given
+    encoder = Encoder[Recording](encoders={Signal: ArrayEncoder(BufferFormat.BASE64)})
+    decoder = Decoder[Recording](decoders={Signal: ArrayDecoder("d")})
+    recording = Recording(array("i", [1, 2]), Signal(array("d", [0.5, 1.5])), memoryview(b"\x01\x02"))
+
+    # when
+    encoded = encoder.encode(recording)
+    decoded = decoder.decode(encoded)
+
+    # then
+    assert encoded["samples"] == {"typecode": "i", "data": [1, 2]}
+    assert encoded["signal"] == {"typecode": "d", "data": "AAAAAAAA4D8AAAAAAAD4Pw=="}
+    assert encoded["view"] == "AQI="
+    assert decoded.samples == array("i", [1, 2])
+    assert decoded.signal == array("d", [0.5, 1.5])
+    assert decoded.view == b"\x01\x02"
+    assert decoder.decode({**encoded, "signal": "AAAAAAAA4D8AAAAAAAD4Pw=="}).signal == array("d", [0.5, 1.5])
+
+
+@pytest.mark.parametrize("buffer_format", [BufferFormat.LIST, BufferFormat.BASE64])
+def test_can_encode_and_decode_typed_memoryview(buffer_format: BufferFormat) -> None:
+    # given
+    view = memoryview(array("h", [1, -1, 2, -2])).cast("B").cast("h", [2, 2])
+
+    # when
+    encoded = MemoryviewEncoder(buffer_format).encode(view)
+    decoded = MemoryviewDecoder().decode(encoded)
+
+    # then
+    assert encoded["format"] == "h"
+    assert encoded["shape"] == [2, 2]
+    assert decoded.format == "h"
+    assert decoded.tolist() == [[1, -1], [2, -2]]
+
+
+def test_can_decode_memoryview_of_format_with_byte_order() -> None:
+    # when
+    little = MemoryviewDecoder("<i").decode([1, -1])
+    big = MemoryviewDecoder().decode({"format": ">h", "shape": [2], "data": "AAH//w=="})
+
+    # then
+    assert little.format == "i"
+    assert little.tolist() == [1, -1]
+    assert big.tolist() == [1, -1]
+
+
+def test_can_encode_and_decode_ndarray() -> None:
+    # given
+    numpy = pytest.importorskip("numpy")
+    from numpy.typing import NDArray
+
+    from chili.buffers import NdarrayDecoder, NdarrayEncoder
+
+    @dataclass
+    class Frame:
+        pixels: NDArray[numpy.float32]
+
+    frame = Frame(numpy.array([[1.0, 2.0], [3.0, 4.0]], dtype="float32"))
+
+    # when
+    encoded = encode(frame)
+    decoded = decode(encoded, Frame)
+    raw = NdarrayEncoder(BufferFormat.BASE64).encode(frame.pixels)
+    from_raw = NdarrayDecoder().decode(raw)
+
+    # then
+    assert encoded == {"pixels": {"dtype": frame.pixels.dtype.str, "shape": [2, 2], "data": [[1.0, 2.0], [3.0, 4.0]]}}
+    assert decoded.pixels.dtype == numpy.float32
+    assert (decoded.pixels == frame.pixels).all()
+    assert from_raw.dtype == numpy.float32
+    assert (from_raw == frame.pixels).all()
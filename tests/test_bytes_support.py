@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from io import StringIO
+
+import pytest
+
+from chili import Decoder, Encoder, decode, encode
+from chili.bytes_support import (
+    BytesDecoder,
+    BytesEncoder,
+    BytesEncoding,
+    b64decode_chunks,
+    b64encode_chunks,
+    bytes_decoders,
+    bytes_encoders,
+)
+from chili.error import DecoderError
+
+
+@dataclass
+class Attachment:
+    name: str
+    content: bytes
+    preview: bytearray
+
+
+attachment = Attachment("notes.txt", b"\x00hello\xff", bytearray(b"he"))
+
+
+def test_passes_raw_bytes_through() -> None:
+    # when
+    encoded = encode(attachment, encoders=bytes_encoders(BytesEncoding.RAW))
+    decoded = decode(encoded, Attachment, decoders=bytes_decoders(BytesEncoding.RAW))
+
+    # then
+    assert encoded["content"] is attachment.content
+    assert encoded["preview"] is attachment.preview
+    assert decoded.content is attachment.content
+    assert decoded == attachment
+
+
+def test_can_encode_bytes_as_memoryview() -> None:
+    # when
+    encoded = Encoder[Attachment](encoders=bytes_encoders(BytesEncoding.MEMORYVIEW)).encode(attachment)
+    decoded = BytesDecoder(BytesEncoding.MEMORYVIEW, memoryview).decode(encoded["preview"])
+
+    # then
+    assert isinstance(encoded["content"], memoryview)
+    assert encoded["content"].obj is attachment.content
+    assert decoded is encoded["preview"]
+
+
+@pytest.mark.parametrize(
+    "encoding, expected",
+    [
+        (BytesEncoding.BASE64, "AGhlbGxv/w=="),
+        (BytesEncoding.URLSAFE_BASE64, "AGhlbGxv_w=="),
+        (BytesEncoding.BASE85, "0BB`wY;XS"),
+        (BytesEncoding.HEX, "0068656c6c6fff"),
+    ],
+)
+def test_can_encode_and_decode_bytes_as_text(encoding: BytesEncoding, expected: str) -> None:
+    # given
+    decoder = Decoder[Attachment](decoders=bytes_decoders(encoding))
+
+    # when
+    encoded = Encoder[Attachment](encoders=bytes_encoders(encoding)).encode(attachment)
+
+    # then
+    assert encoded["content"] == expected
+    assert BytesEncoder(encoding).encode(attachment.content) == expected
+    assert decoder.decode(encoded) == attachment
+    assert isinstance(decoder.decode(encoded).preview, bytearray)
+
+
+def test_fails_to_decode_invalid_text() -> None:
+    with pytest.raises(DecoderError.invalid_input):
+        BytesDecoder(BytesEncoding.HEX).decode("zz")
+
+
+def test_can_stream_base64() -> None:
+    # given
+    blob = bytes(range(256)) * 41
+    stream = StringIO()
+
+    # when
+    for chunk in b64encode_chunks(blob, chunk_size=100):
+        stream.write(chunk)
+    stream.seek(0)
+    decoded = b64decode_chunks(iter(lambda: stream.read(7), ""))
+
+    # then
+    assert stream.getvalue() == encode(blob)
+    assert decoded == blob
+
+
+def test_fails_to_decode_truncated_base64_stream() -> None:
+    with pytest.raises(DecoderError.invalid_input):
+        b64decode_chunks(["AGhl", "bG"])
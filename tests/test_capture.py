@@ -0,0 +1,131 @@
+import io
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+from chili import Decoder, decode, json_support
+from chili.capture import Capture, anonymize, read_captures
+from chili.error import SerialisationError
+from chili.typing import type_name
+
+
+class Status(Enum):
+    ACTIVE = "active"
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+@dataclass
+class User:
+    email: str
+    status: Status
+    created_at: datetime
+    tags: List[Tag]
+    labels: Dict[str, int]
+    nickname: Optional[str] = None
+
+
+user_data = {
+    "email": "Bob.Smith42@example.com",
+    "status": "active",
+    "created_at": "2024-01-02T10:30:00+00:00",
+    "tags": [{"name": "Admin"}],
+    "labels": {"team-a": 1},
+    "nickname": None,
+}
+
+
+def test_anonymize_preserves_shape_of_typed_strings() -> None:
+    # when
+    result = anonymize(user_data, User, b"salt")
+
+    # then
+    assert result["email"] != user_data["email"]
+    assert len(result["email"]) == len(user_data["email"])
+    assert result["email"][3] == "." and result["email"][11] == "@"
+    assert result["email"][0].isupper() and result["email"][9:11].isdigit()
+    assert result["status"] == "active"
+    assert result["created_at"] == user_data["created_at"]
+    assert result["tags"][0]["name"] != "Admin"
+    assert list(result["labels"].values()) == [1] and list(result["labels"]) != ["team-a"]
+    assert anonymize(user_data, User, b"salt") == result
+    assert anonymize(user_data, User, b"other")["email"] != result["email"]
+    assert decode(result, User, force=True).status is Status.ACTIVE
+
+
+def test_anonymize_keeps_structured_strings_of_unknown_type() -> None:
+    # when
+    result = anonymize(
+        {"when": "2024-01-02", "id": "5b2ee0ba-3c2f-4a4e-9a8a-5f3c0f1d2f8b", "amount": "12.50", "x": "ab"}
+    )
+
+    # then
+    assert result["when"] == "2024-01-02"
+    assert result["id"] == "5b2ee0ba-3c2f-4a4e-9a8a-5f3c0f1d2f8b"
+    assert result["amount"] == "12.50"
+    assert result["x"] != "ab" and len(result["x"]) == 2
+
+
+def test_can_capture_decoded_payloads(tmp_path: Path) -> None:
+    # given
+    path = tmp_path / "captures.ndjson"
+    original_decode = Decoder.decode
+    original_json_decode = json_support.json_decode
+
+    # when
+    with Capture(path, rate=1.0) as capture:
+        Decoder[User]().decode(user_data)
+        json_support.json_decode(json.dumps([{"name": "Admin"}]), List[Tag])
+
+    # then
+    assert capture.captured == 2
+    assert Decoder.decode is original_decode
+    assert json_support.json_decode is original_json_decode
+    records = list(read_captures(path))
+    assert [record["operation"] for record in records] == ["decode", "json_decode"]
+    assert records[0]["type"] == type_name(User)
+    assert records[0]["payload"]["status"] == "active"
+    assert records[0]["payload"]["email"] != user_data["email"]
+    assert records[1]["type"] == type_name(List[Tag])
+    assert records[1]["payload"][0]["name"] != "Admin"
+
+
+def test_capture_samples_at_given_rate() -> None:
+    # given
+    output = io.StringIO()
+
+    # when
+    with Capture(output, rate=0.25, seed=1, anonymize_strings=False) as capture:
+        for _ in range(400):
+            Decoder[Tag]().decode({"name": "tag"})
+
+    # then
+    assert 70 < capture.captured < 130
+    assert output.getvalue().count("\n") == capture.captured
+    assert json.loads(output.getvalue().splitlines()[0])["payload"] == {"name": "tag"}
+
+
+def test_capture_does_not_break_decoding_of_invalid_json() -> None:
+    # given
+    output = io.StringIO()
+
+    # when
+    with Capture(output, rate=1.0):
+        with pytest.raises(json.JSONDecodeError):
+            json_support.json_decode("{", Tag)
+
+    # then
+    assert output.getvalue() == ""
+
+
+def test_fails_for_invalid_rate() -> None:
+    with pytest.raises(SerialisationError.invalid_input):
+        Capture(io.StringIO(), rate=2)
@@ -0,0 +1,124 @@
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import pytest
+
+from chili import Decoder, Encoder
+from chili.error import DecoderError, EncoderError
+from chili.json_support import json_decode_columns, json_encode_columns
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+@dataclass
+class Reading:
+    sensor: str
+    value: float
+    taken_at: datetime
+    tags: List[Tag]
+    note: Optional[str] = None
+
+
+readings = [
+    Reading("s-1", 1.5, datetime(2020, 1, 1, tzinfo=timezone.utc), [Tag("hot")]),
+    Reading("s-2", 2.0, datetime(2020, 1, 2, tzinfo=timezone.utc), [], "calibrated"),
+]
+columns = {
+    "sensor": ["s-1", "s-2"],
+    "value": [1.5, 2.0],
+    "taken_at": ["2020-01-01T00:00:00+00:00", "2020-01-02T00:00:00+00:00"],
+    "tags": [[{"name": "hot"}], []],
+    "note": [None, "calibrated"],
+}
+
+
+def test_can_encode_columns() -> None:
+    # when
+    result = Encoder[Reading]().encode_columns(iter(readings))
+
+    # then
+    assert result == columns
+
+
+def test_can_decode_columns() -> None:
+    # when
+    result = Decoder[Reading]().decode_columns(columns)
+
+    # then
+    assert result == readings
+
+
+def test_can_decode_columns_with_missing_optional_column() -> None:
+    # given
+    data = {key: value for key, value in columns.items() if key != "note"}
+
+    # when
+    result = Decoder[Reading]().decode_columns(data)
+
+    # then
+    assert [reading.note for reading in result] == [None, None]
+
+
+def test_fails_to_decode_columns_of_different_lengths() -> None:
+    # given
+    data = {**columns, "sensor": ["s-1"]}
+
+    # then
+    with pytest.raises(DecoderError.invalid_input):
+        Decoder[Reading]().decode_columns(data)
+
+
+def test_can_encode_and_decode_columnar_json() -> None:
+    # when
+    document = json_encode_columns(readings, Reading)
+    result = json_decode_columns(document, Reading)
+
+    # then
+    assert document.startswith('{"fields": ["sensor", "value", "taken_at", "tags", "note"], "columns": [["s-1", "s-2"]')
+    assert result == readings
+
+
+def test_can_encode_and_decode_numpy_columns() -> None:
+    numpy = pytest.importorskip("numpy")
+
+    # given
+    naive_readings = [
+        Reading(item.sensor, item.value, item.taken_at.replace(tzinfo=None), item.tags, item.note) for item in readings
+    ]
+
+    # when
+    result = Encoder[Reading]().encode_columns(naive_readings, numpy=True)
+    decoded = Decoder[Reading]().decode_columns(result)
+
+    # then
+    assert isinstance(result["value"], numpy.ndarray)
+    assert result["value"].dtype == numpy.float64
+    assert result["taken_at"].dtype == numpy.dtype("datetime64[us]")
+    assert result["sensor"] == ["s-1", "s-2"]
+    assert decoded == naive_readings
+
+
+def test_fails_to_encode_timezone_aware_datetimes_into_numpy_columns() -> None:
+    pytest.importorskip("numpy")
+
+    with pytest.raises(EncoderError.invalid_input):
+        Encoder[Reading]().encode_columns(readings, numpy=True)
+
+
+def test_importing_chili_does_not_import_numpy() -> None:
+    # when
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, chili; print('numpy' in sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # then
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,144 @@
+import sys
+from abc import ABC
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from chili import Decoder, Encoder, compact, decodable, encode
+from chili.compact import is_compact
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+@dataclass
+class Book:
+    name: str
+    tags: List[Tag] = field(default_factory=list)
+    isbn: str = "n/a"
+
+    def title(self) -> str:
+        return self.name.upper()
+
+
+def test_can_create_compact_class() -> None:
+    # when
+    compact_book = compact(Book)
+
+    # then
+    assert is_compact(compact_book)
+    assert compact_book is compact(Book)
+    assert compact_book.__name__ == "Book"
+    assert set(compact_book.__slots__) == {"name", "tags", "isbn"}
+    assert not hasattr(compact_book("The Hobbit"), "__dict__")
+    assert compact_book("The Hobbit").title() == "THE HOBBIT"
+    assert compact_book("The Hobbit").isbn == "n/a"
+
+
+def test_returns_slotted_class_untouched() -> None:
+    # given
+    class Point:
+        __slots__ = ("x", "y")
+        x: int
+        y: int
+
+    # then
+    assert compact(Point) is Point
+
+
+def test_can_decode_into_compact_class() -> None:
+    # given
+    decoder = Decoder[Book](compact=True)
+
+    # when
+    book = decoder.decode({"name": "The Hobbit", "tags": [{"name": "Fantasy"}], "isbn": "123"})
+
+    # then
+    assert type(book) is compact(Book)
+    assert not hasattr(book, "__dict__")
+    assert book.name == "The Hobbit"
+    assert book.tags == [Tag("Fantasy")]
+    assert book.isbn == "123"
+    assert Encoder[Book]().encode(book) == {"name": "The Hobbit", "tags": [{"name": "Fantasy"}], "isbn": "123"}
+
+
+def test_compacts_nested_classes() -> None:
+    # given
+    @dataclass
+    class Shelf:
+        books: List[Book]
+        featured: Optional[Book] = None
+
+    decoder = Decoder[Shelf](compact=True)
+
+    # when
+    shelf = decoder.decode({"books": [{"name": "The Hobbit", "tags": [{"name": "Fantasy"}]}]})
+
+    # then
+    assert type(shelf) is compact(Shelf)
+    assert type(shelf.books[0]) is compact(Book)
+    assert type(shelf.books[0].tags[0]) is compact(Tag)
+    assert shelf.featured is None
+
+
+def test_can_encode_compact_instance() -> None:
+    # given
+    expected = {"name": "The Hobbit", "tags": [{"name": "Fantasy"}], "isbn": "123"}
+    book = Decoder[Book](compact=True).decode(expected)
+
+    # then
+    assert encode(book, Book) == expected
+    assert encode([book], List[Book]) == [expected]
+    assert encode(book, Book, only=["name"]) == {"name": "The Hobbit"}
+
+
+def test_compact_instance_equals_original_instance() -> None:
+    # given
+    book = Decoder[Book](compact=True).decode({"name": "The Hobbit", "tags": [{"name": "Fantasy"}], "isbn": "123"})
+
+    # then
+    assert book == Book("The Hobbit", [Tag("Fantasy")], "123")
+    assert Book("The Hobbit", [Tag("Fantasy")], "123") == book
+    assert book != Book("The Hobbit", [Tag("Adventure")], "123")
+    assert book != Tag("The Hobbit")
+
+
+def test_compact_class_keeps_private_property_storage() -> None:
+    # given
+    @decodable
+    class Pet:
+        name: str
+
+        @property
+        def name(self) -> str:
+            return self._name
+
+    # when
+    pet = Decoder[Pet](compact=True).decode({"name": "Bobik"})
+
+    # then
+    assert pet.name == "Bobik"
+    assert compact(Pet).__slots__ == ("_name",)
+
+
+def test_compact_class_is_instance_of_abstract_class() -> None:
+    # given
+    class Animal(ABC):
+        name: str
+
+    # when
+    animal = Decoder[Animal](compact=True).decode({"name": "Bobik"})
+
+    # then
+    assert isinstance(animal, Animal)
+
+
+def test_compact_instance_uses_less_memory() -> None:
+    # given
+    data = {"name": "The Hobbit", "tags": [], "isbn": "123"}
+    regular = Decoder[Book]().decode(data)
+    lean = Decoder[Book](compact=True).decode(data)
+
+    # then
+    assert sys.getsizeof(lean) < sys.getsizeof(regular) + sys.getsizeof(regular.__dict__)
@@ -6,7 +6,7 @@ from typing import Generic, List, Optional, Pattern, TypeVar, Union
 
 import pytest
 
-from chili import decodable, decode
+from chili import decodable, decode, serializable
 from chili.decoder import decode_regex_from_string
 from chili.error import DecoderError
 
@@ -140,6 +140,31 @@ def test_decode_union_decodables() -> None:
     assert isinstance(pet, Pet)
 
 
+def test_decode_union_serializables() -> None:
+    # given
+    @serializable
+    class Pet:
+        name: str
+        age: int
+
+    @serializable
+    class Person:
+        name: str
+        age: int
+        address: str
+
+    person_data = {"name": "Bobik", "age": 3, "address": "123 Fake Street"}
+    pet_data = {"name": "Bobik", "age": 3}
+
+    # when
+    person = decode(person_data, Union[Pet, Person])
+    pet = decode(pet_data, Union[Pet, Person])
+
+    # then
+    assert isinstance(person, Person)
+    assert isinstance(pet, Pet)
+
+
 def test_can_decode_str_enum() -> None:
     # given
     class PetType(str, Enum):
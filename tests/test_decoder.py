@@ -1,4 +1,9 @@
+from typing import Optional
+
+import pytest
+
 from chili import Decoder, Mapper, decodable
+from chili.error import DecoderError
 
 
 def test_can_instantiate() -> None:
@@ -45,3 +50,135 @@ def test_dencode_and_map() -> None:
     assert isinstance(data, Example)
     assert data.name == "Bobik"
     assert data.age == 11
+
+
+def test_can_decode_into_existing_instance() -> None:
+    # given
+    class Example:
+        name: str
+        age: int
+        email: Optional[str]
+
+        def __init__(self, name: str, age: int, email: Optional[str] = None):
+            self.name = name
+            self.age = age
+            self.email = email
+
+    decoder = Decoder[Example]()
+    instance = Example("Bobik", 11, "bobik@example.com")
+
+    # when
+    result = decoder.decode_into(instance, {"age": "12"})
+
+    # then
+    assert result is instance
+    assert instance.name == "Bobik"
+    assert instance.age == 12
+    assert instance.email == "bobik@example.com"
+
+
+def test_can_decode_into_existing_instance_without_partial() -> None:
+    # given
+    class Example:
+        name: str
+        email: Optional[str]
+
+        def __init__(self, name: str, email: Optional[str] = None):
+            self.name = name
+            self.email = email
+
+    decoder = Decoder[Example]()
+    instance = Example("Bobik", "bobik@example.com")
+
+    # when
+    decoder.decode_into(instance, {"name": "Pimpek"}, partial=False)
+
+    # then
+    assert instance.name == "Pimpek"
+    assert instance.email is None
+    with pytest.raises(DecoderError.missing_property):
+        decoder.decode_into(instance, {"email": "pimpek@example.com"}, partial=False)
+
+
+def test_decode_into_applies_mapper_to_present_keys_only() -> None:
+    # given
+    class Example:
+        name: str
+        age: int
+
+        def __init__(self, name: str, age: int):
+            self.name = name
+            self.age = age
+
+    decoder = Decoder[Example](mapper=Mapper({"name": "_name", "age": "_age"}))
+    instance = Example("Bobik", 11)
+
+    # when
+    decoder.decode_into(instance, {"_age": 12})
+
+    # then
+    assert instance.name == "Bobik"
+    assert instance.age == 12
+
+
+def test_fails_to_decode_into_instance_of_different_type() -> None:
+    # given
+    class Example:
+        name: str
+
+    # then
+    with pytest.raises(DecoderError.invalid_input):
+        Decoder[Example]().decode_into(object(), {"name": "Bobik"})
+
+
+def test_can_decode_rows() -> None:
+    # given
+    class Example:
+        name: str
+        age: int
+        email: Optional[str]
+
+    decoder = Decoder[Example]()
+    data = [{"name": "Bobik", "age": "11"}, {"name": "Pimpek", "age": 12, "email": "pimpek@example.com"}]
+
+    # when
+    rows = decoder.decode_rows(data)
+    named_rows = decoder.decode_rows(iter(data), named=True)
+
+    # then
+    assert rows == [("Bobik", 11, None), ("Pimpek", 12, "pimpek@example.com")]
+    assert named_rows == rows
+    assert named_rows[1].email == "pimpek@example.com"
+    assert type(named_rows[0]).__name__ == "ExampleRow"
+    assert type(named_rows[0])._fields == ("name", "age", "email")
+
+
+def test_can_decode_named_rows_of_selected_fields() -> None:
+    # given
+    class Example:
+        name: str
+        age: int
+        email: Optional[str]
+
+    data = [{"name": "Bobik", "age": "11", "email": "bobik@example.com"}]
+
+    # when
+    only_rows = Decoder[Example](only=["name"]).decode_rows(data, named=True)
+    excluded_rows = Decoder[Example](exclude=["age"]).decode_rows(data, named=True)
+
+    # then
+    assert only_rows == [("Bobik",)]
+    assert type(only_rows[0])._fields == ("name",)
+    assert excluded_rows[0].email == "bobik@example.com"
+    assert type(excluded_rows[0])._fields == ("name", "email")
+
+
+def test_fails_to_decode_rows_with_missing_property() -> None:
+    # given
+    class Example:
+        name: str
+        age: int
+
+    # then
+    with pytest.raises(DecoderError.missing_property):
+        Decoder[Example]().decode_rows([{"name": "Bobik"}])
@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+from typing import List, NamedTuple, Tuple
+
+from chili.decoder import _cached_type_decoder
+from chili.dedupe import DeduplicatingDecoder, is_immutable_type
+
+
+@dataclass(frozen=True)
+class Author:
+    first_name: str
+    last_name: str
+
+
+@dataclass(frozen=True)
+class Tag:
+    name: str
+
+
+@dataclass
+class Book:
+    name: str
+    author: Author
+    tags: List[Tag]
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+@dataclass(frozen=True)
+class Shelf:
+    books: List[str]
+
+
+raw_books = [
+    {
+        "name": "The Hobbit",
+        "author": {"first_name": "J.R.R.", "last_name": "Tolkien"},
+        "tags": [{"name": "Fantasy"}, {"name": "Adventure"}],
+    },
+    {
+        "name": "The Silmarillion",
+        "author": {"first_name": "J.R.R.", "last_name": "Tolkien"},
+        "tags": [{"name": "Fantasy"}],
+    },
+]
+
+
+def test_is_immutable_type() -> None:
+    assert is_immutable_type(Author)
+    assert is_immutable_type(Point)
+    assert is_immutable_type(Tuple[int, Author])
+    assert not is_immutable_type(Book)
+    assert not is_immutable_type(Shelf)
+    assert not is_immutable_type(Tuple[int, List[int]])
+
+
+def test_can_share_equal_immutable_sub_objects() -> None:
+    # given
+    decoder = DeduplicatingDecoder(List[Book])
+
+    # when
+    books = decoder.decode(raw_books)
+
+    # then
+    assert isinstance(books[0].author, Author)
+    assert books[0].author == Author("J.R.R.", "Tolkien")
+    assert books[0].author is books[1].author
+    assert books[0].tags[0] is books[1].tags[0]
+    assert books[0].tags[0] is not books[0].tags[1]
+    assert books[0] is not books[1]
+
+
+def test_shares_instances_only_within_single_call() -> None:
+    # given
+    decoder = DeduplicatingDecoder(Book)
+
+    # when
+    first = decoder.decode(raw_books[0])
+    second = decoder.decode(raw_books[1])
+
+    # then
+    assert first.author == second.author
+    assert first.author is not second.author
+
+
+def test_shares_instances_within_batch() -> None:
+    # given
+    decoder = DeduplicatingDecoder(Book)
+
+    # when
+    with decoder.batch():
+        first = decoder.decode(raw_books[0])
+        second = decoder.decode(raw_books[1])
+
+    # then
+    assert first.author is second.author
+
+
+def test_distinguishes_values_of_different_types() -> None:
+    # given
+    decoder = DeduplicatingDecoder(List[Tuple[str, Point]])
+
+    # when
+    result = decoder.decode([["1", [1, 2]], ["1", [1, 2]], [1, [1, 2]], [True, [1, 2]]])
+
+    # then
+    assert result == [("1", Point(1, 2)), ("1", Point(1, 2)), ("1", Point(1, 2)), ("True", Point(1, 2))]
+    assert result[0] is result[1]
+    assert result[0][1] is result[3][1]
+
+
+def test_decoders_do_not_grow_global_decoder_cache() -> None:
+    # given
+    DeduplicatingDecoder(List[Book]).decode(raw_books)
+    size = _cached_type_decoder.cache_info().currsize
+
+    # when
+    for _ in range(3):
+        DeduplicatingDecoder(List[Book]).decode(raw_books)
+
+    # then
+    assert _cached_type_decoder.cache_info().currsize == size
@@ -4,7 +4,7 @@ import re
 import sys
 from collections import namedtuple
 from dataclasses import dataclass
-from typing import Generic, List, Optional, Set, Tuple, TypedDict, TypeVar
+from typing import Generic, List, Optional, Set, Tuple, TypedDict, TypeVar, Union
 
 import pytest
 
@@ -319,3 +319,18 @@ def test_can_encode_new_optional_type_notation() -> None:
     # then
     assert result == {"value": None}
     assert alt_result == {"value": 11}
+
+
+def test_can_encode_union_of_different_types() -> None:
+    # given
+    @dataclass
+    class Tag:
+        name: str
+
+    values = [Tag("a"), 1, Tag("b"), "c"]
+
+    # when
+    result = [encode(value, Union[Tag, int, str]) for value in values]
+
+    # then
+    assert result == [{"name": "a"}, 1, {"name": "b"}, "c"]
@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import NewType
+
+import pytest
+
+from chili import Decoder, Encoder, decode, encode
+from chili.epoch import (
+    EpochDatetimeDecoder,
+    EpochDatetimeEncoder,
+    EpochUnit,
+    date_to_epoch,
+    datetime_to_epoch,
+    epoch_decoders,
+    epoch_encoders,
+    epoch_to_date,
+    epoch_to_datetime,
+    number_to_timedelta,
+    timedelta_to_number,
+)
+
+
+@pytest.mark.parametrize(
+    "given,unit,expected",
+    [
+        (datetime(2020, 1, 1, tzinfo=timezone.utc), EpochUnit.SECONDS, 1577836800),
+        (datetime(2020, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc), EpochUnit.MILLISECONDS, 1577836800123),
+        (datetime(2020, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc), EpochUnit.MICROSECONDS, 1577836800123456),
+        (datetime(2020, 1, 1, 2, tzinfo=timezone(timedelta(hours=2))), EpochUnit.SECONDS, 1577836800),
+        (datetime(2020, 1, 1), EpochUnit.SECONDS, 1577836800),
+        (datetime(1969, 12, 31, 23, 59, 59, tzinfo=timezone.utc), EpochUnit.MILLISECONDS, -1000),
+    ],
+)
+def test_datetime_to_epoch(given: datetime, unit: EpochUnit, expected: int) -> None:
+    assert datetime_to_epoch(given, unit) == expected
+    assert EpochDatetimeEncoder(unit).encode(given) == expected
+
+
+def test_epoch_to_datetime() -> None:
+    assert epoch_to_datetime(1577836800) == datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert epoch_to_datetime(1577836800123, EpochUnit.MILLISECONDS) == datetime(
+        2020, 1, 1, 0, 0, 0, 123000, tzinfo=timezone.utc
+    )
+    assert epoch_to_datetime(1577836800.5) == datetime(2020, 1, 1, 0, 0, 0, 500000, tzinfo=timezone.utc)
+    assert epoch_to_datetime(1577836800, tz=None) == datetime(2020, 1, 1)
+
+    result = epoch_to_datetime(1577836800, tz=timezone(timedelta(hours=2)))
+    assert result.utcoffset() == timedelta(hours=2)
+    assert result.hour == 2
+
+
+def test_date_epoch_round_trip() -> None:
+    assert date_to_epoch(date(2020, 1, 2)) == 1577923200
+    assert date_to_epoch(date(2020, 1, 2), EpochUnit.MILLISECONDS) == 1577923200000
+    assert epoch_to_date(1577923200) == date(2020, 1, 2)
+    assert epoch_to_date(1577923200000, EpochUnit.MILLISECONDS) == date(2020, 1, 2)
+
+
+def test_timedelta_number_round_trip() -> None:
+    assert timedelta_to_number(timedelta(minutes=2)) == 120
+    assert isinstance(timedelta_to_number(timedelta(minutes=2)), int)
+    assert timedelta_to_number(timedelta(seconds=1, microseconds=500000)) == 1.5
+    assert timedelta_to_number(timedelta(seconds=1, microseconds=500), EpochUnit.MILLISECONDS) == 1000
+    assert number_to_timedelta(1.5) == timedelta(seconds=1, microseconds=500000)
+    assert number_to_timedelta(1500, EpochUnit.MILLISECONDS) == timedelta(seconds=1, microseconds=500000)
+
+
+def test_can_encode_and_decode_with_epoch_codecs() -> None:
+    # given
+    @dataclass
+    class Event:
+        name: str
+        created_at: datetime
+        day: date
+        duration: timedelta
+
+    event = Event("deploy", datetime(2020, 1, 1, tzinfo=timezone.utc), date(2020, 1, 1), timedelta(minutes=1))
+
+    # when
+    encoded = encode(event, encoders=epoch_encoders(EpochUnit.MILLISECONDS))
+    decoded = decode(encoded, Event, decoders=epoch_decoders(EpochUnit.MILLISECONDS))
+
+    # then
+    assert encoded == {"name": "deploy", "created_at": 1577836800000, "day": 1577836800000, "duration": 60000}
+    assert decoded == event
+
+
+def test_can_select_epoch_format_per_field() -> None:
+    # given
+    EpochMillis = NewType("EpochMillis", datetime)
+
+    class Event:
+        created_at: datetime
+        received_at: EpochMillis
+
+        def __init__(self, created_at: datetime, received_at: EpochMillis):
+            self.created_at = created_at
+            self.received_at = received_at
+
+    encoder = Encoder[Event](encoders={EpochMillis: EpochDatetimeEncoder(EpochUnit.MILLISECONDS)})
+    decoder = Decoder[Event](decoders={EpochMillis: EpochDatetimeDecoder(EpochUnit.MILLISECONDS)})
+    moment = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+    # when
+    encoded = encoder.encode(Event(moment, EpochMillis(moment)))
+    decoded = decoder.decode(encoded)
+
+    # then
+    assert encoded == {"created_at": "2020-01-01T00:00:00+00:00", "received_at": 1577836800000}
+    assert decoded.received_at == moment
@@ -0,0 +1,87 @@
+import gc
+from dataclasses import dataclass
+from typing import List
+from uuid import UUID
+
+import pytest
+
+from chili import Decoder, decode
+from chili.error import DecoderError
+from chili.identity import IdentityMap
+
+
+@dataclass
+class Customer:
+    id: UUID
+    name: str
+
+
+@dataclass
+class Order:
+    number: int
+    customer: Customer
+
+
+customer_id = "2d2d8d4c-3b16-4d2e-9f8d-0f3b8d5a1c7e"
+
+
+def test_reuses_instance_with_known_key() -> None:
+    # given
+    identity_map = IdentityMap(Customer)
+
+    # when
+    first = identity_map.decode({"id": customer_id, "name": "Bob"})
+    second = identity_map.decode({"id": customer_id, "name": "Bobby"})
+
+    # then
+    assert first is second
+    assert second.name == "Bobby"
+    assert UUID(customer_id) in identity_map
+    assert identity_map.get(UUID(customer_id)) is first
+
+
+def test_can_reuse_instance_without_update() -> None:
+    # given
+    identity_map = IdentityMap(Customer, update=False)
+
+    # when
+    first = identity_map.decode({"id": customer_id, "name": "Bob"})
+    second = identity_map.decode({"id": customer_id, "name": "Bobby"})
+
+    # then
+    assert first is second
+    assert second.name == "Bob"
+
+
+def test_can_use_identity_map_for_nested_property() -> None:
+    # given
+    identity_map = IdentityMap(Customer)
+    data = [
+        {"number": 1, "customer": {"id": customer_id, "name": "Bob"}},
+        {"number": 2, "customer": {"id": customer_id, "name": "Bob"}},
+    ]
+
+    # when
+    orders = decode(data, List[Order], decoders={Customer: identity_map})
+    order = Decoder[Order](decoders={Customer: identity_map}).decode(data[0])
+
+    # then
+    assert orders[0].customer is orders[1].customer
+    assert order.customer is orders[0].customer
+
+
+def test_releases_unreferenced_instances() -> None:
+    # given
+    identity_map = IdentityMap(Customer)
+    identity_map.decode({"id": customer_id, "name": "Bob"})
+
+    # when
+    gc.collect()
+
+    # then
+    assert len(identity_map) == 0
+
+
+def test_fails_for_unknown_key_property() -> None:
+    with pytest.raises(DecoderError.invalid_type):
+        IdentityMap(Customer, key="uuid")
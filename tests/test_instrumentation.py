@@ -0,0 +1,242 @@
+import io
+import json
+import sys
+from dataclasses import dataclass
+from typing import List, Union
+
+import pytest
+
+import chili
+from chili import Decoder, Encoder, JsonDecoder, Mapper, decodable, json_support
+from chili.capture import Capture
+from chili.decoder import ScopedTypeDecoders, decode
+from chili.error import DecoderError, SerialisationError
+from chili.instrumentation import Event, Instrumentation, OpenTelemetryAdapter
+
+
+@dataclass
+class Cat:
+    name: str
+    lives: int
+
+
+@dataclass
+class Dog:
+    name: str
+    tricks: List[str]
+
+
+@dataclass
+class Owner:
+    pet: Union[Cat, Dog]
+
+
+def test_can_count_encode_and_decode_calls_per_type() -> None:
+    # given
+    instrumentation = Instrumentation()
+
+    # when
+    with instrumentation:
+        chili.decode({"name": "Tom", "lives": 9}, Cat)
+        chili.decode({"name": "Tom", "lives": 9}, Cat)
+        chili.encode(Cat("Tom", 9))
+        with pytest.raises(DecoderError.invalid_input):
+            chili.decode("tom", Cat)
+
+    # then
+    metrics = instrumentation.as_dict()
+    name = f"{__name__}:Cat"
+    assert metrics["decode"][name]["count"] == 3
+    assert metrics["decode"][name]["errors"] == 1
+    assert metrics["decode"][name]["seconds"] > 0
+    assert metrics["encode"][name]["count"] == 1
+
+
+def test_can_measure_json_helpers() -> None:
+    # given
+    document = json.dumps({"name": "Zoë", "lives": 9})
+    instrumentation = Instrumentation()
+
+    # when
+    with instrumentation:
+        chili.json_decode(document, Cat)
+        output = chili.json_encode(Cat("Tom", 9))
+        JsonDecoder[Cat]().decode(document)
+
+    # then
+    metrics = instrumentation.as_dict()
+    assert metrics["json"]["json_decode"] == {"count": 1, "bytes_in": len(document.encode()), "bytes_out": 0}
+    assert metrics["json"]["json_encode"] == {"count": 1, "bytes_in": 0, "bytes_out": len(output)}
+    assert metrics["json"]["JsonDecoder"]["bytes_in"] == len(document.encode())
+    assert metrics["decode"][f"{__name__}:Cat"]["count"] == 2
+
+
+def test_can_measure_union_decodes() -> None:
+    # given
+    instrumentation = Instrumentation()
+
+    # when
+    with instrumentation:
+        owner = chili.decode({"pet": {"name": "Rex", "tricks": ["sit"]}}, Owner)
+        with pytest.raises(DecoderError.invalid_input):
+            chili.decode({"pet": {"name": "Rex", "lives": "many"}}, Owner)
+
+    # then
+    assert owner.pet == Dog("Rex", ["sit"])
+    unions = instrumentation.as_dict()["unions"]
+    assert list(unions) == [f"typing:Union[{__name__}:Cat, {__name__}:Dog]"]
+    assert unions[f"typing:Union[{__name__}:Cat, {__name__}:Dog]"]["count"] == 2
+    assert unions[f"typing:Union[{__name__}:Cat, {__name__}:Dog]"]["failures"] == 1
+    assert unions[f"typing:Union[{__name__}:Cat, {__name__}:Dog]"]["seconds"] > 0
+
+
+def test_can_measure_mappers_and_codec_builds() -> None:
+    # given
+    @decodable(mapper=Mapper({"name": "full_name"}))
+    class Person:
+        name: str
+
+    instrumentation = Instrumentation()
+
+    # when
+    with instrumentation:
+        person = Decoder[Person]().decode({"full_name": "Bob"})
+        chili.decode({"full_name": "Bob"}, Person)
+
+    # then
+    metrics = instrumentation.as_dict()
+    assert person.name == "Bob"
+    assert metrics["mapper"]["count"] == 2
+    assert metrics["decode"][f"{__name__}:{Person.__qualname__}"]["count"] == 3
+    assert metrics["codec_builds"]["type_decoder"] == 1
+
+
+def test_counts_codec_builds_of_scoped_decoders() -> None:
+    # given
+    @dataclass
+    class Point:
+        x: int
+
+    instrumentation = Instrumentation()
+
+    # when
+    with instrumentation:
+        decoders = ScopedTypeDecoders()
+        chili.decode({"x": 1}, Point, decoders)
+        builds = instrumentation.as_dict()["codec_builds"]
+        chili.decode({"x": 2}, Point, decoders)
+
+    # then
+    assert builds["type_decoder"] == 2  # `Point` and `int`
+    assert builds["projected_type_decoder"] == 1
+    assert instrumentation.as_dict()["codec_builds"] == builds
+
+
+def test_uninstall_restores_originals() -> None:
+    # given
+    originals = (chili.decode, json_support.decode, Decoder.decode, Encoder.encode, chili.json_decode, Mapper.map)
+    instrumentation = Instrumentation()
+
+    # when
+    instrumentation.install()
+    installed = (chili.decode, json_support.decode, Decoder.decode, Encoder.encode, chili.json_decode, Mapper.map)
+    instrumentation.uninstall()
+
+    # then
+    assert all(a is not b for a, b in zip(originals, installed))
+    assert (chili.decode, json_support.decode, Decoder.decode, Encoder.encode, chili.json_decode, Mapper.map) == (
+        originals
+    )
+
+
+def test_hooks_can_be_removed_in_any_order() -> None:
+    # given
+    output = io.StringIO()
+    original = Decoder.decode
+    capture = Capture(output, rate=1.0, anonymize_strings=False)
+    instrumentation = Instrumentation()
+
+    # when
+    capture.install()
+    instrumentation.install()
+    capture.close()
+    Decoder[Cat]().decode({"name": "Tom", "lives": 9})
+    instrumentation.uninstall()
+    Decoder[Cat]().decode({"name": "Tom", "lives": 9})
+
+    # then
+    assert Decoder.decode is original
+    assert output.getvalue() == ""
+    assert instrumentation.as_dict()["decode"][f"{__name__}:Cat"]["count"] == 1
+
+
+def test_patches_only_chili_modules() -> None:
+    # given
+    instrumentation = Instrumentation()
+
+    # when
+    with instrumentation:
+        installed = chili.decode
+        decode({"name": "Tom", "lives": 9}, Cat)
+    installed({"name": "Tom", "lives": 9}, Cat)
+
+    # then
+    assert decode is chili.decode
+    assert installed is not decode
+    assert instrumentation.as_dict()["decode"] == {}
+
+
+def test_can_export_prometheus_text() -> None:
+    # given
+    instrumentation = Instrumentation()
+
+    # when
+    with instrumentation:
+        chili.decode({"pet": {"name": "Tom", "lives": 9}}, Owner)
+    text = instrumentation.to_prometheus()
+
+    # then
+    assert "# TYPE chili_calls_total counter" in text
+    assert f'chili_calls_total{{operation="decode",type="{__name__}:Owner"}} 1' in text
+    assert f'chili_union_decodes_total{{type="typing:Union[{__name__}:Cat, {__name__}:Dog]"}} 1' in text
+    assert "chili_mapper_calls_total 0" in text
+
+
+def test_can_send_events_to_callbacks_and_opentelemetry() -> None:
+    # given
+    class Span:
+        def __init__(self, name, start_time, attributes):
+            self.name, self.start_time, self.attributes, self.end_time = name, start_time, attributes, None
+
+        def record_exception(self, error):
+            pass
+
+        def end(self, end_time):
+            self.end_time = end_time
+
+    class Tracer:
+        spans = []
+
+        def start_span(self, name, start_time=None, attributes=None):
+            self.spans.append(Span(name, start_time, attributes))
+            return self.spans[-1]
+
+    events: List[Event] = []
+    tracer = Tracer()
+
+    # when
+    with Instrumentation([events.append, OpenTelemetryAdapter(tracer)]):
+        chili.encode(Cat("Tom", 9))
+
+    # then
+    assert [(event.operation, event.type) for event in events] == [("encode", f"{__name__}:Cat")]
+    assert tracer.spans[0].name == "chili.encode"
+    assert tracer.spans[0].attributes == {"chili.type": f"{__name__}:Cat"}
+    assert tracer.spans[0].end_time - tracer.spans[0].start_time == events[0].duration
+
+
+def test_opentelemetry_adapter_requires_opentelemetry(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "opentelemetry", None)
+
+    with pytest.raises(SerialisationError.missing_dependency):
+        OpenTelemetryAdapter()
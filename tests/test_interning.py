@@ -0,0 +1,120 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import List
+from uuid import UUID
+
+from chili import Decoder, decode
+from chili.decoder import _cached_projected_type_decoder, _cached_type_decoder, build_type_decoder
+from chili.interning import InternedDecoder, StringInterningDecoder, interning_decoders
+
+
+def test_interned_decoder_shares_instances_for_repeated_input() -> None:
+    # given
+    decoder = InternedDecoder(build_type_decoder(UUID))
+    raw = "2d2d8d4c-3b16-4d2e-9f8d-0f3b8d5a1c7e"
+
+    # when
+    first = decoder.decode(raw)
+    second = decoder.decode("".join(raw))
+
+    # then
+    assert first == UUID(raw)
+    assert first is second
+
+
+def test_interned_decoder_distinguishes_input_types() -> None:
+    # given
+    decoder = InternedDecoder(build_type_decoder(Decimal))
+
+    # when
+    from_int = decoder.decode(1)
+    from_float = decoder.decode(1.0)
+
+    # then
+    assert str(from_int) == "1"
+    assert str(from_float) == "1"
+    assert from_int is not from_float
+
+
+def test_interned_decoder_bypasses_cache_for_unhashable_input() -> None:
+    # given
+    decoder = InternedDecoder(build_type_decoder(list))
+
+    # when
+    result = decoder.decode([1, 2])
+
+    # then
+    assert result == [1, 2]
+
+
+def test_string_interning_decoder_interns_short_strings_only() -> None:
+    # given
+    decoder = StringInterningDecoder(max_length=8)
+
+    # when
+    short = decoder.decode("".join(["ten", "ant"]))
+    long = decoder.decode("".join(["tenant", "-identifier"]))
+
+    # then
+    assert short is decoder.decode("".join(["te", "nant"]))
+    assert long is not decoder.decode("".join(["tenant", "-identifier"]))
+
+
+def test_can_decode_with_interning_decoders() -> None:
+    # given
+    @dataclass
+    class Record:
+        id: UUID
+        tenant: str
+        amount: Decimal
+
+    raw_id = "2d2d8d4c-3b16-4d2e-9f8d-0f3b8d5a1c7e"
+    data = [{"id": raw_id, "tenant": "acme", "amount": "1.50"} for _ in range(3)]
+    decoders = interning_decoders()
+
+    # when
+    result = decode(data, List[Record], decoders=decoders)
+
+    # then
+    assert result[0].id == UUID(raw_id)
+    assert result[0].id is result[1].id is result[2].id
+    assert result[0].tenant is result[2].tenant
+    assert result[0].amount is result[1].amount
+
+
+def test_can_clear_interned_values() -> None:
+    # given
+    class Record:
+        id: UUID
+
+    decoders = interning_decoders(types=[UUID])
+    decoder = Decoder[Record](decoders=decoders)
+    raw_id = "2d2d8d4c-3b16-4d2e-9f8d-0f3b8d5a1c7e"
+    first = decoder.decode({"id": raw_id})
+
+    # when
+    decoders.clear()
+    second = decoder.decode({"id": raw_id})
+
+    # then
+    assert first.id == second.id
+    assert first.id is not second.id
+
+
+def test_interning_decoders_do_not_grow_global_decoder_cache() -> None:
+    # given
+    @dataclass
+    class Record:
+        id: UUID
+        tags: List[str]
+
+    data = {"id": "2d2d8d4c-3b16-4d2e-9f8d-0f3b8d5a1c7e", "tags": ["a"]}
+    decode(data, Record, decoders=interning_decoders())
+    sizes = (_cached_type_decoder.cache_info().currsize, _cached_projected_type_decoder.cache_info().currsize)
+
+    # when
+    for _ in range(3):
+        decode(data, Record, decoders=interning_decoders())
+
+    # then
+    assert (_cached_type_decoder.cache_info().currsize, _cached_projected_type_decoder.cache_info().currsize) == sizes
@@ -0,0 +1,149 @@
+import copy
+import pickle
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import pytest
+
+from chili import decode, encode
+from chili.error import DecoderError
+from chili.lazy import LazyDecoder, is_lazy
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+@dataclass
+class Author:
+    first_name: str
+    last_name: str
+
+
+@dataclass
+class Book:
+    name: str
+    author: Author
+    tags: List[Tag] = field(default_factory=list)
+    meta: Optional[Dict[str, int]] = None
+
+
+data = {
+    "name": "The Hobbit",
+    "author": {"first_name": "John", "last_name": "Tolkien"},
+    "tags": [{"name": "Fantasy"}],
+    "meta": {"pages": 310},
+}
+
+
+def test_decodes_nested_properties_on_first_access() -> None:
+    # when
+    book = LazyDecoder(Book).decode(data)
+
+    # then
+    assert isinstance(book, Book)
+    assert is_lazy(type(book))
+    assert "author" not in book.__dict__
+    assert "tags" not in book.__dict__
+    assert book.name == "The Hobbit"
+    assert book.author.first_name == "John"
+    assert "author" in book.__dict__
+    assert book.author is book.author
+    assert book.tags == [Tag("Fantasy")]
+    assert book.meta == {"pages": 310}
+
+
+def test_keeps_classes_without_nested_properties_untouched() -> None:
+    # when
+    book = LazyDecoder(Book).decode(data)
+
+    # then
+    assert isinstance(book.author, Author)
+    assert is_lazy(type(book.tags[0])) is False
+    assert is_lazy(type(book.author)) is False
+
+
+def test_does_not_decode_untouched_properties() -> None:
+    # given
+    invalid = {**data, "tags": "not a list of tags"}
+
+    # when
+    book = LazyDecoder(Book).decode(invalid)
+
+    # then
+    assert book.name == "The Hobbit"
+    with pytest.raises(DecoderError.invalid_input):
+        book.tags
+
+
+def test_can_assign_lazy_property_and_encode() -> None:
+    # given
+    book = LazyDecoder(List[Book]).decode([data])[0]
+
+    # when
+    book.tags = [Tag("Classic")]
+
+    # then
+    assert book.tags == [Tag("Classic")]
+    assert encode(book, Book) == {**data, "tags": [{"name": "Classic"}]}
+
+
+def test_uses_defaults_for_missing_properties() -> None:
+    # when
+    book = LazyDecoder(Book).decode({"name": "The Hobbit", "author": data["author"]})
+
+    # then
+    assert book.tags == []
+    assert book.meta is None
+
+
+def test_copies_do_not_share_lazy_state() -> None:
+    # given
+    book = LazyDecoder(Book).decode(data)
+
+    # when
+    copied = copy.copy(book)
+    copied_tags = copied.tags
+
+    # then
+    assert is_lazy(type(copied))
+    assert copied_tags == [Tag("Fantasy")]
+    assert book.tags == [Tag("Fantasy")]
+    assert book.author == copied.author
+
+
+def test_compares_equal_to_eagerly_decoded_instance() -> None:
+    # given
+    eager = decode(data, Book)
+
+    # when
+    book = LazyDecoder(Book).decode(data)
+
+    # then
+    assert book == eager
+    assert eager == book
+    assert book == LazyDecoder(Book).decode(data)
+    assert book != decode({**data, "name": "Silmarillion"}, Book)
+
+
+def test_can_pickle_lazy_instance() -> None:
+    # given
+    book = LazyDecoder(Book).decode(data)
+
+    # when
+    restored = pickle.loads(pickle.dumps(book))
+
+    # then
+    assert type(restored) is Book
+    assert restored == decode(data, Book)
+
+
+def test_does_not_expose_lazy_state() -> None:
+    # when
+    book = LazyDecoder(Book).decode(data)
+
+    # then
+    assert set(vars(book)) == {"name"}
+    assert book.tags == [Tag("Fantasy")]
+    assert set(vars(book)) == {"name", "tags"}
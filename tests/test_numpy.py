@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from chili.error import DecoderError
+from chili.numpy import decode_array, encode_array, get_structured_dtype
+
+numpy = pytest.importorskip("numpy")
+
+
+@dataclass
+class Reading:
+    sensor: str
+    value: float
+    count: int
+    valid: bool
+    taken_at: datetime
+    day: date
+    interval: timedelta = timedelta(seconds=1)
+
+
+rows = [
+    {
+        "sensor": "s-1",
+        "value": 1.5,
+        "count": 3,
+        "valid": True,
+        "taken_at": "2024-01-01T10:00:00+02:00",
+        "day": "2024-01-01",
+        "interval": "PT5S",
+    },
+    {
+        "sensor": "sensor-2",
+        "value": 2.0,
+        "count": 4,
+        "valid": False,
+        "taken_at": "2024-01-02T10:00:00",
+        "day": "2024-01-02",
+        "interval": "PT1M",
+    },
+]
+
+
+def test_can_create_structured_dtype() -> None:
+    # when
+    dtype = get_structured_dtype(Reading, {"sensor": 8})
+
+    # then
+    assert dtype.names == ("sensor", "value", "count", "valid", "taken_at", "day", "interval")
+    assert dtype["sensor"] == numpy.dtype("U8")
+    assert dtype["taken_at"] == numpy.dtype("datetime64[us]")
+
+
+def test_can_decode_list_of_dicts_into_array() -> None:
+    # when
+    array = decode_array(rows, Reading)
+
+    # then
+    assert array.dtype["sensor"] == numpy.dtype("U8")
+    assert array["value"].tolist() == [1.5, 2.0]
+    assert array["count"].tolist() == [3, 4]
+    assert array["valid"].tolist() == [True, False]
+    assert array["taken_at"].tolist() == [datetime(2024, 1, 1, 8), datetime(2024, 1, 2, 10)]
+    assert array["day"].tolist() == [date(2024, 1, 1), date(2024, 1, 2)]
+    assert array["interval"].tolist() == [timedelta(seconds=5), timedelta(minutes=1)]
+
+
+def test_can_decode_columns_and_ndjson_into_array() -> None:
+    # given
+    columns = {name: [row[name] for row in rows] for name in rows[0].keys()}
+    ndjson = '{"sensor": "a", "value": 1, "count": 1, "valid": true, "taken_at": "2024-01-01T00:00:00", "day": "2024-01-01"}\n'
+
+    # when
+    from_columns = decode_array(columns, Reading, str_sizes={"sensor": 4})
+    from_layout = decode_array({"fields": list(columns.keys()), "columns": list(columns.values())}, Reading)
+    from_ndjson = decode_array(ndjson, Reading)
+
+    # then
+    assert from_columns["sensor"].tolist() == ["s-1", "sens"]
+    assert (from_layout == decode_array(rows, Reading)).all()
+    assert from_ndjson["interval"].tolist() == [timedelta(seconds=1)]
+
+
+def test_can_encode_array() -> None:
+    # given
+    array = decode_array(rows, Reading)
+
+    # when
+    result = encode_array(array, Reading)
+
+    # then
+    assert result[0] == {
+        "sensor": "s-1",
+        "value": 1.5,
+        "count": 3,
+        "valid": True,
+        "taken_at": "2024-01-01T08:00:00",
+        "day": "2024-01-01",
+        "interval": "PT5S",
+    }
+    assert result[1]["interval"] == "PT1M"
+
+
+def test_fails_for_unsupported_types() -> None:
+    # given
+    @dataclass
+    class Tagged:
+        tags: list
+
+    # then
+    with pytest.raises(DecoderError.invalid_type):
+        decode_array([{"tags": []}], Tagged)
+
+    with pytest.raises(DecoderError.missing_property):
+        decode_array([{"sensor": "a"}], Reading)
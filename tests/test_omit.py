@@ -0,0 +1,115 @@
+from dataclasses import dataclass, field
+from typing import Generic, List, Optional, TypeVar, Union
+
+from chili import Encoder, encodable, encode
+
+
+@dataclass
+class Address:
+    city: str
+    street: Optional[str] = None
+
+
+@dataclass
+class Profile:
+    name: str
+    nickname: Optional[str] = None
+    age: int = 0
+    tags: List[str] = field(default_factory=list)
+    address: Optional[Address] = None
+    previous: List[Address] = field(default_factory=list)
+
+
+profile = Profile("Bob", address=Address("Warsaw"), previous=[Address("Cracow", "")])
+
+
+def test_can_exclude_none_values() -> None:
+    # when
+    result = encode(profile, exclude_none=True)
+
+    # then
+    assert result == {
+        "name": "Bob",
+        "age": 0,
+        "tags": [],
+        "address": {"city": "Warsaw"},
+        "previous": [{"city": "Cracow", "street": ""}],
+    }
+
+
+def test_can_exclude_default_values() -> None:
+    # when
+    result = Encoder[Profile](exclude_defaults=True).encode(profile)
+
+    # then
+    assert result == {
+        "name": "Bob",
+        "address": {"city": "Warsaw"},
+        "previous": [{"city": "Cracow", "street": ""}],
+    }
+
+
+def test_can_exclude_empty_values() -> None:
+    # when
+    result = encode(profile, exclude_empty=True, exclude_none=True)
+
+    # then
+    assert result == {
+        "name": "Bob",
+        "age": 0,
+        "address": {"city": "Warsaw"},
+        "previous": [{"city": "Cracow"}],
+    }
+
+
+def test_does_not_call_default_factory_per_encode() -> None:
+    # given
+    calls = []
+
+    def default_tags() -> List[str]:
+        calls.append(1)
+        return []
+
+    @encodable
+    @dataclass
+    class Post:
+        title: str
+        tags: List[str] = field(default_factory=default_tags)
+
+    encoder = Encoder[Post](exclude_defaults=True)
+    posts = [Post("a", ["x"]) for _ in range(3)]
+    calls.clear()
+
+    # when
+    result = [encoder.encode(post) for post in posts]
+    encode(posts[0])
+
+    # then
+    assert result[0] == {"title": "a", "tags": ["x"]}
+    assert len(calls) == 1
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class Envelope(Generic[T]):
+    body: T
+    note: Optional[str] = None
+
+
+@dataclass
+class Message:
+    envelope: Envelope[Address]
+    payload: Union[Address, Profile]
+
+
+def test_omits_values_of_generic_and_union_properties() -> None:
+    # given
+    message = Message(Envelope(Address("Warsaw")), Profile("Bob"))
+
+    # when
+    result = encode(message, exclude_none=True, exclude_defaults=True)
+
+    # then
+    assert result == {"envelope": {"body": {"city": "Warsaw"}}, "payload": {"name": "Bob"}}
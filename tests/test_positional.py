@@ -0,0 +1,134 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, NewType, Optional
+
+import pytest
+
+from chili import decodable, encodable
+from chili.error import DecoderError
+from chili.positional import PositionalDecoder, PositionalEncoder, schema_fingerprint
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+@dataclass
+class Book:
+    name: str
+    published: date
+    tags: List[Tag] = field(default_factory=list)
+    sequel: Optional["Book"] = None
+
+
+book = Book("The Hobbit", date(1937, 9, 21), [Tag("Fantasy")], Book("The Lord of the Rings", date(1954, 7, 29)))
+
+
+def test_can_encode_object_positionally() -> None:
+    # when
+    result = PositionalEncoder(Book).encode(book)
+
+    # then
+    assert result == [
+        schema_fingerprint(Book),
+        ["The Hobbit", "1937-09-21", [["Fantasy"]], ["The Lord of the Rings", "1954-07-29", [], None]],
+    ]
+
+
+def test_can_decode_object_positionally() -> None:
+    # given
+    data = PositionalEncoder(Book).encode(book)
+
+    # when
+    result = PositionalDecoder(Book).decode(data)
+
+    # then
+    assert result == book
+
+
+def test_can_encode_and_decode_list_of_objects() -> None:
+    # given
+    books = [book, Book("Silmarillion", date(1977, 9, 15))]
+
+    # when
+    data = PositionalEncoder(List[Book]).encode(books)
+
+    # then
+    assert data[1][1] == ["Silmarillion", "1977-09-15", [], None]
+    assert PositionalDecoder(List[Book]).decode(data) == books
+
+
+def test_can_use_decodable_classes() -> None:
+    # given
+    @encodable
+    @decodable
+    class Pet:
+        name: str
+        age: int
+
+        def __init__(self, name: str, age: int):
+            self.name = name
+            self.age = age
+
+    # when
+    data = PositionalEncoder(Pet).encode(Pet("Bobik", 3))
+    pet = PositionalDecoder(Pet).decode(data)
+
+    # then
+    assert data[1] == ["Bobik", 3]
+    assert pet.name == "Bobik"
+    assert pet.age == 3
+
+
+def test_fingerprint_changes_with_nested_schema() -> None:
+    # given
+    @dataclass
+    class Tag:  # noqa: F811
+        name: str
+        weight: int
+
+    @dataclass
+    class Post:
+        tags: List[Tag]
+
+    fingerprint = schema_fingerprint(Post)
+
+    @dataclass
+    class Tag:  # type: ignore[no-redef]
+        name: str
+
+    @dataclass
+    class Post:  # type: ignore[no-redef]
+        tags: List[Tag]
+
+    # then
+    assert schema_fingerprint(Post) != fingerprint
+
+
+def test_fingerprint_does_not_depend_on_memory_addresses() -> None:
+    # given
+    def create_account() -> type:
+        AccountId = NewType("AccountId", int)
+
+        @dataclass
+        class Account:
+            id: AccountId
+            aliases: List[AccountId]
+
+        return Account
+
+    # then
+    assert schema_fingerprint(create_account()) == schema_fingerprint(create_account())
+
+
+def test_fails_for_mismatched_fingerprint_or_layout() -> None:
+    # given
+    decoder = PositionalDecoder(Book)
+
+    # then
+    with pytest.raises(DecoderError.invalid_input):
+        decoder.decode(["00000000", ["The Hobbit", "1937-09-21", [], None]])
+
+    with pytest.raises(DecoderError.invalid_input):
+        decoder.decode([decoder.fingerprint, ["The Hobbit"]])
@@ -0,0 +1,176 @@
+from dataclasses import dataclass, field
+from typing import Dict, Generic, List, Optional, TypeVar, Union
+
+import pytest
+
+from chili import Decoder, Encoder, decodable, decode, encodable, encode
+from chili.error import SerialisationError
+
+
+@dataclass
+class Author:
+    first_name: str
+    last_name: str
+
+
+@dataclass
+class Tag:
+    name: str
+    weight: int = 0
+
+
+@dataclass
+class Book:
+    name: str
+    author: Author
+    tags: List[Tag] = field(default_factory=list)
+    editor: Optional[Author] = None
+    ratings: Dict[str, Tag] = field(default_factory=dict)
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+@dataclass
+class Box(Generic[T]):
+    item: T
+    label: str
+
+
+@dataclass
+class Holder:
+    box: Box[Point]
+    shape: Union[Point, Tag]
+
+
+holder = Holder(Box(Point(1, 2), "origin"), Point(3, 4))
+
+book = Book(
+    "The Hobbit",
+    Author("John", "Tolkien"),
+    [Tag("Fantasy", 2), Tag("Classic", 1)],
+    Author("Stanley", "Unwin"),
+    {"top": Tag("Best", 5)},
+)
+data = encode(book)
+
+
+def test_can_encode_only_selected_fields() -> None:
+    # when
+    result = encode(book, only=["name", "author.last_name", "tags.*.name", "editor"])
+
+    # then
+    assert result == {
+        "name": "The Hobbit",
+        "author": {"last_name": "Tolkien"},
+        "tags": [{"name": "Fantasy"}, {"name": "Classic"}],
+        "editor": {"first_name": "Stanley", "last_name": "Unwin"},
+    }
+
+
+def test_can_exclude_fields() -> None:
+    # when
+    result = Encoder[Book](exclude=["tags", "author.first_name", "editor", "ratings.weight"]).encode(book)
+
+    # then
+    assert result == {"name": "The Hobbit", "author": {"last_name": "Tolkien"}, "ratings": {"top": {"name": "Best"}}}
+
+
+def test_can_decode_only_selected_fields() -> None:
+    # given
+    invalid = {**data, "ratings": "never decoded"}
+
+    # when
+    result = decode(invalid, Book, only=["name", "tags.name"])
+    via_decoder = Decoder[Book](only=["author.first_name"]).decode(invalid)
+
+    # then
+    assert result.name == "The Hobbit"
+    assert [tag.name for tag in result.tags] == ["Fantasy", "Classic"]
+    assert "weight" not in vars(result.tags[0])
+    assert not hasattr(result, "author")
+    assert via_decoder.author.first_name == "John"
+    assert not hasattr(via_decoder.author, "last_name")
+
+
+def test_can_project_decodable_classes() -> None:
+    # given
+    @encodable
+    @decodable
+    class Pet:
+        name: str
+        owner: Author
+
+        def __init__(self, name: str, owner: Author):
+            self.name = name
+            self.owner = owner
+
+    @dataclass
+    class Shelter:
+        pets: List[Pet]
+
+    shelter = Shelter([Pet("Bobik", Author("John", "Doe"))])
+
+    # when
+    encoded = encode(shelter, only=["pets.owner.last_name"])
+    decoded = decode({"pets": [{"name": "Bobik", "owner": {"last_name": "Doe"}}]}, Shelter, exclude=["pets.owner"])
+
+    # then
+    assert encoded == {"pets": [{"owner": {"last_name": "Doe"}}]}
+    assert decoded.pets[0].name == "Bobik"
+    assert not hasattr(decoded.pets[0], "owner")
+
+
+def test_fails_for_unknown_fields() -> None:
+    with pytest.raises(SerialisationError.invalid_input):
+        encode(book, only=["title"])
+
+    with pytest.raises(SerialisationError.invalid_input):
+        Decoder[Book](only=["author.age"]).decode(data)
+
+
+def test_can_select_fields_of_generic_and_union_properties() -> None:
+    # when
+    result = encode(holder, only=["box.item.x", "shape.x"])
+    via_encoder = Encoder[Holder](only=["box.label"]).encode(holder)
+    tag_holder = encode(Holder(holder.box, Tag("red", 1)), only=["shape.x", "shape.name"])
+
+    # then
+    assert result == {"box": {"item": {"x": 1}}, "shape": {"x": 3}}
+    assert via_encoder == {"box": {"label": "origin"}}
+    assert tag_holder == {"shape": {"name": "red"}}
+
+
+def test_can_decode_selected_fields_of_generic_and_union_properties() -> None:
+    # given
+    payload = {"box": {"item": {"x": 1, "y": "invalid"}, "label": "origin"}, "shape": {"x": 3, "y": 4}}
+
+    # when
+    result = decode(payload, Holder, exclude=["box.item.y", "shape.y"])
+
+    # then
+    assert result.box.item.x == 1
+    assert not hasattr(result.box.item, "y")
+    assert result.box.label == "origin"
+    assert isinstance(result.shape, Point)
+    assert not hasattr(result.shape, "y")
+
+
+def test_fails_for_unknown_fields_of_generic_and_union_properties() -> None:
+    with pytest.raises(SerialisationError.invalid_input):
+        encode(holder, only=["box.nonexistent"])
+
+    with pytest.raises(SerialisationError.invalid_input):
+        encode(holder, only=["shape.z"])
+
+    with pytest.raises(SerialisationError.invalid_input):
+        decode(encode(holder), Holder, only=["box.item.z"])
+
+    with pytest.raises(SerialisationError.invalid_input):
+        encode(book, only=["name.first"])
@@ -0,0 +1,114 @@
+import struct
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from chili import RecordFile
+from chili.record_file import RecordFormat
+
+
+@dataclass
+class Entry:
+    id: int
+    name: str
+    day: date
+    tags: List[str]
+
+
+entries = [Entry(index, f"entry-{index}", date(2024, 1, 1 + index), ["a"] * index) for index in range(5)]
+
+
+@pytest.mark.parametrize("record_format", [RecordFormat.NDJSON, RecordFormat.BINARY])
+def test_can_append_and_read_records_by_index(tmp_path: Path, record_format: RecordFormat) -> None:
+    # given
+    path = tmp_path / "entries.data"
+
+    # when
+    with RecordFile[Entry](path, record_format) as records:
+        records.extend(entries[:4])
+        assert records.append(entries[4]) == 4
+
+        # then
+        assert len(records) == 5
+        assert records[2] == entries[2]
+        assert records[-1] == entries[4]
+        assert records[1:4:2] == [entries[1], entries[3]]
+
+    with RecordFile[Entry](path, record_format) as records:
+        assert list(records) == entries
+        with pytest.raises(IndexError):
+            records[5]
+
+
+def test_writes_ndjson_with_sidecar_index(tmp_path: Path) -> None:
+    # given
+    path = tmp_path / "entries.ndjson"
+
+    # when
+    with RecordFile[Entry](path) as records:
+        records.extend(entries[:2])
+
+    # then
+    lines = path.read_bytes().splitlines(keepends=True)
+    assert lines[1] == b'{"id": 1, "name": "entry-1", "day": "2024-01-02", "tags": ["a"]}\n'
+    assert struct.unpack("<2Q", (tmp_path / "entries.ndjson.idx").read_bytes()) == (0, len(lines[0]))
+
+
+@pytest.mark.parametrize("record_format", [RecordFormat.NDJSON, RecordFormat.BINARY])
+def test_rebuilds_missing_index(tmp_path: Path, record_format: RecordFormat) -> None:
+    # given
+    path = tmp_path / "entries.data"
+    with RecordFile[Entry](path, record_format) as records:
+        records.extend(entries)
+    (tmp_path / "entries.data.idx").unlink()
+
+    # when
+    with RecordFile[Entry](path, record_format) as records:
+        # then
+        assert len(records) == 5
+        assert records[3] == entries[3]
+
+
+def test_reads_empty_file(tmp_path: Path) -> None:
+    with RecordFile[Entry](tmp_path / "entries.ndjson") as records:
+        assert len(records) == 0
+        assert records[:] == []
+
+
+def test_skips_partially_written_line_when_rebuilding_index(tmp_path: Path) -> None:
+    # given
+    path = tmp_path / "entries.ndjson"
+    with RecordFile[Entry](path) as records:
+        records.extend(entries[:2])
+    with path.open("ab") as data_file:
+        data_file.write(b'{"id": 2, "na')
+    (tmp_path / "entries.ndjson.idx").unlink()
+
+    # when
+    with RecordFile[Entry](path) as records:
+        # then
+        assert list(records) == entries[:2]
+
+
+def test_remaps_files_only_after_append(tmp_path: Path) -> None:
+    # given
+    with RecordFile[Entry](tmp_path / "entries.ndjson") as records:
+        records.extend(entries[:2])
+        assert records[0] == entries[0]
+        data_map = records._data.map
+
+        # when
+        records[1]
+
+        # then
+        assert records._data.map is data_map
+
+        # when
+        records.append(entries[2])
+
+        # then
+        assert records[2] == entries[2]
+        assert records._data.map is not data_map
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Literal, Optional
 
-from chili.typing import get_non_optional_fields
+from chili.typing import get_nested_types, get_non_optional_fields, type_name
 
 
 def test_get_non_optional_fields_from_data_class() -> None:
@@ -32,3 +32,34 @@ def test_get_non_optional_fields_from_class() -> None:
 
     # then
     assert fields == ["name", "age"]
+
+
+def test_get_nested_types() -> None:
+    # given
+    @dataclass
+    class Tag:
+        name: str
+
+    @dataclass
+    class Book:
+        tags: List[Tag]
+        isbn: Optional[str]
+
+    # when
+    types = get_nested_types(Book)
+
+    # then
+    assert types == [Book, List[Tag], Tag, str, Optional[str], type(None)]
+
+
+def test_can_name_types() -> None:
+    # given
+    @dataclass
+    class User:
+        name: str
+
+    # then
+    assert type_name(User) == f"{__name__}:{User.__qualname__}"
+    assert type_name(List[User]) == f"builtins:list[{__name__}:{User.__qualname__}]"
+    assert type_name(Optional[int]) == "typing:Union[builtins:int, None]"
+    assert type_name(Literal["a", 1]) == "typing:Literal['a', 1]"
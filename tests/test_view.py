@@ -0,0 +1,148 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+from uuid import UUID
+
+import pytest
+
+from chili import Encoder, Mapper, encodable, encode, view
+from chili.error import DecoderError
+from chili.view import is_view
+
+
+class Status(Enum):
+    ACTIVE = "active"
+    BANNED = "banned"
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+@dataclass
+class User:
+    id: UUID
+    status: Status
+    created_at: datetime
+    tags: List[Tag] = field(default_factory=list)
+    nickname: Optional[str] = None
+
+    def label(self) -> str:
+        return f"{self.status.value}:{self.id}"
+
+
+data = {
+    "id": "2d2d8d4c-3b16-4d2e-9f8d-0f3b8d5a1c7e",
+    "status": "active",
+    "created_at": "2024-01-01T10:00:00",
+    "tags": [{"name": "admin"}],
+}
+
+
+def test_exposes_converted_properties() -> None:
+    # when
+    user = view(data, User)
+
+    # then
+    assert isinstance(user, User)
+    assert is_view(user)
+    assert user.id == UUID(data["id"])
+    assert user.status is Status.ACTIVE
+    assert user.created_at == datetime(2024, 1, 1, 10)
+    assert user.nickname is None
+    assert user.label() == f"active:{data['id']}"
+
+
+def test_memoizes_converted_values() -> None:
+    # when
+    user = view(data, User)
+
+    # then
+    assert user.created_at is user.created_at
+    assert user.tags is user.tags
+
+
+def test_exposes_nested_objects_as_views() -> None:
+    # when
+    tags = view(data, User).tags
+
+    # then
+    assert type(tags) is list
+    assert len(tags) == 1
+    assert is_view(tags[0])
+    assert tags[0].name == "admin"
+
+
+def test_is_read_only() -> None:
+    # given
+    user = view(data, User)
+
+    # then
+    with pytest.raises(AttributeError):
+        user.nickname = "bob"  # type: ignore
+
+    with pytest.raises(AttributeError):
+        user.other = 1  # type: ignore
+
+
+def test_encodes_properties_of_original_dict() -> None:
+    # given
+    user = view({**data, "password": "secret"}, User)
+
+    # when
+    result = encode(user)
+
+    # then
+    assert result == data
+    assert result is not data
+
+
+def test_encodes_view_as_instance_of_type() -> None:
+    # given
+    user = view(data, User)
+
+    # when
+    result = encode(user, User)
+
+    # then
+    assert result == {**data, "nickname": None}
+    assert Encoder[User]().encode(user) == result
+
+
+def test_applies_mapper_when_encoding_view() -> None:
+    # given
+    encoder = Encoder[User](mapper=Mapper({"user_id": "id", "state": "status"}))
+
+    # when
+    result = encoder.encode(view(data, User))
+
+    # then
+    assert result == {"user_id": data["id"], "state": "active"}
+
+
+def test_applies_class_mapper_when_encoding_view() -> None:
+    # given
+    @encodable(mapper=Mapper({"label": "name"}))
+    @dataclass
+    class Label:
+        name: str
+
+    # when
+    result = encode(view({"name": "admin"}, Label))
+
+    # then
+    assert result == {"label": "admin"}
+
+
+def test_fails_for_missing_required_property() -> None:
+    # given
+    user = view({}, User)
+
+    # then
+    with pytest.raises(DecoderError.missing_property):
+        user.id
+
+    with pytest.raises(DecoderError.invalid_input):
+        view([], User)  # type: ignore
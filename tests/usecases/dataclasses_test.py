@@ -175,3 +175,45 @@ def test_fail_decode_non_parametrized_generic_class() -> None:
     # when
     with pytest.raises(DecoderError):
         decode(tagged_book_data, TaggedBook)
+
+
+def test_can_decode_frozen_dataclass() -> None:
+    # given
+    @dataclass(frozen=True)
+    class Author:
+        first_name: str
+        last_name: str
+
+    @dataclass
+    class Book:
+        name: str
+        author: Author
+
+    book_data = {"name": "The Hobbit", "author": {"first_name": "J.R.R.", "last_name": "Tolkien"}}
+
+    # when
+    result = decode(book_data, Book)
+    author = Decoder[Author]().decode(book_data["author"])
+
+    # then
+    assert result.author == Author("J.R.R.", "Tolkien")
+    assert author == Author("J.R.R.", "Tolkien")
+
+
+def test_can_decode_into_existing_dataclass_instance() -> None:
+    # given
+    @dataclass
+    class Book:
+        name: str
+        author: str
+        tags: List[str] = field(default_factory=list)
+
+    decoder = ClassDecoder(Book)
+    book = Book("The Hobbit", "J.R.R. Tolkien", ["fantasy"])
+
+    # when
+    result = decoder.decode_into(book, {"name": "The Silmarillion"})
+
+    # then
+    assert result is book
+    assert book == Book("The Silmarillion", "J.R.R. Tolkien", ["fantasy"])
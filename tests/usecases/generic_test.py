@@ -1,8 +1,9 @@
+from dataclasses import dataclass
 from typing import Generic, List, TypeVar
 
 import pytest
 
-from chili import encodable, encode
+from chili import decode, encodable, encode
 from chili.error import EncoderError
 
 
@@ -114,3 +115,27 @@ def test_fail_encode_generic_with_non_encondable_type() -> None:
     # when
     with pytest.raises(EncoderError):
         encode(array_of_books, Array[Book])
+
+
+def test_can_encode_and_decode_generic_type_with_bare_type_variable() -> None:
+    # given
+    T = TypeVar("T")
+
+    @dataclass
+    class Tag:
+        name: str
+
+    @dataclass
+    class Envelope(Generic[T]):
+        body: T
+        history: List[T]
+
+    envelope = Envelope[Tag](Tag("new"), [Tag("old")])
+
+    # when
+    encoded = encode(envelope, Envelope[Tag])
+    decoded = decode(encoded, Envelope[Tag])
+
+    # then
+    assert encoded == {"body": {"name": "new"}, "history": [{"name": "old"}]}
+    assert decoded == envelope
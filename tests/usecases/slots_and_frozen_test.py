@@ -0,0 +1,90 @@
+import sys
+from dataclasses import dataclass
+
+import pytest
+
+from chili import Decoder, decode
+
+
+def test_can_decode_class_with_slots() -> None:
+    # given
+    class Pet:
+        __slots__ = ("name", "age")
+        name: str
+        age: int
+
+    # when
+    result = Decoder[Pet]().decode({"name": "Bobik", "age": "3"})
+
+    # then
+    assert result.name == "Bobik"
+    assert result.age == 3
+
+
+def test_can_decode_read_only_property_with_private_slot() -> None:
+    # given
+    class Pet:
+        __slots__ = ("_name",)
+        name: str
+
+        @property
+        def name(self) -> str:
+            return self._name
+
+    # when
+    result = Decoder[Pet]().decode({"name": "Bobik"})
+
+    # then
+    assert result.name == "Bobik"
+
+
+def test_can_decode_property_with_setter() -> None:
+    # given
+    class Pet:
+        name: str
+
+        @property
+        def name(self) -> str:
+            return self._value
+
+        @name.setter
+        def name(self, value: str) -> None:
+            self._value = value.upper()
+
+    # when
+    result = Decoder[Pet]().decode({"name": "Bobik"})
+
+    # then
+    assert result.name == "BOBIK"
+
+
+def test_respects_custom_setattr() -> None:
+    # given
+    class Pet:
+        name: str
+
+        def __setattr__(self, key: str, value: str) -> None:
+            super().__setattr__(key, value.lower())
+
+    # when
+    result = Decoder[Pet]().decode({"name": "Bobik"})
+
+    # then
+    assert result.name == "bobik"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots are supported since python 3.10")
+def test_can_decode_frozen_dataclass_with_slots() -> None:
+    # given
+    @dataclass(frozen=True, slots=True)
+    class Pet:
+        name: str
+        age: int = 1
+
+    # when
+    result = decode({"name": "Bobik"}, Pet)
+    via_decoder = Decoder[Pet]().decode({"name": "Bobik", "age": 2})
+
+    # then
+    assert result == Pet("Bobik", 1)
+    assert via_decoder == Pet("Bobik", 2)